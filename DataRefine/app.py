@@ -6,16 +6,21 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
 sys.path.append(project_root)
 
-import pandas as pd
 from flask import redirect, render_template, abort, request, jsonify
+from werkzeug.exceptions import RequestEntityTooLarge
 from dtale.app import build_app, initialize_process_props
-from dtale.views import startup
+import dtale.global_state as global_state
+from dtale.views import startup, startup_paged
 from dtale.utils import build_url
 from tests import dtale
 from DataRefine.config import CURRENT_STORAGE_CONFIG, DATASOURCE_CONFIG
 from DataRefine.storage import StorageFactory
+from DataRefine.storage.sidecar import read_file, write_sidecar
+from DataRefine.storage.stream import FileTooLargeError, read_upload
+import threading
 import uuid
-from DataRefine.datasource import DataSourceManager
+from DataRefine.datasource import DataSourceManager, RowCountService, TablePageSource
+from DataRefine.datasource.partition import ExtractProgress
 from DataRefine.logger import setup_logger
 
 # 获取当前文件所在目录
@@ -45,15 +50,119 @@ SAMPLE_DATASETS = {
 # dtale默认设置
 DTALE_SETTINGS = {
     'precision': 4,  # 数值精度
-    'enable_custom_filters': True
+    'enable_custom_filters': True,
+    'lazy_profiling': True  # 列统计信息在后台计算，startup 立即返回
 }
 
+# 数据源表对应的分页dtale实例 (datasource_name, table_name) -> data_id
+DATASOURCE_INSTANCES = {}
+# 每张表一个锁，保证并发打开同一张表时只创建一个实例（不同的表可以同时创建）
+DATASOURCE_INSTANCE_LOCKS = {}
+DATASOURCE_INSTANCES_LOCK = threading.Lock()
+
+# 数据源表行数服务，缓存行数并优先返回估算值，避免每次打开页面都执行全表 COUNT(*)
+row_counts = RowCountService(
+    ttl=DATASOURCE_CONFIG['row_count_ttl'],
+    estimate=DATASOURCE_CONFIG['row_count_estimate']
+)
+
+
+def get_paged_instance(datasource_name, table_name, datasource, cache=None):
+    """获取（或创建）数据源表对应的分页dtale实例，同一张表只会创建一个实例，cache 为查询结果缓存"""
+    key = (datasource_name, table_name)
+    with DATASOURCE_INSTANCES_LOCK:
+        lock = DATASOURCE_INSTANCE_LOCKS.setdefault(key, threading.Lock())
+    with lock:
+        data_id = DATASOURCE_INSTANCES.get(key)
+        if data_id is not None and global_state.contains(data_id):
+            return data_id
+
+        instance = startup_paged(
+            "",
+            TablePageSource(datasource, table_name, row_counts=row_counts, cache=cache),
+            block_size=DATASOURCE_CONFIG['block_size'],
+            max_blocks=DATASOURCE_CONFIG['max_blocks'],
+            sample_size=DATASOURCE_CONFIG['sample_size'],
+            ignore_duplicate=True,
+            **DTALE_SETTINGS
+        )
+        DATASOURCE_INSTANCES[key] = instance._data_id
+    # 精确行数可能在实例注册之前就已经计算完成
+    global_state.get_data_inst(instance._data_id).refresh_rows()
+    return instance._data_id
+
+
+def refresh_paged_rows(datasource_name, table_name, total_rows):
+    """后台计算出表的精确行数后，用其替换分页dtale实例中的估算行数"""
+    data_id = DATASOURCE_INSTANCES.get((datasource_name, table_name))
+    if data_id is not None and global_state.contains(data_id):
+        global_state.get_data_inst(data_id).refresh_rows()
+
+
+row_counts.add_listener(refresh_paged_rows)
+
+
+# 整表抽取任务 (datasource_name, table_name) -> 进度及结果
+TABLE_LOADS = {}
+TABLE_LOADS_LOCK = threading.Lock()
+
+
+def start_table_load(datasource_name, table_name, datasource):
+    """在后台线程中分区并发抽取整张表，完成后载入dtale，同一张表同时只会有一个抽取任务"""
+    key = (datasource_name, table_name)
+    with TABLE_LOADS_LOCK:
+        load = TABLE_LOADS.get(key)
+        if load is not None and load['status'] == 'running':
+            return load
+
+        # 重新抽取时刷新上次抽取的实例，不再另外占用一份内存
+        data_id = load['data_id'] if load is not None and global_state.contains(load['data_id']) else None
+        progress = ExtractProgress()
+        load = TABLE_LOADS[key] = {'status': 'running', 'progress': progress, 'data_id': data_id, 'error': None}
+
+    def _load():
+        try:
+            df = datasource.load_table(table_name, progress=progress)
+            # 不同数据源中可能有同名的表，实例名称带上数据源名称
+            instance = startup(
+                "", data=df, name=f"{datasource_name}.{table_name}", data_id=data_id, ignore_duplicate=True,
+                reuse_duplicate=True, **DTALE_SETTINGS
+            )
+            load.update(status='done', data_id=instance._data_id)
+        except Exception as e:
+            logger.error(f"Error loading table {datasource_name}.{table_name}: {str(e)}", exc_info=True)
+            load.update(status='error', error=str(e))
+
+    threading.Thread(target=_load, daemon=True).start()
+    return load
+
+
+def table_load_state(load):
+    """整表抽取任务的状态"""
+    return {
+        'status': load['status'],
+        'error': load['error'],
+        'dtale_url': f"/dtale/main/{load['data_id']}" if load['data_id'] is not None else None,
+        **load['progress'].to_dict()
+    }
+
+
+def invalidate_paged_instances(datasource_name=None, table_name=None):
+    """数据源表数据变化后清除行数缓存及分页dtale实例中缓存的数据块，并重新获取实例的总行数"""
+    row_counts.invalidate(datasource_name, table_name)
+    for (ds_name, tbl_name), data_id in list(DATASOURCE_INSTANCES.items()):
+        if datasource_name in (None, ds_name) and table_name in (None, tbl_name) and global_state.contains(data_id):
+            global_state.get_data_inst(data_id).clear_cache()
+
+
 # 创建存储服务实例
 storage = StorageFactory.create_storage(**CURRENT_STORAGE_CONFIG)
 
 # 添加允许的文件类型和大小限制
 ALLOWED_EXTENSIONS = {'csv', 'xlsx'}
-MAX_FILE_SIZE = 20 * 1024 * 1024  # 20MB in bytes
+MAX_FILE_SIZE = 200 * 1024 * 1024  # 200MB in bytes
+# 请求体除文件外还包含 multipart 的分隔符及表单字段，请求体大小限制在文件大小限制之上留出的余量
+MAX_FORM_OVERHEAD = 1024 * 1024
 
 
 def allowed_file(filename):
@@ -61,6 +170,14 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def file_too_large():
+    """上传文件超过大小限制时的响应"""
+    return jsonify({
+        'success': False,
+        'message': f'文件大小不能超过{MAX_FILE_SIZE // (1024 * 1024)}MB'
+    })
+
+
 if __name__ == '__main__':
     try:
         HOST = "0.0.0.0"
@@ -71,6 +188,9 @@ if __name__ == '__main__':
         app = build_app(app_url,
                         additional_templates=os.path.join(BASE_DIR, 'templates'),
                         reaper_on=True)
+        # Werkzeug 在进入视图函数前就会把整个上传文件读取（缓存到临时文件），
+        # 只有设置 MAX_CONTENT_LENGTH 才能在读取之前按 Content-Length 拒绝过大的请求
+        app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE + MAX_FORM_OVERHEAD
 
         # 设置日志
         print("Setting up logger...")  # 添加调试信息
@@ -93,14 +213,15 @@ if __name__ == '__main__':
                 if not os.path.exists(file_path):
                     abort(404, f"数据文件不存在: {dataset['file']}")
 
-                # 读取数据
-                df = pd.read_csv(file_path)
+                # 读取数据（优先读取列式旁路文件，首次读取时解析CSV并生成旁路文件）
+                df = read_file(file_path)
 
                 # 启动dtale实例，应用默认设置
                 instance = startup(
                     "",
                     data=df,
                     ignore_duplicate=True,
+                    reuse_duplicate=True,
                     **DTALE_SETTINGS
                 )
 
@@ -117,7 +238,13 @@ if __name__ == '__main__':
 
         @app.route("/")
         def hello_world():
-            return render_template('index.html')
+            return render_template('index.html', max_file_mb=MAX_FILE_SIZE // (1024 * 1024))
+
+
+        @app.errorhandler(RequestEntityTooLarge)
+        def request_too_large(e):
+            """请求体超过 MAX_CONTENT_LENGTH"""
+            return file_too_large(), 413
 
 
         @app.route("/upload", methods=['POST'])
@@ -142,36 +269,27 @@ if __name__ == '__main__':
                     'message': '只支持上传 CSV 和 Excel (xlsx) 文件'
                 }), 400
 
-            # 检查文件大小
-            file.seek(0, 2)  # 移动到文件末尾
-            size = file.tell()  # 获取文件大小
-            file.seek(0)  # 重置文件指针到开始
-
-            if size > MAX_FILE_SIZE:
-                return jsonify({
-                    'success': False,
-                    'message': '文件大小不能超过20MB'
-                }), 400
-
             try:
                 # 生成唯一的文件名
                 original_filename = file.filename
                 filename = f"{uuid.uuid4().hex}_{original_filename}"
 
-                # 使用storage服务保存文件
-                file_path = storage.upload(file, filename)
+                # 分块读取 Werkzeug 缓存的上传文件，同时写入storage服务并解析
+                # （请求体大小已由 MAX_CONTENT_LENGTH 限制，这里再按文件本身的大小检查）
+                with storage.open_upload(filename) as sink:
+                    df, digest = read_upload(file.stream, sink, filename, max_size=MAX_FILE_SIZE)
 
-                # 根据文件类型读取数据
-                if filename.endswith('.csv'):
-                    df = pd.read_csv(file_path)
-                else:  # xlsx
-                    df = pd.read_excel(file_path)
+                # 在后台为上传的文件生成列式旁路文件，之后重新打开该文件时不需要再解析CSV/Excel
+                local_path = storage.local_path(filename)
+                if local_path is not None:
+                    threading.Thread(target=write_sidecar, args=(local_path, df, digest), daemon=True).start()
 
                 # 启动dtale实例
                 instance = startup(
                     "",
                     data=df,
                     ignore_duplicate=True,
+                    reuse_duplicate=True,
                     **DTALE_SETTINGS
                 )
 
@@ -186,6 +304,8 @@ if __name__ == '__main__':
                     }
                 })
 
+            except FileTooLargeError:
+                return file_too_large(), 413
             except Exception as e:
                 return jsonify({
                     'success': False,
@@ -193,6 +313,38 @@ if __name__ == '__main__':
                 }), 500
 
 
+        @app.route("/upload/<stored_filename>")
+        def reopen_upload(stored_filename):
+            """重新打开已上传的文件，columns 参数可以只读取部分列"""
+            local_path = storage.local_path(stored_filename)
+            if local_path is None:
+                return jsonify({
+                    'success': False,
+                    'message': '文件不存在'
+                }), 404
+            try:
+                df = read_file(local_path, columns=request.args.getlist('columns') or None)
+                instance = startup(
+                    "",
+                    data=df,
+                    ignore_duplicate=True,
+                    reuse_duplicate=True,
+                    **DTALE_SETTINGS
+                )
+                return jsonify({
+                    'success': True,
+                    'data': {
+                        'stored_filename': stored_filename,
+                        'view_url': f'/view/upload/{instance._data_id}'
+                    }
+                })
+            except Exception as e:
+                return jsonify({
+                    'success': False,
+                    'message': f'文件打开失败: {str(e)}'
+                }), 500
+
+
         # 添加新的视图路由
         @app.route("/view/upload/<data_id>")
         def view_upload(data_id):
@@ -207,19 +359,14 @@ if __name__ == '__main__':
         # 初始化数据源管理器
         config_path = os.path.join(BASE_DIR, 'datasources.yaml')
         datasource_manager = DataSourceManager(config_path)
+        datasource_manager.add_invalidation_hook(invalidate_paged_instances)
 
 
         @app.route("/datasource/<datasource_name>/<table_name>")
         def view_datasource(datasource_name: str, table_name: str):
             """查看数据源表数据"""
             logger.info(f"Accessing datasource: {datasource_name}, table: {table_name}")
-            
-            page = request.args.get('page', 1, type=int)
-            page_size = request.args.get('page_size', DATASOURCE_CONFIG['page_size'], type=int)
-            
-            # 限制page_size不超过最大值
-            page_size = min(page_size, DATASOURCE_CONFIG['max_page_size'])
-            
+
             try:
                 datasource = datasource_manager.get_datasource(datasource_name)
                 if not datasource:
@@ -227,35 +374,26 @@ if __name__ == '__main__':
                     return jsonify({'error': 'Datasource not found'}), 404
 
                 try:
-                    # 获取表信息
-                    logger.info(f"Getting table info for {table_name}")
-                    table_info = datasource.get_table_info(table_name)
-                    logger.info(f"Table info retrieved: {table_info}")
-
-                    # 计算偏移量并获取数据
-                    offset = (page - 1) * page_size
-                    logger.info(f"Fetching data with limit={page_size}, offset={offset}")
-                    data = datasource.get_table_data(table_name, limit=page_size, offset=offset)
-                    logger.info(f"Data fetched successfully, shape: {data.shape if data is not None else 'None'}")
-
-                    # 启动dtale实例
-                    instance = startup(
-                        "",
-                        data=data,
-                        ignore_duplicate=True,
-                        **DTALE_SETTINGS
+                    # 获取表行数（可能是估算值，精确行数在后台计算）
+                    logger.info(f"Getting row count for {table_name}")
+                    row_count = row_counts.get(datasource, table_name)
+                    logger.info(f"Row count retrieved: {row_count}")
+
+                    # 整张表只对应一个分页dtale实例，按表格滚动的行范围分块拉取数据
+                    data_id = get_paged_instance(
+                        datasource_name, table_name, datasource, cache=datasource_manager.result_cache
                     )
-                    logger.info(f"Dtale instance created with id: {instance._data_id}")
+                    logger.info(f"Paged dtale instance for {table_name}: {data_id}")
 
                     return render_template(
                         'datasource_view.html',
                         title=f'{table_name}',
-                        dtale_url=f'/dtale/main/{instance._data_id}',
-                        total_rows=table_info['total_rows'],
+                        dtale_url=f'/dtale/main/{data_id}',
+                        total_rows=row_count['total_rows'],
+                        total_rows_exact=row_count['exact'],
+                        paged=True,
                         datasource_name=datasource_name,
                         table_name=table_name,
-                        current_page=page,
-                        page_size=page_size,
                         page_size_options=DATASOURCE_CONFIG['page_size_options']
                     )
 
@@ -271,34 +409,40 @@ if __name__ == '__main__':
         @app.route("/datasource/<datasource_name>/<table_name>/data")
         def get_datasource_data(datasource_name: str, table_name: str):
             """获取数据源表的分页数据"""
-            page = request.args.get('page', 1, type=int)
-            page_size = request.args.get('page_size', DATASOURCE_CONFIG['page_size'], type=int)
-            page_size = min(page_size, DATASOURCE_CONFIG['max_page_size'])
-
             datasource = datasource_manager.get_datasource(datasource_name)
             if not datasource:
                 return jsonify({'error': 'Datasource not found'}), 404
 
             try:
-                offset = (page - 1) * page_size
-                data = datasource.get_table_data(table_name, limit=page_size, offset=offset)
-
-                # 启动新的dtale实例
-                instance = startup(
-                    "",
-                    data=data,
-                    ignore_duplicate=True,
-                    **DTALE_SETTINGS
+                # 复用该表的分页实例，不再为每一页创建新的dtale实例
+                data_id = get_paged_instance(
+                    datasource_name, table_name, datasource, cache=datasource_manager.result_cache
                 )
 
                 return jsonify({
                     'success': True,
-                    'dtale_url': f'/dtale/main/{instance._data_id}'
+                    'dtale_url': f'/dtale/main/{data_id}'
                 })
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
 
 
+        @app.route("/datasource/<datasource_name>/<table_name>/load", methods=['GET', 'POST'])
+        def load_datasource_table(datasource_name: str, table_name: str):
+            """POST 开始分区并发抽取整张表，GET 查询抽取进度，完成后返回整表dtale实例的地址"""
+            datasource = datasource_manager.get_datasource(datasource_name)
+            if not datasource:
+                return jsonify({'error': 'Datasource not found'}), 404
+
+            if request.method == 'POST':
+                load = start_table_load(datasource_name, table_name, datasource)
+            else:
+                load = TABLE_LOADS.get((datasource_name, table_name))
+                if load is None:
+                    return jsonify({'error': 'Table load not started'}), 404
+            return jsonify({'success': True, **table_load_state(load)})
+
+
         @app.route("/api/datasources")
         def get_datasources():
             """获取所有数据源的基本信息"""
@@ -353,6 +497,47 @@ if __name__ == '__main__':
                 }), 400
 
 
+        @app.route("/api/datasources/cache")
+        def get_cache_stats():
+            """获取数据源查询结果缓存的命中/未命中统计"""
+            return jsonify({
+                'success': True,
+                'stats': datasource_manager.get_cache_stats()
+            })
+
+
+        @app.route("/api/datasources/<datasource_name>/cache/invalidate", methods=['POST'])
+        def invalidate_datasource_cache(datasource_name: str):
+            """数据源（表）数据变化后清除缓存，table 参数为空时清除整个数据源"""
+            if not datasource_manager.get_datasource(datasource_name):
+                return jsonify({
+                    'success': False,
+                    'error': '数据源不存在'
+                }), 404
+            removed = datasource_manager.invalidate(datasource_name, request.args.get('table') or None)
+            return jsonify({
+                'success': True,
+                'removed': removed
+            })
+
+
+        @app.route("/api/datasources/pools")
+        def get_pool_status():
+            """获取各数据源连接池的状态及指标，check=true 时同时执行健康检查"""
+            try:
+                health_check = request.args.get('check', 'false').lower() == 'true'
+                return jsonify({
+                    'success': True,
+                    'pools': datasource_manager.get_pool_status(health_check=health_check)
+                })
+            except Exception as e:
+                logger.error(f"Error getting pool status: {str(e)}", exc_info=True)
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 500
+
+
         # 添加新的接口，用于获取单个表的详细信息
         @app.route("/api/datasources/<datasource_name>/tables/<table_name>/info")
         def get_table_info(datasource_name: str, table_name: str):
@@ -365,10 +550,14 @@ if __name__ == '__main__':
                         'error': '数据源不存在'
                     }), 404
 
-                table_info = datasource.get_table_info(table_name)
+                row_count = row_counts.get(datasource, table_name)
                 return jsonify({
                     'success': True,
-                    'info': table_info
+                    'info': {
+                        'name': table_name,
+                        'schema': datasource.config.get('database'),
+                        **row_count
+                    }
                 })
 
             except Exception as e:
@@ -379,6 +568,29 @@ if __name__ == '__main__':
                 }), 500
 
 
+        @app.route("/api/datasources/<datasource_name>/tables/<table_name>/count")
+        def get_table_count(datasource_name: str, table_name: str):
+            """获取缓存中的表行数，页面用于轮询后台的精确行数是否已经计算完成"""
+            datasource = datasource_manager.get_datasource(datasource_name)
+            if not datasource:
+                return jsonify({
+                    'success': False,
+                    'error': '数据源不存在'
+                }), 404
+            try:
+                row_count = row_counts.peek(datasource_name, table_name) or row_counts.get(datasource, table_name)
+                return jsonify({
+                    'success': True,
+                    **row_count
+                })
+            except Exception as e:
+                logger.error(f"Error getting row count: {str(e)}", exc_info=True)
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 500
+
+
         app.run(host=HOST, port=PORT)
     except Exception as e:
         print(f"Error starting app: {str(e)}")  # 添加错误捕获
@@ -14,7 +14,10 @@ STORAGE_CONFIG = {
         'secret_id': os.getenv('COS_SECRET_ID'),      # 从环境变量获取
         'secret_key': os.getenv('COS_SECRET_KEY'),    # 从环境变量获取
         'region': os.getenv('COS_REGION', 'ap-guangzhou'),
-        'bucket': os.getenv('COS_BUCKET')
+        'bucket': os.getenv('COS_BUCKET'),
+        'max_workers': 4,  # 分块上传/分段下载的并发数
+        'cache_dir': os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cos_cache'),  # 本地读穿透缓存目录
+        'cache_max_bytes': 2 * 1024 * 1024 * 1024  # 本地缓存大小上限
     }
 }
 
@@ -22,7 +25,12 @@ STORAGE_CONFIG = {
 DATASOURCE_CONFIG = {
     'page_size': 100,  # 默认每页记录数
     'max_page_size': 10000,  # 最大每页记录数限制
-    'page_size_options': [100, 500, 1000, 5000]  # 页面上可选的每页记录数
+    'page_size_options': [100, 500, 1000, 5000],  # 页面上可选的每页记录数
+    'block_size': 1000,  # 分页实例每次从数据源拉取的行数
+    'max_blocks': 100,  # 分页实例最多缓存的数据块数
+    'sample_size': 10000,  # 分页实例用于列统计、图表等功能的样本行数
+    'row_count_ttl': 300,  # 表行数缓存的有效期（秒）
+    'row_count_estimate': True  # 先显示数据库统计信息中的估算行数，精确行数在后台计算
 }
 
 # 当前环境，可以通过环境变量设置
@@ -2,6 +2,10 @@ from .base import DataSource
 from .mysql import MySQLDataSource
 from .hive import HiveDataSource
 from .manager import DataSourceManager
+from .paging import TablePageSource
+from .pool import ConnectionPool
+from .result_cache import ResultCache
+from .row_count import RowCountService
 from .utils import resolve_env_vars
 
 __all__ = [
@@ -9,5 +13,9 @@ __all__ = [
     'MySQLDataSource',
     'HiveDataSource',
     'DataSourceManager',
+    'TablePageSource',
+    'ConnectionPool',
+    'ResultCache',
+    'RowCountService',
     'resolve_env_vars'
 ] 
\ No newline at end of file
@@ -1,10 +1,20 @@
 from abc import ABC, abstractmethod
+import logging
+import math
 import pandas as pd
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple, Union
 from sqlalchemy.engine import Engine
+from .partition import PARTITION_TARGET_ROWS, ExtractProgress, load_partitions, split_range
+
+logger = logging.getLogger(__name__)
+
 
 class DataSource(ABC):
     """数据源基类"""
+
+    # 下推过滤/排序时使用的SQL方言及驱动的参数风格
+    sql_dialect = 'mysql'
+    paramstyle = 'named'
     
     def __init__(self, name: str, config: Dict):
         self.name = name
@@ -47,14 +57,116 @@ class DataSource(ABC):
         """执行SQL查询"""
         return pd.read_sql_query(query, self.engine)
 
+    def build_sql_clauses(self, filters: Dict = None, sort: List = None,
+                          key_column: str = None) -> Tuple[str, str, Union[Dict, List]]:
+        """
+        将dtale保存的列过滤条件(columnFilters)及排序信息(sortInfo)编译为参数化的 WHERE / ORDER BY 子句
+        Args:
+            key_column: 唯一键列，追加为最后一个排序键，使排序值相同的行在各页之间的顺序固定
+        Returns:
+            (where子句, order by子句, 参数)，没有对应条件时子句为空字符串
+        """
+        from dtale.column_filters import SQLBuilder
+        from dtale.query import build_sql_order_by, build_sql_where
+
+        if key_column and key_column not in [col for col, _ in sort or []]:
+            sort = list(sort or []) + [[key_column, 'ASC']]
+        builder = SQLBuilder(dialect=self.sql_dialect, paramstyle=self.paramstyle)
+        where = build_sql_where(filters or {}, builder)
+        order_by = build_sql_order_by(sort, builder)
+        return (
+            f" WHERE {where}" if where else "",
+            f" ORDER BY {order_by}" if order_by else "",
+            builder.bind()
+        )
+
+    def get_key_column(self, table_name: str) -> Optional[str]:
+        """表中有序且唯一的列（datasources.yaml 中 key_columns 配置），分页读取时作为最后一个排序键"""
+        return (self.config.get('key_columns') or {}).get(table_name)
+
     def get_table_info(self, table_name: str) -> Dict:
         """获取表的基本信息"""
         raise NotImplementedError
 
+    def count_rows(self, table_name: str, filters: Dict = None) -> int:
+        """获取表在过滤条件下的记录数"""
+        raise NotImplementedError
+
+    def pool_status(self) -> Dict:
+        """连接池状态及指标（借出连接数、等待次数、超时次数等）"""
+        return {}
+
+    def health_check(self) -> bool:
+        """检查数据源是否可用"""
+        raise NotImplementedError
+
+    def estimate_rows(self, table_name: str) -> Optional[int]:
+        """从数据库的统计信息中获取表的估算行数，不支持或没有统计信息时返回 None"""
+        return None
+
     def get_table_data(self, table_name: str, limit: int = 10000, offset: int = 0) -> pd.DataFrame:
         """获取表数据"""
         raise NotImplementedError
 
+    def fetch_frame(self, query: str, params: Union[Dict, List] = None) -> pd.DataFrame:
+        """执行（参数化的）查询并以 DataFrame 返回结果"""
+        raise NotImplementedError
+
+    def get_partition_column(self, table_name: str) -> Optional[str]:
+        """分区抽取整张表时用于拆分的列（datasources.yaml 中 partition_columns 配置的主键或日期列）"""
+        return (self.config.get('partition_columns') or {}).get(table_name)
+
+    def load_table(self, table_name: str, column: str = None, partitions: int = None, workers: int = None,
+                   progress: ExtractProgress = None, callback: Callable[[Dict], None] = None) -> pd.DataFrame:
+        """
+        分区并发抽取整张表：按 column（主键或日期列）的取值范围将表拆分为多个分区，
+        通过连接池中的多个连接并发查询，再按分区顺序合并，结果可以直接传给 dtale 的 startup
+        Args:
+            table_name: 表名
+            column: 拆分使用的列，默认使用 get_partition_column，没有可用的列时退回到单条 SELECT *
+            partitions: 分区数，默认按估算行数每 PARTITION_TARGET_ROWS 行一个分区（至少为并发数）
+            workers: 并发数，默认为连接池的 pool_size
+            progress: 抽取进度
+            callback: 每完成一个分区时以进度信息调用
+        """
+        from dtale.column_filters import SQLBuilder
+
+        column = column or self.get_partition_column(table_name)
+        workers = workers or (self.config.get('pool') or {}).get('pool_size', 4)
+        ranges = []
+        if column:
+            col = SQLBuilder(self.sql_dialect, self.paramstyle).col(column)
+            bounds = self.fetch_frame(f"SELECT MIN({col}) AS lo, MAX({col}) AS hi FROM {table_name}")
+            lo, hi = bounds.iloc[0, 0], bounds.iloc[0, 1]
+            if not pd.isnull(lo) and not pd.isnull(hi):
+                if partitions is None:
+                    try:
+                        estimate = self.estimate_rows(table_name) or 0
+                    except Exception:
+                        estimate = 0
+                    partitions = max(workers, math.ceil(estimate / PARTITION_TARGET_ROWS))
+                ranges = split_range(lo, hi, partitions)
+
+        if not ranges:
+            logger.info(f"No partition column for {table_name}, loading it with a single query")
+            df = self.fetch_frame(f"SELECT * FROM {table_name}")
+            if progress is not None:
+                progress.total = 1
+                progress.update(len(df))
+            return df
+
+        def _fetch(i):
+            builder = SQLBuilder(self.sql_dialect, self.paramstyle)
+            start, end = ranges[i]
+            where = f"{col} >= {builder.param(start)} AND {col} {'<=' if i == len(ranges) - 1 else '<'} " \
+                    f"{builder.param(end)}"
+            if i == 0:
+                where = f"({where}) OR {col} IS NULL"
+            return self.fetch_frame(f"SELECT * FROM {table_name} WHERE {where}", builder.bind())
+
+        logger.info(f"Loading {table_name} in {len(ranges)} partitions of {column} using {workers} workers")
+        return load_partitions(_fetch, len(ranges), workers, progress=progress, callback=callback)
+
     def preview_table(self, table_name: str, rows: int = 1000) -> pd.DataFrame:
         """预览表数据"""
         raise NotImplementedError 
\ No newline at end of file
@@ -0,0 +1,87 @@
+import logging
+from typing import Any, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+# 每次从游标获取的行数
+FETCH_BATCH_SIZE = 10000
+
+
+def _arrow_type(type_code: Any, dbapi: Any) -> Optional['pa.DataType']:
+    """
+    根据游标 description 中的类型（与驱动模块的 PEP 249 类型对象比较）确定列的 arrow 类型，
+    其它类型返回 None 由 arrow 根据值推断（整数/浮点/小数、日期/时间戳、字符串/字节）。
+    BINARY 不映射为 pa.binary()：MySQL 的 TEXT 与 BLOB 使用同一类型码，驱动返回的是 str，
+    强制转换为 binary 会把文本变成 bytes，由 arrow 推断时只有值本身是 bytes 的列才是 binary
+    """
+    if dbapi is None or type_code is None:
+        return None
+    if type_code == getattr(dbapi, 'STRING', None):
+        return pa.string()
+    return None
+
+
+def _column_chunk(values: Sequence, arrow_type: Any) -> Any:
+    """将一批行中某一列的值转换为 arrow 数组，值与声明的类型不一致时改为推断类型，仍然失败则保留为 object 数组"""
+    if pa is None:
+        return np.asarray(values, dtype=object)
+    for typ in ([arrow_type] if arrow_type is not None else []) + [None]:
+        try:
+            arr = pa.array(values, type=typ)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, OverflowError):
+            continue
+        if pa.types.is_decimal(arr.type):  # DECIMAL 列转换为浮点数，而不是 Decimal 对象
+            arr = arr.cast(pa.float64(), safe=False)
+        return arr
+    return np.asarray(values, dtype=object)
+
+
+def _assemble_column(chunks: List) -> pd.Series:
+    """合并一列的所有批次"""
+    if pa is not None and all(isinstance(c, pa.Array) for c in chunks):
+        types = {c.type for c in chunks if not pa.types.is_null(c.type)}
+        if len(types) <= 1:
+            typ = types.pop() if types else pa.null()
+            chunks = [pa.nulls(len(c), typ) if c.type != typ else c for c in chunks]
+            return pa.chunked_array(chunks, type=typ).to_pandas(split_blocks=True)
+        logger.debug(f"Column batches have different types {types}, falling back to pandas inference")
+    values = np.concatenate([
+        c.to_numpy(zero_copy_only=False) if pa is not None and isinstance(c, pa.Array) else c for c in chunks
+    ]).astype(object)
+    return pd.Series(values).infer_objects()
+
+
+def fetch_dataframe(result: Any, description: Sequence, dbapi: Any = None,
+                    batch_size: int = FETCH_BATCH_SIZE) -> pd.DataFrame:
+    """
+    以列式方式从游标获取查询结果：每次 fetchmany 一批行，立即按列转换为 arrow 数组（无 pyarrow 时为 numpy 数组），
+    不会把整个结果集保留为 python 元组列表，最终得到类型正确的 DataFrame
+    Args:
+        result: 支持 fetchmany 的结果对象（DB-API 游标或 SQLAlchemy 结果）
+        description: 游标的 description，用于列名及列类型
+        dbapi: 驱动模块，用于比较 description 中的 PEP 249 类型对象（STRING、BINARY...）
+        batch_size: 每批获取的行数
+    """
+    columns = [d[0] for d in description]
+    types = [_arrow_type(d[1], dbapi) for d in description] if pa is not None else [None] * len(columns)
+    chunks = [[] for _ in columns]
+    while True:
+        rows = result.fetchmany(batch_size)
+        if not rows:
+            break
+        for i, values in enumerate(zip(*rows)):
+            chunks[i].append(_column_chunk(values, types[i]))
+        del rows
+
+    if not chunks or not chunks[0]:
+        return pd.DataFrame(columns=columns)
+    df = pd.DataFrame({i: _assemble_column(c) for i, c in enumerate(chunks)})
+    df.columns = columns
+    return df
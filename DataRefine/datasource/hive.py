@@ -1,61 +1,101 @@
 import jaydebeapi
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Optional
 import logging
 from .base import DataSource
+from .fetch import fetch_dataframe
+from .pool import ConnectionPool, pool_settings
 
 logger = logging.getLogger(__name__)
 
 class HiveDataSource(DataSource):
+    # jaydebeapi 使用 ? 作为参数占位符
+    sql_dialect = 'hive'
+    paramstyle = 'qmark'
+
     def __init__(self, name: str, config: Dict):
         super().__init__(name, config)
-        self._connection = None
-        
-    def connect(self):
+        # JDBC 连接没有 SQLAlchemy 连接池，使用线程安全的连接池在请求线程间共享连接
+        self.pool = ConnectionPool(self._create_connection, **pool_settings(self.config.get('pool')))
+
+    def _create_connection(self):
         """创建 JDBC 连接"""
-        if not self._connection:
-            try:
-                # Hive JDBC URL
-                jdbc_url = f"jdbc:hive2://{self.config['host']}:{self.config['port']}/{self.config['database']}"
-                
-                # 连接 Hive
-                self._connection = jaydebeapi.connect(
-                    "org.apache.hive.jdbc.HiveDriver",
-                    jdbc_url,
-                    [self.config['username'], self.config['password']],
-                    "D:/hive_jdbc/hive-jdbc-3.1.2-standalone.jar"  # Hive JDBC 驱动路径
-                )
-                logger.info(f"Connected to Hive: {jdbc_url}")
-            except Exception as e:
-                logger.error(f"Error connecting to Hive: {str(e)}")
-                raise
+        try:
+            # Hive JDBC URL
+            jdbc_url = f"jdbc:hive2://{self.config['host']}:{self.config['port']}/{self.config['database']}"
+
+            # 连接 Hive
+            connection = jaydebeapi.connect(
+                "org.apache.hive.jdbc.HiveDriver",
+                jdbc_url,
+                [self.config['username'], self.config['password']],
+                "D:/hive_jdbc/hive-jdbc-3.1.2-standalone.jar"  # Hive JDBC 驱动路径
+            )
+            logger.info(f"Connected to Hive: {jdbc_url}")
+            return connection
+        except Exception as e:
+            logger.error(f"Error connecting to Hive: {str(e)}")
+            raise
+
+    def create_engine(self):
+        """Hive 通过 JDBC 连接池访问，没有 SQLAlchemy 引擎"""
+        raise NotImplementedError("HiveDataSource uses a JDBC connection pool instead of a SQLAlchemy engine")
+
+    def connect(self):
+        """从连接池借出一个 JDBC 连接，用法: with self.connect() as conn"""
+        return self.pool.connection()
     
-    def get_table_data(self, table_name: str, limit: int = 10000, offset: int = 0) -> pd.DataFrame:
-        """获取表数据"""
+    def get_table_data(self, table_name: str, limit: int = 10000, offset: int = 0,
+                       filters: Dict = None, sort: List = None) -> pd.DataFrame:
+        """获取表数据，filters/sort 会被编译为 WHERE/ORDER BY 子句在 Hive 中执行"""
         try:
-            self.connect()
+            where, order_by, params = self.build_sql_clauses(filters, sort, self.get_key_column(table_name))
             query = f"""
-                SELECT * FROM {table_name}
+                SELECT * FROM {table_name}{where}{order_by}
                 LIMIT {limit}
                 OFFSET {offset}
             """
             logger.info(f"Executing query: {query}")
             
-            with self._connection.cursor() as cursor:
-                cursor.execute(query)
-                columns = [desc[0] for desc in cursor.description]
-                data = cursor.fetchall()
-                return pd.DataFrame(data, columns=columns)
+            with self.connect() as conn, conn.cursor() as cursor:
+                cursor.execute(query, params)
+                # 按批次 fetchmany 并以列式方式转换，不保留整个结果集的元组列表
+                return fetch_dataframe(cursor, cursor.description, dbapi=jaydebeapi)
                 
         except Exception as e:
             logger.error(f"Error getting table data: {str(e)}")
             raise
+
+    def fetch_frame(self, query: str, params: List = None) -> pd.DataFrame:
+        """执行（参数化的）查询并以 DataFrame 返回结果"""
+        with self.connect() as conn, conn.cursor() as cursor:
+            cursor.execute(query, params or [])
+            return fetch_dataframe(cursor, cursor.description, dbapi=jaydebeapi)
+
+    def count_rows(self, table_name: str, filters: Dict = None) -> int:
+        """获取表在过滤条件下的记录数"""
+        if not filters:
+            return self.get_table_info(table_name)['total_rows']
+        where, _, params = self.build_sql_clauses(filters)
+        with self.connect() as conn, conn.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {table_name}{where}", params)
+            return cursor.fetchone()[0]
             
+    def estimate_rows(self, table_name: str) -> Optional[int]:
+        """Hive 表统计信息中的行数（numRows），表未执行过 ANALYZE 或为分区表时可能没有该属性"""
+        with self.connect() as conn, conn.cursor() as cursor:
+            cursor.execute(f"SHOW TBLPROPERTIES {table_name}('numRows')")
+            row = cursor.fetchone()
+        try:
+            rows = int(row[-1]) if row else None
+        except (TypeError, ValueError):  # 没有该属性时 Hive 返回一段说明文字
+            return None
+        return rows if rows is not None and rows >= 0 else None
+
     def get_table_info(self, table_name: str) -> Dict:
         """获取表的基本信息"""
         try:
-            self.connect()
-            with self._connection.cursor() as cursor:
+            with self.connect() as conn, conn.cursor() as cursor:
                 # 获取总行数
                 cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
                 total = cursor.fetchone()[0]
@@ -70,22 +110,28 @@ class HiveDataSource(DataSource):
             raise
             
     def disconnect(self):
-        """关闭连接"""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """关闭连接池中的空闲连接"""
+        self.pool.dispose()
+
+    def pool_status(self) -> Dict:
+        """连接池状态及指标"""
+        return self.pool.status()
+
+    def health_check(self) -> bool:
+        """借出一个连接并执行 SELECT 1"""
+        return self.pool.health_check()
 
     def get_tables(self) -> List[Dict]:
-        inspector = inspect(self.engine)
-        return [
-            {
-                'name': table_name,
-                'schema': schema
-            }
-            for schema in inspector.get_schema_names()
-            for table_name in inspector.get_table_names(schema=schema)
-        ]
+        """通过 JDBC 连接池获取所有库中的表（SHOW DATABASES / SHOW TABLES IN）"""
+        tables = []
+        with self.connect() as conn, conn.cursor() as cursor:
+            cursor.execute("SHOW DATABASES")
+            schemas = [row[0] for row in cursor.fetchall()]
+            for schema in schemas:
+                cursor.execute(f"SHOW TABLES IN `{schema}`")
+                tables.extend({'name': row[0], 'schema': schema} for row in cursor.fetchall())
+        return tables
     
     def execute_query(self, query: str) -> pd.DataFrame:
-        self.connect()
-        return pd.read_sql(query, self._connection) 
\ No newline at end of file
+        with self.connect() as conn:
+            return pd.read_sql(query, conn) 
\ No newline at end of file
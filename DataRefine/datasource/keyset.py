@@ -0,0 +1,75 @@
+import bisect
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class KeysetIndex:
+    """
+    键集分页（seek pagination）使用的稀疏检查点索引
+
+    记录 位置 -> 该位置之前最后一行的键值，只保存 interval 整数倍位置的检查点，
+    读取第 m 行时从不超过 m 的最近检查点执行 WHERE key > :last ORDER BY key，
+    数据库只需跳过不足 interval 行，而不是 OFFSET m 时的 m 行
+    """
+
+    def __init__(self, interval: int):
+        self.interval = interval
+        self._positions = [0]
+        self._keys = {0: None}  # 位置0之前没有行，不需要键条件
+        self._lock = threading.Lock()
+
+    def floor(self, position: int) -> int:
+        """不超过 position 的最大检查点位置（无论该检查点是否已记录）"""
+        return position // self.interval * self.interval
+
+    def nearest(self, position: int) -> Tuple[int, Any]:
+        """不超过 position 的最近已记录检查点，返回 (位置, 该位置之前最后一行的键值)"""
+        with self._lock:
+            idx = bisect.bisect_right(self._positions, position) - 1
+            start = self._positions[idx]
+            return start, self._keys[start]
+
+    def record(self, position: int, key: Any) -> None:
+        """记录检查点，非 interval 整数倍的位置会被忽略以保持索引稀疏"""
+        if position <= 0 or position % self.interval:
+            return
+        with self._lock:
+            if position not in self._keys:
+                bisect.insort(self._positions, position)
+            self._keys[position] = key
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
+class KeysetIndexCache:
+    """按 (表, 过滤条件) 缓存检查点索引，最多保留 max_indexes 个，超出时淘汰最久未使用的"""
+
+    def __init__(self, interval: int = 1000, max_indexes: int = 64):
+        self.interval = interval
+        self.max_indexes = max_indexes
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, table_name: str, query_key: Hashable = None) -> KeysetIndex:
+        """获取（不存在时创建）表在某组过滤条件下的检查点索引"""
+        key = (table_name, query_key)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = self._indexes[key] = KeysetIndex(self.interval)
+                while len(self._indexes) > self.max_indexes:
+                    self._indexes.popitem(last=False)
+            else:
+                self._indexes.move_to_end(key)
+            return index
+
+    def clear(self, table_name: Optional[str] = None) -> None:
+        """清除检查点（表数据发生变化后检查点位置会失效）"""
+        with self._lock:
+            if table_name is None:
+                self._indexes.clear()
+                return
+            for key in [k for k in self._indexes if k[0] == table_name]:
+                del self._indexes[key]
@@ -1,10 +1,12 @@
 import os
 import yaml
 import logging
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from .mysql import MySQLDataSource
 from .hive import HiveDataSource
 from .base import DataSource
+from .pool import pool_settings
+from .result_cache import ResultCache
 
 # 配置日志
 logging.basicConfig(level=logging.INFO)
@@ -17,6 +19,9 @@ class DataSourceManager:
         self.config_path = config_path
         self.datasources = {}
         self.datasource_configs = {}  # 存储原始配置信息
+        self.pool_config = {}  # 所有数据源共用的连接池配置（datasources.yaml 顶层的 pool）
+        self.result_cache = ResultCache()  # 数据源查询结果缓存（datasources.yaml 顶层的 cache）
+        self._invalidation_hooks = []
         self.credentials = self._load_credentials()
         self.load_config()
     
@@ -38,6 +43,13 @@ class DataSourceManager:
             logger.error(f"Failed to load config file: {str(e)}")
             return
 
+        self.pool_config = config.get('pool') or {}
+        cache_config = config.get('cache') or {}
+        self.result_cache = ResultCache(
+            max_bytes=cache_config.get('max_bytes', self.result_cache.max_bytes),
+            ttl=cache_config.get('ttl', self.result_cache.ttl),
+            directory=cache_config.get('directory')
+        )
         for source in config['datasources']:
             try:
                 # 保存原始配置
@@ -51,7 +63,12 @@ class DataSourceManager:
                         source_config.update(self.credentials[cred_key])
                     else:
                         logger.warning(f"Credentials not found for {cred_key}")
+                # 连接池配置：数据源自己的 pool 覆盖顶层的 pool
+                source_config['pool'] = pool_settings(self.pool_config, source_config.get('pool'))
                 
+                if 'cache_ttl' in source_config:
+                    self.result_cache.set_ttl(source['name'], source_config['cache_ttl'])
+
                 # 创建数据源实例
                 if source['type'] == 'mysql':
                     self.datasources[source['name']] = MySQLDataSource(source['name'], source_config)
@@ -93,6 +110,47 @@ class DataSourceManager:
         config = self.datasource_configs[datasource_name]
         return config.get('tables', [])
     
+    def get_pool_status(self, health_check: bool = False) -> Dict[str, Dict]:
+        """
+        获取所有数据源的连接池状态及指标
+        Args:
+            health_check: 是否同时借出连接执行一次健康检查
+        """
+        status = {}
+        for name, ds in self.datasources.items():
+            status[name] = ds.pool_status()
+            if health_check:
+                try:
+                    status[name]['healthy'] = ds.health_check()
+                except Exception as e:
+                    logger.error(f"Health check failed for datasource {name}: {str(e)}")
+                    status[name]['healthy'] = False
+                    status[name]['error'] = str(e)
+        return status
+
+    def add_invalidation_hook(self, hook: Callable[[Optional[str], Optional[str]], None]) -> None:
+        """注册数据源（表）数据变化时需要执行的回调，参数为 (数据源, 表)，None 表示全部"""
+        self._invalidation_hooks.append(hook)
+
+    def invalidate(self, datasource_name: str = None, table_name: str = None) -> int:
+        """
+        数据源中的表发生变化后清除相关缓存：查询结果缓存、键集分页检查点及注册的回调
+        Returns:
+            清除的查询结果缓存条数
+        """
+        removed = self.result_cache.invalidate(datasource_name, table_name)
+        for name, ds in self.datasources.items():
+            if datasource_name in (None, name) and hasattr(ds, 'keyset_checkpoints'):
+                ds.keyset_checkpoints.clear(table_name)
+        for hook in self._invalidation_hooks:
+            hook(datasource_name, table_name)
+        logger.info(f"Invalidated caches for {datasource_name or '*'}.{table_name or '*'} ({removed} results)")
+        return removed
+
+    def get_cache_stats(self) -> Dict:
+        """查询结果缓存的命中/未命中统计"""
+        return self.result_cache.stats()
+
     def close_all(self):
         """关闭所有数据源连接"""
         for ds in self.datasources.values():
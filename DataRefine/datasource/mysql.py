@@ -1,8 +1,13 @@
+import json
+from contextlib import contextmanager
 import pandas as pd
-from typing import List, Dict, Optional
-from sqlalchemy import create_engine, inspect, text
+from typing import Any, List, Dict, Optional
+from sqlalchemy import create_engine, event, exc, inspect, text
 import numpy as np
 from .base import DataSource
+from .fetch import fetch_dataframe
+from .keyset import KeysetIndexCache
+from .pool import PoolMetrics, pool_settings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,13 +15,56 @@ logger = logging.getLogger(__name__)
 class MySQLDataSource(DataSource):
     def __init__(self, name: str, config: Dict):
         super().__init__(name, config)
+        self.pool_settings = pool_settings(self.config.get('pool'))
+        self.pool_metrics = PoolMetrics()
         self.engine = self.create_engine()
+        # 键集分页：表 -> 主键或配置的有序唯一列（None 表示没有可用的键，回退到 OFFSET 分页）
+        self._key_columns = {}
+        self.keyset_checkpoints = KeysetIndexCache(self.config.get('checkpoint_interval', 1000))
 
     def create_engine(self):
-        """创建数据库引擎"""
+        """创建数据库引擎，连接池参数来自 datasources.yaml 的 pool 配置"""
         url = f"mysql+mysqlconnector://{self.config['username']}:{self.config['password']}@" \
               f"{self.config['host']}:{self.config['port']}/{self.config['database']}?charset=utf8mb4"
-        return create_engine(url)
+        engine = create_engine(url, **self.pool_settings)
+        # pre-ping 失败或执行出错后被丢弃的连接
+        event.listen(engine, 'invalidate', lambda *args: self.pool_metrics.incr(invalidated=1))
+        return engine
+
+    @contextmanager
+    def connect(self):
+        """从连接池借出连接，记录等待、超时等指标"""
+        pool = self.engine.pool
+        if pool.checkedout() >= self.pool_settings['pool_size'] + self.pool_settings['max_overflow']:
+            self.pool_metrics.incr(waits=1)
+        try:
+            conn = self.engine.connect()
+        except exc.TimeoutError:
+            self.pool_metrics.incr(timeouts=1)
+            raise
+        self.pool_metrics.incr(checkouts=1, checked_out=1)
+        try:
+            with conn:
+                yield conn
+        finally:
+            self.pool_metrics.incr(checked_out=-1)
+
+    def pool_status(self) -> Dict:
+        """连接池状态及指标"""
+        pool = self.engine.pool
+        return {
+            'pool_size': pool.size(),
+            'max_overflow': self.pool_settings['max_overflow'],
+            'connections': pool.checkedin() + pool.checkedout(),
+            'idle': pool.checkedin(),
+            **self.pool_metrics.to_dict()
+        }
+
+    def health_check(self) -> bool:
+        """执行 SELECT 1 检查数据库是否可用"""
+        with self.connect() as conn:
+            conn.execute(text("SELECT 1")).fetchall()
+        return True
 
     def get_tables(self) -> List[Dict]:
         """获取所有表信息"""
@@ -41,7 +89,7 @@ class MySQLDataSource(DataSource):
     def get_table_comment(self, table_name: str) -> str:
         """获取表注释"""
         try:
-            with self.engine.connect() as conn:
+            with self.connect() as conn:
                 result = conn.execute(text(
                     f"SELECT table_comment FROM information_schema.tables "
                     f"WHERE table_schema = '{self.config['database']}' AND table_name = '{table_name}'"
@@ -53,7 +101,7 @@ class MySQLDataSource(DataSource):
 
     def get_table_info(self, table_name: str) -> Dict:
         """获取表的基本信息"""
-        with self.engine.connect() as conn:
+        with self.connect() as conn:
             result = conn.execute(text(f"SELECT COUNT(*) as total FROM {table_name}"))
             total = result.fetchone()[0]
             
@@ -63,7 +111,28 @@ class MySQLDataSource(DataSource):
             'total_rows': total
         }
 
-    def get_table_data(self, table_name: str, schema: str = None, limit: int = 10000, offset: int = 0) -> pd.DataFrame:
+    def count_rows(self, table_name: str, filters: Dict = None) -> int:
+        """获取表在过滤条件下的记录数"""
+        if not filters:
+            return self.get_table_info(table_name)['total_rows']
+        where, _, params = self.build_sql_clauses(filters)
+        with self.connect() as conn:
+            result = conn.execute(text(f"SELECT COUNT(*) as total FROM {table_name}{where}"), params)
+            return result.fetchone()[0]
+
+    def estimate_rows(self, table_name: str) -> Optional[int]:
+        """InnoDB 的估算行数（information_schema.TABLES.TABLE_ROWS），读取统计信息而不扫描表"""
+        with self.connect() as conn:
+            result = conn.execute(
+                text("SELECT table_rows FROM information_schema.tables "
+                     "WHERE table_schema = :schema AND table_name = :table"),
+                {'schema': self.config['database'], 'table': table_name}
+            )
+            row = result.fetchone()
+            return int(row[0]) if row and row[0] is not None else None
+
+    def get_table_data(self, table_name: str, schema: str = None, limit: int = 10000, offset: int = 0,
+                       filters: Dict = None, sort: List = None) -> pd.DataFrame:
         """
         分页获取表数据
         Args:
@@ -71,19 +140,107 @@ class MySQLDataSource(DataSource):
             schema: 模式名
             limit: 每页记录数
             offset: 偏移量
+            filters: dtale保存的列过滤条件，会被编译为WHERE子句在数据库中执行
+            sort: dtale的排序信息，如 [['age', 'DESC']]，会被编译为ORDER BY子句
         """
         full_table_name = f"{schema}.{table_name}" if schema else table_name
-        query = f"SELECT * FROM {full_table_name}"
+        key_column = self.get_key_column(full_table_name) if limit is not None else None
+        # 键列同时作为排序的最后一个排序键，保证 LIMIT/OFFSET 翻页时排序值相同的行不会重复或遗漏
+        where, order_by, params = self.build_sql_clauses(filters, sort, key_column)
+        keyset = self.config.get('keyset_pagination', True) is not False
+        if keyset and key_column and (not sort or [list(s) for s in sort] == [[key_column, 'ASC']]):
+            return self._get_table_data_by_key(full_table_name, key_column, limit, offset or 0, where, params)
+
+        query = f"SELECT * FROM {full_table_name}{where}{order_by}"
         if limit is not None:
             query += f" LIMIT {limit}"
             if offset is not None:
                 query += f" OFFSET {offset}"
 
-        with self.engine.connect() as conn:
-            result = conn.execute(text(query))
-            columns = result.keys()
-            data = result.fetchall()
-            return pd.DataFrame(data, columns=columns)
+        with self.connect() as conn:
+            return self.read_dataframe(conn, query, params)
+
+    def read_dataframe(self, conn, query: str, params: Dict = None) -> pd.DataFrame:
+        """使用服务端游标（stream_results）执行查询，按批次以列式方式转换为 DataFrame"""
+        result = conn.execute(text(query).execution_options(stream_results=True), params or {})
+        try:
+            return fetch_dataframe(result, result.cursor.description, dbapi=getattr(self.engine.dialect, 'dbapi', None))
+        finally:
+            result.close()
+
+    def fetch_frame(self, query: str, params: Dict = None) -> pd.DataFrame:
+        """执行（参数化的）查询并以 DataFrame 返回结果"""
+        with self.connect() as conn:
+            return self.read_dataframe(conn, query, params)
+
+    def get_partition_column(self, table_name: str) -> Optional[str]:
+        """分区抽取使用配置的 partition_columns，没有配置时使用键集分页的键（主键）"""
+        return super().get_partition_column(table_name) or self.get_key_column(table_name)
+
+    def get_key_column(self, table_name: str) -> Optional[str]:
+        """
+        获取分页使用的唯一键列（键集分页的键及排序的最后一个排序键）：优先使用 datasources.yaml 中
+        key_columns 配置的有序唯一列，否则使用表的单列主键；都没有时返回 None
+        Args:
+            table_name: 表名，可以带库名（如 db.table）
+        """
+        if table_name not in self._key_columns:
+            schema, _, name = table_name.rpartition('.')
+            key_column = super().get_key_column(table_name) or super().get_key_column(name)
+            if key_column is None:
+                try:
+                    pk = inspect(self.engine).get_pk_constraint(name, schema=schema or None)
+                except Exception as e:
+                    # 不缓存获取失败的结果，下次翻页时重试
+                    logger.warning(f"Unable to load primary key of {table_name}: {str(e)}")
+                    return None
+                columns = pk.get('constrained_columns') or []
+                key_column = columns[0] if len(columns) == 1 else None
+            logger.info(f"Keyset pagination column for {table_name}: {key_column}")
+            self._key_columns[table_name] = key_column
+        return self._key_columns[table_name]
+
+    def _get_table_data_by_key(self, full_table_name: str, key_column: str, limit: int, offset: int,
+                               where: str, params: Dict) -> pd.DataFrame:
+        """
+        键集分页：从不超过 offset 的最近检查点开始 WHERE key > :last ORDER BY key LIMIT n，
+        检查点还未记录时先只扫描键列（覆盖索引）定位，避免像 OFFSET 那样读取并丢弃整行数据
+        """
+        key = f"`{key_column}`"
+        index = self.keyset_checkpoints.get(full_table_name, where + json.dumps(params, sort_keys=True, default=str))
+        start, last_key = index.nearest(offset)
+        target = index.floor(offset)
+
+        def _seek_params(last: Any) -> Dict:
+            return params if last is None else dict(params, keyset_last=last)
+
+        def _seek_query(select: str, last: Any, skip: int, rows: int) -> str:
+            conditions = [where[len(' WHERE '):]] if where else []
+            if last is not None:
+                conditions.append(f"{key} > :keyset_last")
+            query = f"SELECT {select} FROM {full_table_name}"
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += f" ORDER BY {key} LIMIT {rows}"
+            return query + (f" OFFSET {skip}" if skip else "")
+
+        with self.connect() as conn:
+            if target > start:
+                # 目标检查点之前最后一行的键值
+                row = conn.execute(
+                    text(_seek_query(key, last_key, target - start - 1, 1)), _seek_params(last_key)
+                ).fetchone()
+                if row is not None:
+                    index.record(target, _key_value(row[0]))
+                    start, last_key = target, _key_value(row[0])
+
+            df = self.read_dataframe(conn, _seek_query('*', last_key, offset - start, limit), _seek_params(last_key))
+
+        # 顺序翻页经过的检查点顺便记录下来
+        if key_column in df.columns:
+            for position in range(target + index.interval, offset + len(df) + 1, index.interval):
+                index.record(position, _key_value(df[key_column].iloc[position - offset - 1]))
+        return df
 
     def preview_table(self, table_name: str, rows: int = 1000) -> pd.DataFrame:
         """预览表数据"""
@@ -113,8 +270,14 @@ class MySQLDataSource(DataSource):
         
         query += f" LIMIT {limit}"
         
-        with self.engine.connect() as conn:
-            result = conn.execute(text(query))
-            columns = result.keys()
-            data = result.fetchall()
-            return pd.DataFrame(data, columns=columns) 
\ No newline at end of file
+        with self.connect() as conn:
+            return self.read_dataframe(conn, query) 
+
+
+def _key_value(value: Any) -> Any:
+    """将 pandas/numpy 标量转换为数据库驱动可以绑定的 python 值"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value
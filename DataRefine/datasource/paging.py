@@ -0,0 +1,50 @@
+import json
+import logging
+import pandas as pd
+from typing import Dict, List
+from .base import DataSource
+from .result_cache import ResultCache
+from .row_count import RowCountService
+
+logger = logging.getLogger(__name__)
+
+
+class TablePageSource:
+    """
+    将数据源中的一张表适配为 dtale 分页实例（DtalePagedInstance）所需的接口，
+    dtale 只会按表格滚动到的行范围分块拉取数据
+    """
+
+    def __init__(self, datasource: DataSource, table_name: str, row_counts: RowCountService = None,
+                 cache: ResultCache = None):
+        self.datasource = datasource
+        self.table_name = table_name
+        self.row_counts = row_counts
+        self.cache = cache
+
+    def count_rows(self, filters: Dict = None) -> int:
+        """
+        获取表（在过滤条件下）的总行数，没有过滤条件时使用行数服务中缓存的行数：
+        可能是估算值，精确行数在后台计算完成后会通过 DtalePagedInstance.refresh_rows 更新
+        """
+        if not filters and self.row_counts is not None:
+            return self.row_counts.get(self.datasource, self.table_name)['total_rows']
+        return self.datasource.count_rows(self.table_name, filters=filters)
+
+    def load_rows(self, start: int, end: int, filters: Dict = None, sort: List = None) -> pd.DataFrame:
+        """获取过滤、排序后 [start, end) 范围内的行，过滤和排序均在数据库中执行，结果会被缓存"""
+        key = (
+            self.datasource.name, self.table_name, start, end,
+            json.dumps({'filters': filters, 'sort': sort}, sort_keys=True, default=str)
+        )
+        if self.cache is not None:
+            df = self.cache.get(key)
+            if df is not None:
+                return df
+        logger.info(f"Fetching rows [{start}, {end}) from {self.datasource.name}.{self.table_name}")
+        df = self.datasource.get_table_data(
+            self.table_name, limit=end - start, offset=start, filters=filters, sort=sort
+        )
+        if self.cache is not None:
+            self.cache.put(key, df)
+        return df
@@ -0,0 +1,100 @@
+import datetime
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 每个分区的目标行数，分区数 = 估算行数 / 该值（至少为并发数）
+PARTITION_TARGET_ROWS = 500000
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+
+
+def _is_datetime(value: Any) -> bool:
+    return isinstance(value, (datetime.date, np.datetime64))
+
+
+def split_range(lo: Any, hi: Any, count: int) -> List[Tuple[Any, Any]]:
+    """
+    将 [lo, hi] 拆分为最多 count 个相邻的区间 [start, end)，最后一个区间包含 hi，
+    支持整数、浮点数及日期/时间，不支持的类型返回空列表
+    """
+    if lo is None or hi is None or count < 1:
+        return []
+    if _is_number(lo) and _is_number(hi):
+        if isinstance(lo, (int, np.integer)) and isinstance(hi, (int, np.integer)):
+            count = int(min(count, int(hi) - int(lo) + 1))
+            bounds = [int(b) for b in np.linspace(int(lo), int(hi) + 1, count + 1).round()]
+        else:
+            bounds = list(np.linspace(float(lo), float(hi), count + 1))
+    elif _is_datetime(lo) and _is_datetime(hi):
+        is_date = type(lo) is datetime.date
+        bounds = list(pd.date_range(pd.Timestamp(lo), pd.Timestamp(hi), periods=count + 1))
+        if is_date:
+            bounds = sorted({b.date() for b in bounds})
+        else:
+            bounds = [b.to_pydatetime() for b in bounds]
+    else:
+        return []
+    bounds = [v.item() if isinstance(v, np.generic) else v for v in bounds]
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1) if bounds[i] != bounds[i + 1]] or [(lo, hi)]
+
+
+class ExtractProgress:
+    """分区抽取进度"""
+
+    def __init__(self, total: int = 0):
+        self.total = total
+        self.done = 0
+        self.rows = 0
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def update(self, rows: int) -> None:
+        with self._lock:
+            self.done += 1
+            self.rows += rows
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {
+                'partitions': self.total,
+                'done': self.done,
+                'rows': self.rows,
+                'elapsed': round(time.time() - self.started, 1)
+            }
+
+
+def load_partitions(fetch: Callable[[int], pd.DataFrame], count: int, workers: int,
+                    progress: Optional[ExtractProgress] = None,
+                    callback: Optional[Callable[[Dict], None]] = None) -> pd.DataFrame:
+    """
+    使用线程池并发获取 count 个分区（查询由数据库执行，线程只等待 I/O），按分区顺序合并结果
+    Args:
+        fetch: 获取第 i 个分区的函数
+        count: 分区数
+        workers: 并发数，不应超过数据源连接池的连接数
+        progress: 抽取进度
+        callback: 每完成一个分区时以进度信息调用
+    """
+    progress = progress or ExtractProgress()
+    progress.total = count
+
+    def _fetch(i):
+        df = fetch(i)
+        progress.update(len(df))
+        if callback is not None:
+            callback(progress.to_dict())
+        return df
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, count))) as executor:
+        frames = list(executor.map(_fetch, range(count)))
+    frames = [f for f in frames if len(f)] or frames[:1]
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0].reset_index(drop=True)
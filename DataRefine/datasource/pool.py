@@ -0,0 +1,188 @@
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+# 连接池默认配置，可在 datasources.yaml 顶层或每个数据源的 pool 中覆盖
+DEFAULT_POOL_SETTINGS = {
+    'pool_size': 5,  # 常驻连接数
+    'max_overflow': 10,  # 繁忙时允许额外创建的连接数
+    'pool_timeout': 30,  # 等待空闲连接的超时时间（秒）
+    'pool_recycle': 3600,  # 连接使用超过该时间（秒）后重建，避免被服务端断开的陈旧连接
+    'pool_pre_ping': True  # 取出连接前先检查连接是否可用
+}
+
+
+def pool_settings(*configs: Dict) -> Dict:
+    """合并默认、全局及数据源的连接池配置，后面的配置优先"""
+    settings = dict(DEFAULT_POOL_SETTINGS)
+    for config in configs:
+        settings.update({k: v for k, v in (config or {}).items() if k in DEFAULT_POOL_SETTINGS})
+    return settings
+
+
+class PoolTimeoutError(Exception):
+    """等待空闲连接超时"""
+
+
+class PoolMetrics:
+    """连接池指标：借出连接数、等待次数、超时次数等"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checked_out = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.invalidated = 0
+
+    def incr(self, **counts) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {
+                'checkouts': self.checkouts,
+                'checked_out': self.checked_out,
+                'waits': self.waits,
+                'timeouts': self.timeouts,
+                'invalidated': self.invalidated
+            }
+
+
+class ConnectionPool:
+    """
+    线程安全的 DB-API 连接池（用于 jaydebeapi 等没有 SQLAlchemy 连接池的 JDBC 连接）
+
+    最多同时借出 pool_size + max_overflow 个连接，超出时等待 pool_timeout 秒；
+    归还时超过 pool_size 的连接会被关闭。取出连接时会重建超过 pool_recycle 秒的连接，
+    pool_pre_ping 开启时还会先执行 ping_query 检查连接是否可用
+    """
+
+    def __init__(self, creator: Callable[[], Any], pool_size: int = 5, max_overflow: int = 10,
+                 pool_timeout: float = 30, pool_recycle: float = 3600, pool_pre_ping: bool = True,
+                 ping_query: str = 'SELECT 1'):
+        self.creator = creator
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.ping_query = ping_query
+        self.metrics = PoolMetrics()
+        self._idle = queue.LifoQueue()  # (连接, 创建时间)，后进先出以便多余的连接空闲
+        self._slots = threading.BoundedSemaphore(pool_size + max_overflow)
+        self._lock = threading.Lock()
+        self._created = 0
+
+    def _close(self, conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {str(e)}")
+        with self._lock:
+            self._created -= 1
+
+    def _create(self):
+        conn = self.creator()
+        with self._lock:
+            self._created += 1
+        return conn, time.time()
+
+    def ping(self, conn: Any) -> bool:
+        """检查连接是否可用"""
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(self.ping_query)
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception as e:
+            logger.warning(f"Pooled connection failed health check: {str(e)}")
+            return False
+
+    def _checkout(self):
+        if not self._slots.acquire(blocking=False):
+            self.metrics.incr(waits=1)
+            if not self._slots.acquire(timeout=self.pool_timeout):
+                self.metrics.incr(timeouts=1)
+                raise PoolTimeoutError(
+                    f"Timed out after {self.pool_timeout}s waiting for one of "
+                    f"{self.pool_size + self.max_overflow} connections"
+                )
+        try:
+            while True:
+                try:
+                    conn, created = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._create()
+                if self.pool_recycle is not None and self.pool_recycle >= 0 and \
+                        time.time() - created > self.pool_recycle:
+                    self._close(conn)
+                    continue
+                if self.pool_pre_ping and not self.ping(conn):
+                    self.metrics.incr(invalidated=1)
+                    self._close(conn)
+                    continue
+                return conn, created
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _checkin(self, conn: Any, created: float, invalidate: bool = False) -> None:
+        if invalidate or self._idle.qsize() >= self.pool_size:
+            self._close(conn)
+        else:
+            self._idle.put((conn, created))
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """借出一个连接，退出时归还；执行出错时如果连接已不可用则丢弃"""
+        conn, created = self._checkout()
+        self.metrics.incr(checkouts=1, checked_out=1)
+        invalidate = False
+        try:
+            yield conn
+        except Exception:
+            invalidate = not self.ping(conn)
+            if invalidate:
+                self.metrics.incr(invalidated=1)
+            raise
+        finally:
+            self.metrics.incr(checked_out=-1)
+            self._checkin(conn, created, invalidate)
+
+    def health_check(self) -> bool:
+        """借出一个连接并执行 ping_query"""
+        with self.connection() as conn:
+            return self.ping(conn)
+
+    def status(self) -> Dict:
+        """连接池状态及指标"""
+        with self._lock:
+            created = self._created
+        return {
+            'pool_size': self.pool_size,
+            'max_overflow': self.max_overflow,
+            'connections': created,
+            'idle': self._idle.qsize(),
+            **self.metrics.to_dict()
+        }
+
+    def dispose(self) -> None:
+        """关闭所有空闲连接"""
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(conn)
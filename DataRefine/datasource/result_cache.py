@@ -0,0 +1,141 @@
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+def serialize_frame(df: pd.DataFrame) -> bytes:
+    """将 DataFrame 序列化为压缩的 Arrow IPC 字节，arrow 无法表示的数据（如混合类型的 object 列）退回到 pickle"""
+    if pa is not None:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            options = pa.ipc.IpcWriteOptions(compression='zstd' if pa.Codec.is_available('zstd') else None)
+            with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+            return b'A' + sink.getvalue().to_pybytes()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            logger.debug(f"Unable to serialize frame with arrow, falling back to pickle: {str(e)}")
+    return b'P' + pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def deserialize_frame(data: bytes) -> pd.DataFrame:
+    """反序列化 serialize_frame 的结果"""
+    if data[:1] == b'A':
+        return pa.ipc.open_stream(pa.py_buffer(data[1:])).read_all().to_pandas()
+    return pickle.loads(data[1:])
+
+
+class ResultCache:
+    """
+    数据源查询结果缓存，键为 (数据源, 表, 行范围/页, 过滤及排序条件)
+
+    - 结果以压缩的 Arrow IPC 字节保存在内存中，设置 directory 时保存在本地磁盘，内存中只保留索引
+    - 所有结果的总字节数超过 max_bytes 时按最近最少使用淘汰
+    - 每个数据源可以设置不同的过期时间（set_ttl），默认 ttl 秒
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, ttl: int = 300, directory: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.directory = directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._ttls = {}  # 数据源 -> 过期时间（秒）
+        self._entries = OrderedDict()  # 键 -> (字节或文件路径, 字节数, 过期时间点)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expired': 0, 'invalidations': 0}
+
+    def set_ttl(self, datasource_name: str, ttl: int) -> None:
+        """设置某个数据源的结果过期时间（秒）"""
+        self._ttls[datasource_name] = ttl
+
+    def _path(self, key: Hashable) -> str:
+        return os.path.join(self.directory, hashlib.sha1(repr(key).encode('utf-8')).hexdigest() + '.arrow')
+
+    def _drop(self, key: Hashable) -> None:
+        """移除缓存项，调用方需持有锁"""
+        value, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        if self.directory:
+            try:
+                os.remove(value)
+            except OSError:
+                pass
+
+    def get(self, key: Hashable) -> Optional[pd.DataFrame]:
+        """获取缓存的结果，不存在或已过期时返回 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] < time.time():
+                self._drop(key)
+                self._stats['expired'] += 1
+                entry = None
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            value = entry[0]
+        if self.directory:
+            try:
+                with open(value, 'rb') as f:
+                    value = f.read()
+            except OSError:
+                return None
+        return deserialize_frame(value)
+
+    def put(self, key: Hashable, df: pd.DataFrame) -> None:
+        """缓存结果，超过 max_bytes 的单个结果不会被缓存"""
+        data = serialize_frame(df)
+        size = len(data)
+        if size > self.max_bytes:
+            return
+        value = data
+        if self.directory:
+            value = self._path(key)
+            with open(value, 'wb') as f:
+                f.write(data)
+        expires = time.time() + self._ttls.get(key[0], self.ttl)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size, expires)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._stats['evictions'] += 1
+
+    def invalidate(self, datasource_name: str = None, table_name: str = None) -> int:
+        """清除某个数据源（及表）的缓存结果，都不指定时清除全部，返回清除的条数"""
+        with self._lock:
+            keys = [
+                k for k in self._entries
+                if datasource_name in (None, k[0]) and table_name in (None, k[1])
+            ]
+            for key in keys:
+                self._drop(key)
+            self._stats['invalidations'] += len(keys)
+        return len(keys)
+
+    def stats(self) -> Dict:
+        """命中/未命中等统计信息，用于确定缓存大小"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({'entries': len(self._entries), 'bytes': self._bytes, 'max_bytes': self.max_bytes})
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else None
+        return stats
@@ -0,0 +1,134 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+from .base import DataSource
+
+logger = logging.getLogger(__name__)
+
+
+class RowCountService:
+    """
+    数据源表行数服务，避免每次打开表页面都执行一次全表 COUNT(*)
+
+    - 按 (数据源, 表) 缓存行数，ttl 秒后过期
+    - estimate 模式下先返回数据库统计信息中的估算行数（MySQL information_schema.TABLES.TABLE_ROWS、
+      Hive 表属性 numRows），同时在后台线程中计算精确行数，完成后替换缓存中的估算值并通知监听者
+    """
+
+    def __init__(self, ttl: int = 300, estimate: bool = True):
+        self.ttl = ttl
+        self.estimate = estimate
+        self._counts = {}  # (数据源, 表) -> {'total_rows', 'exact', 'updated'}
+        self._refreshing = {}  # (数据源, 表) -> 后台刷新完成的事件
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, callback: Callable[[str, str, int], None]) -> None:
+        """注册后台计算出精确行数时的回调，以 (数据源名, 表名, 行数) 调用"""
+        self._listeners.append(callback)
+
+    def _notify(self, key, total_rows: int) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(key[0], key[1], total_rows)
+            except Exception as e:
+                logger.error(f"Error notifying row count of {key[0]}.{key[1]}: {str(e)}")
+
+    def _cached(self, key, exact: bool = False) -> Optional[Dict]:
+        with self._lock:
+            entry = self._counts.get(key)
+        if entry is None or time.time() - entry['updated'] > self.ttl:
+            return None
+        if exact and not entry['exact']:
+            return None
+        return entry
+
+    def _store(self, key, total_rows: int, exact: bool) -> Dict:
+        entry = {'total_rows': total_rows, 'exact': exact, 'updated': time.time()}
+        with self._lock:
+            current = self._counts.get(key)
+            # 不要用估算值覆盖仍然有效的精确值
+            if not exact and current is not None and current['exact'] and \
+                    time.time() - current['updated'] <= self.ttl:
+                return current
+            self._counts[key] = entry
+        return entry
+
+    def _state(self, key, entry: Dict) -> Dict:
+        with self._lock:
+            refreshing = key in self._refreshing
+        return {'total_rows': entry['total_rows'], 'exact': entry['exact'], 'refreshing': refreshing}
+
+    def get_exact(self, datasource: DataSource, table_name: str) -> int:
+        """获取精确行数，缓存有效时不会访问数据库"""
+        key = (datasource.name, table_name)
+        with self._lock:
+            refreshing = self._refreshing.get(key)
+        if refreshing is not None:  # 后台正在计算，等待其结果而不是再执行一次 COUNT(*)
+            refreshing.wait()
+        entry = self._cached(key, exact=True)
+        if entry is None:
+            entry = self._store(key, datasource.count_rows(table_name), True)
+        return entry['total_rows']
+
+    def refresh(self, datasource: DataSource, table_name: str) -> None:
+        """在后台线程中重新计算精确行数，同一张表同时只会有一个刷新线程"""
+        key = (datasource.name, table_name)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing[key] = done = threading.Event()
+
+        def _refresh():
+            entry = None
+            try:
+                entry = self._store(key, datasource.count_rows(table_name), True)
+            except Exception as e:
+                logger.error(f"Error counting rows of {datasource.name}.{table_name}: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.pop(key, None)
+                done.set()
+            if entry is not None:
+                self._notify(key, entry['total_rows'])
+
+        threading.Thread(target=_refresh, daemon=True).start()
+
+    def get(self, datasource: DataSource, table_name: str) -> Dict:
+        """
+        获取表行数
+        Returns:
+            {'total_rows': 行数, 'exact': 是否为精确值, 'refreshing': 是否正在后台计算精确值}
+        """
+        key = (datasource.name, table_name)
+        entry = self._cached(key)
+        if entry is not None:
+            return self._state(key, entry)
+
+        if self.estimate:
+            try:
+                estimate = datasource.estimate_rows(table_name)
+            except Exception as e:
+                logger.warning(f"Unable to estimate rows of {datasource.name}.{table_name}: {str(e)}")
+                estimate = None
+            if estimate is not None:
+                entry = self._store(key, estimate, False)
+                if not entry['exact']:
+                    self.refresh(datasource, table_name)
+                return self._state(key, entry)
+
+        return {'total_rows': self.get_exact(datasource, table_name), 'exact': True, 'refreshing': False}
+
+    def peek(self, datasource_name: str, table_name: str) -> Optional[Dict]:
+        """查看缓存中的行数（不访问数据库），用于页面轮询精确行数是否已经计算完成"""
+        key = (datasource_name, table_name)
+        entry = self._cached(key)
+        return None if entry is None else self._state(key, entry)
+
+    def invalidate(self, datasource_name: str = None, table_name: str = None) -> None:
+        """清除缓存的行数"""
+        with self._lock:
+            for key in list(self._counts):
+                if datasource_name in (None, key[0]) and table_name in (None, key[1]):
+                    del self._counts[key]
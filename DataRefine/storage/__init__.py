@@ -1,6 +1,7 @@
 from .base import StorageBase
 from .local import LocalStorage
 from .cos import COSStorage
+from .local_cos import LocalCOSStorage
 from .factory import StorageFactory
 
-__all__ = ['StorageBase', 'LocalStorage', 'COSStorage', 'StorageFactory'] 
\ No newline at end of file
+__all__ = ['StorageBase', 'LocalStorage', 'COSStorage', 'LocalCOSStorage', 'StorageFactory']
@@ -1,6 +1,43 @@
+import tempfile
 from abc import ABC, abstractmethod
 from typing import BinaryIO, Optional
 
+
+class UploadWriter:
+    """
+    分块写入上传文件的对象，配合 with 使用：正常退出时完成上传并设置 location（文件访问路径或URL），
+    出错时丢弃已写入的内容。默认先写入本地临时文件（不占用内存），退出时再调用 storage.upload
+    """
+
+    def __init__(self, storage: 'StorageBase', filename: str):
+        self.storage = storage
+        self.filename = filename
+        self.location = None
+        self._file = tempfile.TemporaryFile()
+
+    def write(self, data: bytes) -> int:
+        return self._file.write(data)
+
+    def commit(self) -> str:
+        self._file.seek(0)
+        return self.storage.upload(self._file, self.filename)
+
+    def abort(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type is None:
+                self.location = self.commit()
+            else:
+                self.abort()
+        finally:
+            self._file.close()
+        return False
+
 class StorageBase(ABC):
     """存储服务的抽象基类"""
     
@@ -16,6 +53,26 @@ class StorageBase(ABC):
         """
         pass
     
+    def open_upload(self, filename: str) -> UploadWriter:
+        """
+        打开一个分块写入的上传对象
+        Args:
+            filename: 文件名
+        Returns:
+            UploadWriter: 用 with 语句写入，退出后 location 为文件访问路径或URL
+        """
+        return UploadWriter(self, filename)
+
+    def local_path(self, filename: str) -> Optional[str]:
+        """
+        文件在本地磁盘上的路径（用于在文件旁写入列式旁路文件）
+        Args:
+            filename: 文件名
+        Returns:
+            Optional[str]: 本地路径，存储不提供本地副本或文件不存在时返回None
+        """
+        return None
+
     @abstractmethod
     def download(self, filename: str) -> Optional[BinaryIO]:
         """
@@ -0,0 +1,92 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional
+
+
+class LocalFileCache:
+    """
+    本地磁盘上的读穿透缓存：按文件名缓存从远程存储下载的文件，
+    缓存文件的总字节数超过 max_bytes 时按最近最少使用淘汰
+    Args:
+        directory: 缓存目录，重启后会按文件修改时间恢复已有的缓存
+        max_bytes: 缓存文件总字节数上限
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2 * 1024 * 1024 * 1024):
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._files = OrderedDict()  # 缓存文件路径 -> 字节数
+        self._bytes = 0
+        existing = [
+            os.path.join(self.directory, f) for f in os.listdir(self.directory)
+            if not f.endswith('.part') and os.path.isfile(os.path.join(self.directory, f))
+        ]
+        for path in sorted(existing, key=os.path.getmtime):
+            self._files[path] = os.path.getsize(path)
+            self._bytes += self._files[path]
+
+    def path(self, key: str) -> str:
+        """缓存文件路径，保留原文件的扩展名以便按类型解析"""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + os.path.splitext(key)[1])
+
+    def get(self, key: str) -> Optional[str]:
+        """缓存文件路径，未缓存时返回 None"""
+        path = self.path(key)
+        with self._lock:
+            if path not in self._files:
+                return None
+            if not os.path.exists(path):
+                self._bytes -= self._files.pop(path)
+                return None
+            self._files.move_to_end(path)
+        return path
+
+    @contextmanager
+    def writer(self, key: str):
+        """
+        写入缓存文件，用法: with cache.writer(key) as f，先写入临时文件，正常退出后才替换为缓存文件，
+        出错时丢弃
+        """
+        path = self.path(key)
+        tmp = f"{path}.{threading.get_ident()}.part"
+        try:
+            with open(tmp, 'wb') as f:
+                yield f
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self._add(path)
+
+    def _add(self, path: str) -> None:
+        size = os.path.getsize(path)
+        with self._lock:
+            if path in self._files:
+                self._bytes -= self._files.pop(path)
+            self._files[path] = size
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._files) > 1:
+                oldest, oldest_size = self._files.popitem(last=False)
+                self._bytes -= oldest_size
+                try:
+                    os.remove(oldest)
+                except OSError:
+                    pass
+
+    def remove(self, key: str) -> None:
+        """删除缓存文件"""
+        path = self.path(key)
+        with self._lock:
+            if path in self._files:
+                self._bytes -= self._files.pop(path)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
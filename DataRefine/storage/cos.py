@@ -1,9 +1,21 @@
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from typing import BinaryIO, Optional
-from qcloud_cos import CosConfig, CosS3Client
 from .base import StorageBase
+from .cache import LocalFileCache
+
+# 超过该大小的文件使用分块上传
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+# 分块上传/分段下载时每块的大小
+PART_SIZE = 8 * 1024 * 1024
+
 
 class COSStorage(StorageBase):
-    def __init__(self, secret_id: str, secret_key: str, region: str, bucket: str):
+    def __init__(self, secret_id: str = None, secret_key: str = None, region: str = None, bucket: str = None,
+                 client=None, part_size: int = PART_SIZE, multipart_threshold: int = MULTIPART_THRESHOLD,
+                 max_workers: int = 4, cache_dir: str = None, cache_max_bytes: int = None):
         """
         初始化腾讯云COS存储
         Args:
@@ -11,38 +23,155 @@ class COSStorage(StorageBase):
             secret_key: 腾讯云 SecretKey
             region: 地域信息
             bucket: 存储桶名称
+            client: COS 客户端，默认根据以上参数创建 CosS3Client（测试时可以传入 LocalObjectClient）
+            part_size: 分块上传/分段下载时每块的字节数
+            multipart_threshold: 超过该字节数的文件使用分块上传
+            max_workers: 并发传输的分块数
+            cache_dir: 本地读穿透缓存目录，为空时不缓存
+            cache_max_bytes: 本地缓存的字节数上限
         """
-        config = CosConfig(
-            Region=region,
-            SecretId=secret_id,
-            SecretKey=secret_key
-        )
-        self.client = CosS3Client(config)
+        if client is None:
+            from qcloud_cos import CosConfig, CosS3Client
+
+            config = CosConfig(
+                Region=region,
+                SecretId=secret_id,
+                SecretKey=secret_key
+            )
+            client = CosS3Client(config)
+        self.client = client
         self.bucket = bucket
         self.region = region
-    
-    def upload(self, file_obj: BinaryIO, filename: str) -> str:
-        """上传文件到COS"""
-        self.client.put_object(
-            Bucket=self.bucket,
-            Body=file_obj,
-            Key=filename
-        )
+        self.part_size = part_size
+        self.multipart_threshold = multipart_threshold
+        self.max_workers = max_workers
+        self.cache = None
+        if cache_dir:
+            self.cache = LocalFileCache(cache_dir, **({'max_bytes': cache_max_bytes} if cache_max_bytes else {}))
+
+    def url(self, filename: str) -> str:
+        """文件的访问URL"""
         return f'https://{self.bucket}.cos.{self.region}.myqcloud.com/{filename}'
-    
-    def download(self, filename: str) -> Optional[BinaryIO]:
-        """从COS下载文件"""
+
+    def upload(self, file_obj: BinaryIO, filename: str) -> str:
+        """
+        上传文件到COS，超过 multipart_threshold 的文件分块并发上传，
+        开启本地缓存时上传的内容同时写入缓存，之后打开该文件不需要再下载
+        """
+        first = file_obj.read(self.multipart_threshold + 1)
+        with ExitStack() as stack:
+            cache_file = stack.enter_context(self.cache.writer(filename)) if self.cache is not None else None
+            if len(first) <= self.multipart_threshold:
+                if cache_file is not None:
+                    cache_file.write(first)
+                self.client.put_object(
+                    Bucket=self.bucket,
+                    Body=first,
+                    Key=filename
+                )
+            else:
+                self._multipart_upload(first, file_obj, filename, cache_file)
+        return self.url(filename)
+
+    def _multipart_upload(self, first: bytes, file_obj: BinaryIO, filename: str, cache_file=None) -> None:
+        """分块上传，同时最多有 max_workers * 2 个分块在内存中"""
+        upload_id = self.client.create_multipart_upload(Bucket=self.bucket, Key=filename)['UploadId']
+        in_flight = threading.BoundedSemaphore(self.max_workers * 2)
+
+        def _upload_part(number, body):
+            try:
+                response = self.client.upload_part(
+                    Bucket=self.bucket, Key=filename, Body=body, PartNumber=number, UploadId=upload_id
+                )
+                return {'PartNumber': number, 'ETag': response['ETag']}
+            finally:
+                in_flight.release()
+
+        def _parts():
+            pending = first
+            while True:
+                while len(pending) < self.part_size:
+                    data = file_obj.read(self.part_size)
+                    if not data:
+                        break
+                    pending += data
+                if not pending:
+                    return
+                yield pending[:self.part_size]
+                pending = pending[self.part_size:]
+
         try:
-            response = self.client.get_object(
-                Bucket=self.bucket,
-                Key=filename
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = []
+                for number, body in enumerate(_parts(), 1):
+                    if cache_file is not None:
+                        cache_file.write(body)
+                    in_flight.acquire()
+                    futures.append(executor.submit(_upload_part, number, body))
+                parts = [f.result() for f in futures]
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket, Key=filename, UploadId=upload_id, MultipartUpload={'Part': parts}
             )
-            return response['Body']
+        except BaseException:
+            self.client.abort_multipart_upload(Bucket=self.bucket, Key=filename, UploadId=upload_id)
+            raise
+
+    def _download_to(self, filename: str, f: BinaryIO) -> None:
+        """下载文件写入 f，超过 part_size 的文件按字节范围分段并发下载"""
+        size = int(self.client.head_object(Bucket=self.bucket, Key=filename)['Content-Length'])
+        if size <= self.part_size:
+            f.write(self._get_range(filename))
+            return
+
+        lock = threading.Lock()
+
+        def _download_range(start):
+            end = min(start + self.part_size, size) - 1
+            data = self._get_range(filename, f'bytes={start}-{end}')
+            with lock:
+                f.seek(start)
+                f.write(data)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(_download_range, range(0, size, self.part_size)))
+        f.seek(size)
+
+    def _get_range(self, filename: str, byte_range: str = None) -> bytes:
+        kwargs = {'Range': byte_range} if byte_range else {}
+        response = self.client.get_object(Bucket=self.bucket, Key=filename, **kwargs)
+        return response['Body'].get_raw_stream().read()
+
+    def download(self, filename: str) -> Optional[BinaryIO]:
+        """从COS下载文件，开启本地缓存时优先读取缓存，未缓存时下载后写入缓存"""
+        try:
+            if self.cache is None:
+                f = tempfile.TemporaryFile()
+                self._download_to(filename, f)
+                f.seek(0)
+                return f
+            path = self.cache.get(filename)
+            if path is None:
+                with self.cache.writer(filename) as f:
+                    self._download_to(filename, f)
+                path = self.cache.path(filename)
+            return open(path, 'rb')
         except Exception:
             return None
-    
+
+    def local_path(self, filename: str) -> Optional[str]:
+        """本地缓存中的文件路径（未缓存时先下载），没有开启本地缓存时返回None"""
+        if self.cache is None:
+            return None
+        f = self.download(filename)
+        if f is None:
+            return None
+        f.close()
+        return self.cache.path(filename)
+
     def delete(self, filename: str) -> bool:
         """删除COS中的文件"""
+        if self.cache is not None:
+            self.cache.remove(filename)
         try:
             self.client.delete_object(
                 Bucket=self.bucket,
@@ -50,4 +179,4 @@ class COSStorage(StorageBase):
             )
             return True
         except Exception:
-            return False 
\ No newline at end of file
+            return False
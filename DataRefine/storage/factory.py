@@ -2,6 +2,10 @@ from typing import Optional
 from .base import StorageBase
 from .local import LocalStorage
 from .cos import COSStorage
+from .local_cos import LocalCOSStorage
+
+# COS 分块传输及本地缓存的可选参数
+COS_TRANSFER_PARAMS = ['part_size', 'multipart_threshold', 'max_workers', 'cache_dir', 'cache_max_bytes']
 
 class StorageFactory:
     @staticmethod
@@ -30,7 +34,15 @@ class StorageFactory:
                 secret_id=kwargs['secret_id'],
                 secret_key=kwargs['secret_key'],
                 region=kwargs['region'],
-                bucket=kwargs['bucket']
+                bucket=kwargs['bucket'],
+                **{k: kwargs[k] for k in COS_TRANSFER_PARAMS if kwargs.get(k) is not None}
+            )
+
+        elif storage_type == 'local_cos':
+            # 本地目录模拟的 COS，用于没有云存储的环境
+            return LocalCOSStorage(
+                kwargs.get('root_dir', 'cos'),
+                **{k: kwargs[k] for k in COS_TRANSFER_PARAMS if kwargs.get(k) is not None}
             )
         
         raise ValueError(f"Unsupported storage type: {storage_type}") 
\ No newline at end of file
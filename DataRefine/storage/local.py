@@ -1,6 +1,30 @@
 import os
+import shutil
 from typing import BinaryIO, Optional
-from .base import StorageBase
+from .base import StorageBase, UploadWriter
+from .stream import UPLOAD_CHUNK_SIZE
+
+
+class LocalUploadWriter(UploadWriter):
+    """直接分块写入上传目录中的文件"""
+
+    def __init__(self, storage: 'LocalStorage', filename: str):
+        self.storage = storage
+        self.filename = filename
+        self.location = None
+        self.path = os.path.join(storage.upload_dir, filename)
+        self._file = open(self.path, 'wb')
+
+    def commit(self) -> str:
+        return self.path
+
+    def abort(self) -> None:
+        self._file.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
 
 class LocalStorage(StorageBase):
     def __init__(self, upload_dir: str = "upload"):
@@ -17,9 +41,18 @@ class LocalStorage(StorageBase):
         """上传文件到本地目录"""
         file_path = os.path.join(self.upload_dir, filename)
         with open(file_path, 'wb') as f:
-            f.write(file_obj.read())
+            shutil.copyfileobj(file_obj, f, UPLOAD_CHUNK_SIZE)
         return file_path
+
+    def open_upload(self, filename: str) -> LocalUploadWriter:
+        """分块写入上传目录"""
+        return LocalUploadWriter(self, filename)
     
+    def local_path(self, filename: str) -> Optional[str]:
+        """上传目录中的文件路径"""
+        file_path = os.path.join(self.upload_dir, filename)
+        return file_path if os.path.exists(file_path) else None
+
     def download(self, filename: str) -> Optional[BinaryIO]:
         """从本地目录下载文件"""
         file_path = os.path.join(self.upload_dir, filename)
@@ -0,0 +1,107 @@
+import io
+import os
+import threading
+import uuid
+from typing import Dict
+from .cos import COSStorage
+
+
+class _StreamBody:
+    """模拟 COS SDK 的 StreamBody"""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def get_raw_stream(self) -> io.BytesIO:
+        return io.BytesIO(self._data)
+
+
+class LocalObjectClient:
+    """
+    COS 客户端（CosS3Client）的本地替身：对象保存在本地目录中，实现 COSStorage 用到的接口
+    （put_object、分块上传、head_object、带 Range 的 get_object、delete_object），
+    用于在没有云存储的环境中开发及测试 COSStorage
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = os.path.abspath(root_dir)
+        os.makedirs(self.root_dir, exist_ok=True)
+        self._uploads = {}  # UploadId -> {分块号: 内容}
+        self._lock = threading.Lock()
+        self.requests = []  # 收到的请求（方法名），用于观察传输方式
+
+    def _path(self, bucket: str, key: str) -> str:
+        return os.path.join(self.root_dir, bucket or '', key)
+
+    def _log(self, method: str) -> None:
+        with self._lock:
+            self.requests.append(method)
+
+    def put_object(self, Bucket: str, Body, Key: str, **kwargs) -> Dict:
+        self._log('put_object')
+        path = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(Body if isinstance(Body, (bytes, bytearray)) else Body.read())
+        return {}
+
+    def create_multipart_upload(self, Bucket: str, Key: str, **kwargs) -> Dict:
+        self._log('create_multipart_upload')
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._uploads[upload_id] = {}
+        return {'UploadId': upload_id}
+
+    def upload_part(self, Bucket: str, Key: str, Body, PartNumber: int, UploadId: str, **kwargs) -> Dict:
+        self._log('upload_part')
+        with self._lock:
+            self._uploads[UploadId][PartNumber] = bytes(Body)
+        return {'ETag': f'"{UploadId}-{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, MultipartUpload: Dict,
+                                  **kwargs) -> Dict:
+        self._log('complete_multipart_upload')
+        with self._lock:
+            parts = self._uploads.pop(UploadId)
+        path = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            for part in sorted(MultipartUpload['Part'], key=lambda p: p['PartNumber']):
+                f.write(parts[part['PartNumber']])
+        return {}
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str, **kwargs) -> Dict:
+        self._log('abort_multipart_upload')
+        with self._lock:
+            self._uploads.pop(UploadId, None)
+        return {}
+
+    def head_object(self, Bucket: str, Key: str, **kwargs) -> Dict:
+        self._log('head_object')
+        return {'Content-Length': str(os.path.getsize(self._path(Bucket, Key)))}
+
+    def get_object(self, Bucket: str, Key: str, Range: str = None, **kwargs) -> Dict:
+        self._log('get_object')
+        with open(self._path(Bucket, Key), 'rb') as f:
+            if Range:
+                start, end = Range.replace('bytes=', '').split('-')
+                f.seek(int(start))
+                data = f.read(int(end) - int(start) + 1)
+            else:
+                data = f.read()
+        return {'Body': _StreamBody(data)}
+
+    def delete_object(self, Bucket: str, Key: str, **kwargs) -> Dict:
+        self._log('delete_object')
+        os.remove(self._path(Bucket, Key))
+        return {}
+
+
+class LocalCOSStorage(COSStorage):
+    """使用 LocalObjectClient 的 COSStorage，分块传输及本地缓存的行为与 COS 一致"""
+
+    def __init__(self, root_dir: str, bucket: str = 'local', **kwargs):
+        super().__init__(client=LocalObjectClient(root_dir), bucket=bucket, region='local', **kwargs)
+
+    def url(self, filename: str) -> str:
+        return self.client._path(self.bucket, filename)
@@ -0,0 +1,104 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+from typing import List, Optional
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 旁路文件保存在数据文件所在目录下的该子目录中
+SIDECAR_DIR = '.sidecar'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def content_hash(path: str) -> str:
+    """分块计算文件内容的 sha1"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _paths(path: str, digest: str = None):
+    """旁路文件的索引（记录内容哈希及数据文件的 mtime/大小）及 parquet 路径"""
+    directory = os.path.join(os.path.dirname(os.path.abspath(path)), SIDECAR_DIR)
+    name = os.path.basename(path)
+    index = os.path.join(directory, f"{name}.json")
+    return index, os.path.join(directory, f"{name}.{digest}.parquet") if digest else None
+
+
+def find_sidecar(path: str, digest: str = None) -> Optional[str]:
+    """
+    查找数据文件有效的列式旁路文件：数据文件的 mtime 及大小与索引一致时直接使用（不计算哈希），
+    否则计算内容哈希（或使用传入的 digest）与索引比较，内容已变化的旁路文件视为过期
+    """
+    index_path, _ = _paths(path)
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    _, sidecar = _paths(path, index['hash'])
+    if not os.path.exists(sidecar):
+        return None
+    stat = os.stat(path)
+    if index.get('mtime') == stat.st_mtime and index.get('size') == stat.st_size:
+        return sidecar
+    if (digest or content_hash(path)) != index['hash']:
+        return None
+    # 内容未变（如文件被重新复制），更新索引中的 mtime 以免下次再计算哈希
+    _write_index(index_path, index['hash'], stat)
+    return sidecar
+
+
+def _write_index(index_path: str, digest: str, stat) -> None:
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump({'hash': digest, 'mtime': stat.st_mtime, 'size': stat.st_size}, f)
+
+
+def write_sidecar(path: str, df: pd.DataFrame, digest: str = None) -> Optional[str]:
+    """将解析后的数据写为 parquet 旁路文件并删除过期的旁路文件，无法写入（如没有 pyarrow、混合类型的列）时返回 None"""
+    digest = digest or content_hash(path)
+    index_path, sidecar = _paths(path, digest)
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    tmp = f"{sidecar}.part"
+    try:
+        df.to_parquet(tmp)
+        os.replace(tmp, sidecar)
+    except Exception as e:
+        logger.warning(f"Unable to write columnar sidecar for {path}: {str(e)}")
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return None
+    for stale in glob.glob(os.path.join(os.path.dirname(sidecar), glob.escape(os.path.basename(path)) + '.*.parquet')):
+        if stale != sidecar:
+            os.remove(stale)
+    _write_index(index_path, digest, os.stat(path))
+    return sidecar
+
+
+def parse_file(path: str, columns: List[str] = None) -> pd.DataFrame:
+    """按扩展名解析 CSV/xlsx 文件"""
+    if path.lower().endswith('.csv'):
+        return pd.read_csv(path, usecols=columns)
+    df = pd.read_excel(path)
+    return df[columns] if columns else df
+
+
+def read_file(path: str, columns: List[str] = None) -> pd.DataFrame:
+    """
+    读取 CSV/xlsx 数据文件：有有效的列式旁路文件时只读取需要的列，
+    否则解析原文件并写入旁路文件，之后的读取不再需要解析
+    Args:
+        path: 数据文件路径
+        columns: 只读取这些列，默认读取全部列
+    """
+    sidecar = find_sidecar(path)
+    if sidecar is not None:
+        return pd.read_parquet(sidecar, columns=columns)
+    df = parse_file(path)
+    write_sidecar(path, df)
+    return df[columns] if columns else df
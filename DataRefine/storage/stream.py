@@ -0,0 +1,91 @@
+import hashlib
+import io
+import os
+import tempfile
+from typing import BinaryIO, Optional, Tuple
+import pandas as pd
+
+# 上传文件每次读取/写入的字节数
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# CSV 每次解析的行数
+CSV_CHUNK_ROWS = 100000
+
+
+class FileTooLargeError(Exception):
+    """上传的文件超过大小限制"""
+
+
+class TeeReader(io.RawIOBase):
+    """
+    包装上传的文件流：解析器每读取一段数据，同时把这段数据写入存储，
+    上传的文件只读取一遍，不需要先完整保存到内存再解析
+    Args:
+        source: 上传的文件流
+        sink: 存储的写入对象（StorageBase.open_upload 的返回值）
+        max_size: 文件大小限制（字节），超过时抛出 FileTooLargeError
+    """
+
+    def __init__(self, source: BinaryIO, sink, max_size: Optional[int] = None):
+        self.source = source
+        self.sink = sink
+        self.max_size = max_size
+        self.size = 0
+        self.digest = hashlib.sha1()  # 内容哈希，用于列式旁路文件
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self.source.read(min(len(b), UPLOAD_CHUNK_SIZE))
+        if not data:
+            return 0
+        self.size += len(data)
+        if self.max_size is not None and self.size > self.max_size:
+            raise FileTooLargeError(f"File exceeds the {self.max_size} byte limit")
+        self.sink.write(data)
+        self.digest.update(data)
+        b[:len(data)] = data
+        return len(data)
+
+    def drain(self) -> None:
+        """把解析器没有读取的剩余数据也写入存储"""
+        buf = bytearray(UPLOAD_CHUNK_SIZE)
+        while self.readinto(buf):
+            pass
+
+
+def read_upload(source: BinaryIO, sink, filename: str, max_size: Optional[int] = None) -> Tuple[pd.DataFrame, str]:
+    """
+    边保存边解析上传的文件：CSV 按 CSV_CHUNK_ROWS 行分批解析后合并，
+    xlsx 是 zip 格式必须读取完整个文件才能解析，先分块写入存储及本地临时文件，再从临时文件解析
+    Args:
+        source: 上传的文件流
+        sink: 存储的写入对象
+        filename: 文件名，用于判断文件类型
+        max_size: 文件大小限制（字节）
+    Returns:
+        (解析后的数据, 文件内容的 sha1)
+    """
+    reader = TeeReader(source, sink, max_size=max_size)
+    if filename.lower().endswith('.csv'):
+        buffered = io.BufferedReader(reader, buffer_size=UPLOAD_CHUNK_SIZE)
+        chunks = list(pd.read_csv(buffered, chunksize=CSV_CHUNK_ROWS))
+        reader.drain()
+        if len(chunks) == 1:
+            return chunks[0], reader.digest.hexdigest()
+        df = pd.concat(chunks, ignore_index=True, copy=False)
+        del chunks
+        return df, reader.digest.hexdigest()
+
+    with tempfile.NamedTemporaryFile(suffix=os.path.splitext(filename)[1], delete=False) as tmp:
+        try:
+            buf = bytearray(UPLOAD_CHUNK_SIZE)
+            while True:
+                read = reader.readinto(buf)
+                if not read:
+                    break
+                tmp.write(buf[:read])
+            tmp.close()
+            return pd.read_excel(tmp.name), reader.digest.hexdigest()
+        finally:
+            os.remove(tmp.name)
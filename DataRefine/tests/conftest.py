@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from DataRefine.datasource.mysql import MySQLDataSource
+
+
+class SQLiteDataSource(MySQLDataSource):
+    """使用 SQLite 文件数据库的 MySQL 数据源，SQLite 同样支持反引号引用列名及 LIMIT/OFFSET"""
+
+    def create_engine(self):
+        return create_engine(f"sqlite:///{self.config['database']}", **self.pool_settings)
+
+    def estimate_rows(self, table_name):
+        return self.config.get('estimates', {}).get(table_name)
+
+
+@pytest.fixture
+def sqlite_datasource(tmpdir):
+    """创建包含 people 表的数据源，people 表以 id 为主键，age 中有大量重复值"""
+
+    def _build(**config):
+        datasource = SQLiteDataSource('test', dict(database=str(tmpdir.join('test.db')), **config))
+        df = pd.DataFrame(dict(id=range(1, 101), age=[20 + i % 3 for i in range(100)],
+                               name=[f'person {i}' for i in range(1, 101)]))
+        with datasource.engine.begin() as conn:
+            conn.exec_driver_sql("DROP TABLE IF EXISTS people")
+            conn.exec_driver_sql("CREATE TABLE people (id INTEGER PRIMARY KEY, age INTEGER, name TEXT)")
+        df.to_sql('people', datasource.engine, if_exists='append', index=False)
+        return datasource
+
+    return _build
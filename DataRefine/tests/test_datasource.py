@@ -0,0 +1,39 @@
+import pandas as pd
+
+from DataRefine.datasource.base import DataSource
+
+
+class ConfigDataSource(DataSource):
+    def create_engine(self):
+        raise NotImplementedError
+
+    def get_tables(self):
+        return []
+
+
+def test_build_sql_clauses_key_column():
+    """唯一键列被追加为最后一个排序键"""
+    datasource = ConfigDataSource('test', {'key_columns': {'people': 'id'}})
+    key_column = datasource.get_key_column('people')
+    assert key_column == 'id'
+    assert datasource.get_key_column('other') is None
+
+    _, order_by, _ = datasource.build_sql_clauses(sort=[['age', 'DESC']], key_column=key_column)
+    assert order_by == ' ORDER BY `age` DESC, `id` ASC'
+    _, order_by, _ = datasource.build_sql_clauses(sort=[['id', 'DESC']], key_column=key_column)
+    assert order_by == ' ORDER BY `id` DESC'
+    _, order_by, _ = datasource.build_sql_clauses(key_column=key_column)
+    assert order_by == ' ORDER BY `id` ASC'
+    _, order_by, _ = datasource.build_sql_clauses(sort=[['age', 'DESC']])
+    assert order_by == ' ORDER BY `age` DESC'
+
+
+def test_sorted_pages_are_stable(sqlite_datasource):
+    """按有重复值的列排序翻页时，各页之间的行不会重复或遗漏"""
+    datasource = sqlite_datasource()
+    assert datasource.get_key_column('people') == 'id'
+    sort = [['age', 'DESC']]
+    pages = [datasource.get_table_data('people', limit=30, offset=offset, sort=sort) for offset in range(0, 100, 30)]
+    df = pd.concat(pages, ignore_index=True)
+    assert list(df['id']) == list(df.sort_values(['age', 'id'], ascending=[False, True])['id'])
+    assert sorted(df['id']) == list(range(1, 101))
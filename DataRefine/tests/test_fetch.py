@@ -0,0 +1,100 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pandas as pd
+
+from DataRefine.datasource.fetch import fetch_dataframe
+
+
+class TypeObject:
+    """PEP 249 类型对象，与其包含的任一类型码相等"""
+
+    def __init__(self, *codes):
+        self.codes = codes
+
+    def __eq__(self, other):
+        return other in self.codes
+
+    def __hash__(self):
+        return hash(self.codes)
+
+
+# 类型码与 mysql-connector 的 FieldType 一致：VAR_STRING=253、BLOB(TEXT)=252、NEWDECIMAL=246
+DBAPI = SimpleNamespace(STRING=TypeObject(253, 254), BINARY=TypeObject(249, 250, 251, 252),
+                        NUMBER=TypeObject(3, 8, 246))
+
+
+class Cursor:
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.fetches = 0
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        self.fetches += 1
+        return batch
+
+
+def fetch(columns, rows, batch_size=2):
+    description = [(name, type_code) for name, type_code in columns]
+    cursor = Cursor(rows)
+    df = fetch_dataframe(cursor, description, dbapi=DBAPI, batch_size=batch_size)
+    return df, cursor
+
+
+def test_strings_and_text():
+    df, cursor = fetch(
+        [('name', 253), ('comment', 252), ('data', 252)],
+        [('a', 'some text', b'\x00\x01'), ('b', None, b'\x02'), ('c', 'more', None)]
+    )
+    assert cursor.fetches == 3
+    assert list(df['name']) == ['a', 'b', 'c']
+    # TEXT 与 BLOB 类型码相同，str 值保持为 str，只有 bytes 值为 bytes
+    assert list(df['comment']) == ['some text', None, 'more']
+    assert list(df['data']) == [b'\x00\x01', b'\x02', None]
+
+
+def test_numbers():
+    df, _ = fetch(
+        [('id', 3), ('price', 246), ('ratio', 8)],
+        [(1, Decimal('1.50'), 0.5), (2, Decimal('2.25'), None), (3, None, 1.5)]
+    )
+    assert df['id'].dtype == 'int64'
+    assert df['price'].dtype == 'float64'
+    assert list(df['price'].fillna(-1)) == [1.5, 2.25, -1]
+    assert df['ratio'].dtype == 'float64'
+
+
+def test_null_batches():
+    """只包含 NULL 的批次使用其它批次的类型"""
+    df, _ = fetch([('a', 3), ('b', 253), ('c', 253)],
+                  [(None, None, None), (None, None, None), (1, 'x', None), (2, None, None)])
+    assert list(df['a'].fillna(-1)) == [-1, -1, 1, 2]
+    assert df['a'].dtype == 'float64'
+    assert list(df['b']) == [None, None, 'x', None]
+    assert df['c'].isnull().all()
+
+
+def test_mixed_batches():
+    """各批次类型不同或同一批次中类型混合时由 pandas 推断"""
+    df, _ = fetch([('a', 3), ('b', None), ('c', None)],
+                  [(1, 1, 'x'), (2, 'y', 'z'), (2.5, 3, 4), (3.5, 'w', 5)])
+    assert df['a'].dtype == 'float64'
+    assert list(df['a']) == [1, 2, 2.5, 3.5]
+    assert list(df['b']) == [1, 'y', 3, 'w']
+    assert list(df['c']) == ['x', 'z', 4, 5]
+
+
+def test_empty():
+    df, _ = fetch([('a', 3), ('b', 253)], [])
+    assert list(df.columns) == ['a', 'b']
+    assert df.empty
+
+
+def test_sqlite(sqlite_datasource):
+    """通过数据源读取（sqlite3 驱动没有 PEP 249 类型对象，全部由 arrow 推断）"""
+    datasource = sqlite_datasource()
+    df = datasource.fetch_frame("SELECT id, age, name FROM people WHERE id <= 3")
+    pd.testing.assert_frame_equal(
+        df, pd.DataFrame(dict(id=[1, 2, 3], age=[20, 21, 22], name=['person 1', 'person 2', 'person 3']))
+    )
@@ -0,0 +1,127 @@
+import mock
+import pandas as pd
+from sqlalchemy import event
+
+from DataRefine.datasource.keyset import KeysetIndex, KeysetIndexCache
+
+
+def capture_queries(datasource):
+    """记录对 people 表执行的查询（不包括获取主键等元数据查询）"""
+    queries = []
+
+    def _capture(conn, cursor, statement, *args):
+        if 'FROM people' in statement:
+            queries.append(statement)
+
+    event.listen(datasource.engine, 'before_cursor_execute', _capture)
+    return queries
+
+
+def test_keyset_index():
+    index = KeysetIndex(10)
+    assert index.floor(25) == 20
+    assert index.nearest(25) == (0, None)
+    index.record(5, 'skipped')  # 非 interval 整数倍的位置不记录
+    index.record(20, 'k20')
+    index.record(10, 'k10')
+    assert len(index) == 3
+    assert index.nearest(9) == (0, None)
+    assert index.nearest(15) == (10, 'k10')
+    assert index.nearest(100) == (20, 'k20')
+
+
+def test_keyset_index_cache():
+    cache = KeysetIndexCache(interval=10, max_indexes=2)
+    a = cache.get('a')
+    assert cache.get('a') is a
+    assert cache.get('a', 'filtered') is not a
+    cache.get('b')  # 淘汰最久未使用的 ('a', None)
+    assert cache.get('a') is not a
+    cache.clear('a')
+    assert [k[0] for k in cache._indexes] == ['b']
+    cache.clear()
+    assert not len(cache._indexes)
+
+
+def test_sequential_pages(sqlite_datasource):
+    """顺序翻页记录检查点，之后的页从检查点 WHERE id > :last 开始而不是 OFFSET"""
+    datasource = sqlite_datasource(checkpoint_interval=10)
+    queries = capture_queries(datasource)
+    pages = [datasource.get_table_data('people', limit=25, offset=offset) for offset in range(0, 100, 25)]
+    df = pd.concat(pages, ignore_index=True)
+    assert list(df['id']) == list(range(1, 101))
+    index = datasource.keyset_checkpoints.get('people', '{}')
+    assert len(index) == 11
+    assert index.nearest(50) == (50, 50)
+    # 之后的页从最近的检查点开始，跳过的行数不超过检查点间隔
+    assert all('WHERE `id` > ' in q for q in queries[1:])
+    assert all(int(q.split('OFFSET')[1]) < 10 for q in queries[1:] if 'OFFSET' in q)
+
+
+def test_random_access(sqlite_datasource):
+    """跳转到没有检查点的位置时先只扫描键列定位检查点"""
+    datasource = sqlite_datasource(checkpoint_interval=10)
+    queries = capture_queries(datasource)
+    df = datasource.get_table_data('people', limit=5, offset=73)
+    assert list(df['id']) == list(range(74, 79))
+    assert queries[0].startswith('SELECT `id` FROM people')
+    assert datasource.keyset_checkpoints.get('people', '{}').nearest(73) == (70, 70)
+
+    df = datasource.get_table_data('people', limit=5, offset=71)
+    assert list(df['id']) == list(range(72, 77))
+    assert queries[-1].endswith('OFFSET 1')
+
+
+def test_filtered_pages(sqlite_datasource):
+    """过滤条件下的检查点与未过滤的检查点分开记录"""
+    datasource = sqlite_datasource(checkpoint_interval=10)
+    filters = dict(columnFilters=dict(age=dict(operand='=', value=[21], type='int',
+                                               meta=dict(column='age', type='int'))))
+    pages = [
+        datasource.get_table_data('people', limit=10, offset=offset, filters=filters) for offset in [0, 10, 20, 30]
+    ]
+    df = pd.concat(pages, ignore_index=True)
+    assert list(df['id']) == [i for i in range(1, 101) if i % 3 == 2]
+    assert len(datasource.keyset_checkpoints.get('people', '{}')) == 1
+
+
+def test_sorted_pages_use_offset(sqlite_datasource):
+    """按键列降序或其它列排序时回退到 LIMIT/OFFSET"""
+    datasource = sqlite_datasource(checkpoint_interval=10)
+    queries = capture_queries(datasource)
+    df = datasource.get_table_data('people', limit=5, offset=10, sort=[['id', 'DESC']])
+    assert list(df['id']) == list(range(90, 85, -1))
+    assert queries[-1].endswith('LIMIT 5 OFFSET 10')
+
+    # 按键列升序排序与不排序一样使用键集分页
+    df = datasource.get_table_data('people', limit=5, offset=10, sort=[['id', 'ASC']])
+    assert list(df['id']) == list(range(11, 16))
+    assert 'WHERE `id` > ' in queries[-1]
+
+
+def test_keyset_pagination_disabled(sqlite_datasource):
+    datasource = sqlite_datasource(keyset_pagination=False)
+    queries = capture_queries(datasource)
+    df = datasource.get_table_data('people', limit=5, offset=10)
+    assert list(df['id']) == list(range(11, 16))
+    assert queries[-1].endswith('ORDER BY `id` ASC LIMIT 5 OFFSET 10')
+
+
+def test_key_column(sqlite_datasource):
+    datasource = sqlite_datasource(key_columns={'people': 'name'})
+    assert datasource.get_key_column('people') == 'name'
+    assert datasource.get_key_column('main.people') == 'name'
+
+    datasource = sqlite_datasource()
+    assert datasource.get_key_column('main.people') == 'id'
+    with datasource.engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE no_key (a INTEGER, b INTEGER)")
+    assert datasource.get_key_column('no_key') is None
+
+
+def test_key_column_failure_not_cached(sqlite_datasource):
+    """获取主键失败（如连接暂时不可用）时不缓存结果，下次重试"""
+    datasource = sqlite_datasource()
+    with mock.patch('DataRefine.datasource.mysql.inspect', side_effect=Exception('connection lost')):
+        assert datasource.get_key_column('people') is None
+    assert datasource.get_key_column('people') == 'id'
@@ -0,0 +1,101 @@
+import datetime
+import time
+
+import pandas as pd
+
+import dtale.global_state as global_state
+from DataRefine.datasource.partition import ExtractProgress, load_partitions, split_range
+
+
+def test_split_range_numbers():
+    assert split_range(1, 100, 4) == [(1, 26), (26, 51), (51, 76), (76, 101)]
+    assert split_range(1, 3, 10) == [(1, 2), (2, 3), (3, 4)]  # 分区数不超过整数的个数
+    assert split_range(5, 5, 4) == [(5, 6)]
+    assert split_range(0.0, 1.0, 2) == [(0.0, 0.5), (0.5, 1.0)]
+    assert split_range(1.5, 1.5, 3) == [(1.5, 1.5)]
+    assert all(isinstance(v, int) for r in split_range(pd.Series([1]).values[0], 10, 3) for v in r)
+
+
+def test_split_range_dates():
+    ranges = split_range(datetime.date(2024, 1, 1), datetime.date(2024, 1, 5), 4)
+    assert ranges == [(datetime.date(2024, 1, i), datetime.date(2024, 1, i + 1)) for i in range(1, 5)]
+    ranges = split_range(datetime.date(2024, 1, 1), datetime.date(2024, 1, 2), 4)
+    assert ranges == [(datetime.date(2024, 1, 1), datetime.date(2024, 1, 2))]
+
+    start, end = datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 1, 12)
+    ranges = split_range(start, end, 3)
+    assert [r[0].hour for r in ranges] == [0, 4, 8]
+    assert ranges[-1][1] == end
+
+
+def test_split_range_unsupported():
+    assert split_range('a', 'z', 4) == []
+    assert split_range(None, 10, 4) == []
+    assert split_range(1, 10, 0) == []
+
+
+def test_load_partitions():
+    progress = ExtractProgress()
+    updates = []
+    frames = [pd.DataFrame(dict(a=[i] * (i % 2))) for i in range(5)]
+    df = load_partitions(lambda i: frames[i], 5, 2, progress=progress, callback=updates.append)
+    assert list(df['a']) == [1, 3]
+    assert len(updates) == 5
+    assert progress.to_dict()['partitions'] == 5
+    assert progress.to_dict()['done'] == 5
+    assert progress.to_dict()['rows'] == 2
+
+
+def test_load_table(sqlite_datasource):
+    datasource = sqlite_datasource(partition_columns={'people': 'age'}, pool={'pool_size': 3})
+    with datasource.engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO people (id, age, name) VALUES (101, NULL, 'no age')")
+    expected = datasource.fetch_frame("SELECT * FROM people ORDER BY id")
+
+    progress = ExtractProgress()
+    df = datasource.load_table('people', partitions=3, progress=progress)
+    pd.testing.assert_frame_equal(df.sort_values('id').reset_index(drop=True), expected)
+    assert progress.to_dict()['partitions'] == 3
+    assert progress.to_dict()['rows'] == 101
+
+    # 没有配置 partition_columns 时使用主键拆分，分区数默认来自估算行数
+    del datasource.config['partition_columns']
+    datasource.config['estimates'] = {'people': 101}
+    df = datasource.load_table('people', workers=4)
+    assert list(df['id']) == list(expected['id'])
+
+    with datasource.engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE no_key (a INTEGER)")
+        conn.exec_driver_sql("INSERT INTO no_key VALUES (1), (2)")
+    progress = ExtractProgress()
+    df = datasource.load_table('no_key', progress=progress)  # 没有可拆分的列时使用单条查询
+    assert list(df['a']) == [1, 2]
+    assert progress.to_dict()['partitions'] == 1
+
+
+def test_start_table_load(tmpdir, sqlite_datasource):
+    """不同数据源中的同名表分别载入为不同名称的实例，重新抽取时复用原来的实例"""
+    import DataRefine.app as app
+
+    first = sqlite_datasource()
+    second = type(first)('other', dict(database=str(tmpdir.join('other.db'))))
+    pd.DataFrame(dict(id=[1, 2], age=[30, 40])).to_sql('people', second.engine, index=False)
+
+    def _wait(load):
+        while load['status'] == 'running':
+            time.sleep(0.05)
+        assert load['status'] == 'done', load['error']
+        return load['data_id']
+
+    try:
+        first_id = _wait(app.start_table_load('test', 'people', first))
+        second_id = _wait(app.start_table_load('other', 'people', second))
+        assert first_id != second_id
+        assert global_state.get_name(first_id) == 'test.people'
+        assert global_state.get_name(second_id) == 'other.people'
+        assert len(global_state.get_data(second_id)) == 2
+
+        assert _wait(app.start_table_load('test', 'people', first)) == first_id
+    finally:
+        app.TABLE_LOADS.clear()
+        global_state.cleanup()
@@ -0,0 +1,184 @@
+import threading
+import time
+
+import mock
+import pytest
+
+from DataRefine.datasource.hive import HiveDataSource
+from DataRefine.datasource.pool import ConnectionPool, PoolTimeoutError, pool_settings
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def execute(self, query, params=None):
+        if self.conn.broken:
+            raise Exception('connection reset')
+        self.conn.queries.append(query)
+        self.rows = self.conn.results.get(query, [(1,)])
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class FakeConnection:
+    def __init__(self, results=None):
+        self.broken = False
+        self.closed = False
+        self.queries = []
+        self.results = results or {}
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+class Creator:
+    def __init__(self, results=None):
+        self.results = results
+        self.connections = []
+
+    def __call__(self):
+        conn = FakeConnection(self.results)
+        self.connections.append(conn)
+        return conn
+
+
+def test_pool_settings():
+    settings = pool_settings({'pool_size': 2, 'unknown': 1}, None, {'pool_timeout': 5})
+    assert settings['pool_size'] == 2
+    assert settings['pool_timeout'] == 5
+    assert settings['max_overflow'] == 10
+    assert 'unknown' not in settings
+
+
+def test_checkout_reuses_connections():
+    creator = Creator()
+    pool = ConnectionPool(creator, pool_size=1, max_overflow=1, pool_pre_ping=False)
+    with pool.connection() as a:
+        with pool.connection() as b:
+            assert a is not b
+            assert pool.status()['checked_out'] == 2
+    # 超过 pool_size 的连接归还时被关闭
+    assert pool.status()['idle'] == 1
+    assert pool.status()['connections'] == 1
+    assert sum(c.closed for c in creator.connections) == 1
+    with pool.connection() as c:
+        assert c in (a, b) and not c.closed
+    assert len(creator.connections) == 2
+    status = pool.status()
+    assert status['checkouts'] == 3
+    assert status['checked_out'] == 0
+
+    pool.dispose()
+    assert pool.status()['idle'] == 0
+    assert all(c.closed for c in creator.connections)
+
+
+def test_checkout_timeout():
+    pool = ConnectionPool(Creator(), pool_size=1, max_overflow=0, pool_timeout=0.1, pool_pre_ping=False)
+    with pool.connection():
+        with pytest.raises(PoolTimeoutError):
+            with pool.connection():
+                pass
+    status = pool.status()
+    assert status['waits'] == 1
+    assert status['timeouts'] == 1
+    with pool.connection():  # 超时后不会占用名额
+        pass
+
+
+def test_checkout_waits_for_checkin():
+    pool = ConnectionPool(Creator(), pool_size=1, max_overflow=0, pool_timeout=5, pool_pre_ping=False)
+    released = threading.Event()
+
+    def _hold():
+        with pool.connection():
+            released.wait(5)
+
+    thread = threading.Thread(target=_hold)
+    thread.start()
+    while pool.status()['checked_out'] == 0:
+        time.sleep(0.01)
+    threading.Timer(0.1, released.set).start()
+    with pool.connection():
+        pass
+    thread.join()
+    assert pool.status()['waits'] == 1
+    assert pool.status()['timeouts'] == 0
+
+
+def test_recycle():
+    creator = Creator()
+    pool = ConnectionPool(creator, pool_size=1, max_overflow=0, pool_recycle=60, pool_pre_ping=False)
+    with pool.connection() as first:
+        pass
+    with mock.patch('DataRefine.datasource.pool.time.time', return_value=time.time() + 120):
+        with pool.connection() as second:
+            pass
+    assert first.closed
+    assert second is not first
+
+
+def test_pre_ping():
+    creator = Creator()
+    pool = ConnectionPool(creator, pool_size=1, max_overflow=0)
+    with pool.connection() as first:
+        pass
+    first.broken = True
+    with pool.connection() as second:
+        assert second is not first
+    assert first.closed
+    assert pool.status()['invalidated'] == 1
+    assert pool.health_check()
+
+
+def test_invalidate_on_error():
+    creator = Creator()
+    pool = ConnectionPool(creator, pool_size=1, max_overflow=0, pool_pre_ping=False)
+    with pytest.raises(ValueError):
+        with pool.connection():
+            raise ValueError('bad query')  # 连接仍然可用，正常归还
+    assert pool.status()['idle'] == 1
+
+    with pytest.raises(Exception):
+        with pool.connection() as conn:
+            conn.broken = True
+            conn.cursor().execute('SELECT * FROM t')
+    assert conn.closed
+    status = pool.status()
+    assert (status['idle'], status['connections'], status['invalidated']) == (0, 0, 1)
+
+
+def test_hive_get_tables():
+    datasource = HiveDataSource('hive', {'host': 'localhost', 'port': 10000, 'database': 'default',
+                                         'username': 'u', 'password': 'p', 'pool': {'pool_pre_ping': False}})
+    creator = Creator({
+        'SHOW DATABASES': [('default',), ('sales',)],
+        'SHOW TABLES IN `default`': [('people',)],
+        'SHOW TABLES IN `sales`': [('orders',), ('items',)],
+    })
+    datasource.pool.creator = creator
+    assert datasource.get_tables() == [
+        {'name': 'people', 'schema': 'default'},
+        {'name': 'orders', 'schema': 'sales'},
+        {'name': 'items', 'schema': 'sales'},
+    ]
+    assert len(creator.connections) == 1
+    assert datasource.pool_status()['checked_out'] == 0
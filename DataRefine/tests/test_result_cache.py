@@ -0,0 +1,120 @@
+import os
+import time
+
+import mock
+import pandas as pd
+
+from DataRefine.datasource.manager import DataSourceManager
+from DataRefine.datasource.result_cache import ResultCache, deserialize_frame, serialize_frame
+
+
+def frame(rows=100, offset=0):
+    return pd.DataFrame(dict(a=range(offset, offset + rows), b=[f'value {i}' for i in range(rows)]))
+
+
+def test_serialize_frame():
+    df = frame()
+    data = serialize_frame(df)
+    assert data[:1] == b'A'
+    pd.testing.assert_frame_equal(deserialize_frame(data), df)
+
+    mixed = pd.DataFrame(dict(a=[1, 'x', 2.5]))  # arrow 无法表示混合类型的 object 列
+    data = serialize_frame(mixed)
+    assert data[:1] == b'P'
+    pd.testing.assert_frame_equal(deserialize_frame(data), mixed)
+
+
+def test_ttl():
+    cache = ResultCache(ttl=60)
+    cache.set_ttl('slow', 600)
+    cache.put(('fast', 'people', 0), frame())
+    cache.put(('slow', 'people', 0), frame())
+    pd.testing.assert_frame_equal(cache.get(('fast', 'people', 0)), frame())
+
+    with mock.patch('DataRefine.datasource.result_cache.time.time', return_value=time.time() + 120):
+        assert cache.get(('fast', 'people', 0)) is None
+        assert cache.get(('slow', 'people', 0)) is not None
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['expired'], stats['entries']) == (2, 1, 1, 1)
+    assert stats['hit_rate'] == 2 / 3
+
+
+def test_eviction():
+    size = len(serialize_frame(frame()))
+    cache = ResultCache(max_bytes=size * 2 + size // 2)
+    for i in range(3):
+        cache.put(('ds', 'people', i), frame(offset=i))
+        if i == 1:
+            cache.get(('ds', 'people', 0))  # 0 成为最近使用的，1 先被淘汰
+    assert cache.get(('ds', 'people', 1)) is None
+    assert cache.get(('ds', 'people', 0)) is not None
+    assert cache.get(('ds', 'people', 2)) is not None
+    stats = cache.stats()
+    assert (stats['evictions'], stats['entries']) == (1, 2)
+    assert stats['bytes'] <= stats['max_bytes']
+
+    cache.put(('ds', 'people', 0), frame(offset=5))  # 替换已有的结果不会重复计算字节数
+    assert cache.stats()['bytes'] == 2 * size
+    assert cache.get(('ds', 'people', 0))['a'].iloc[0] == 5
+
+    cache.put(('ds', 'huge', 0), frame(rows=10000))  # 超过 max_bytes 的结果不缓存
+    assert cache.get(('ds', 'huge', 0)) is None
+    assert cache.stats()['entries'] == 2
+
+
+def test_directory(tmpdir):
+    directory = str(tmpdir.join('results'))
+    size = len(serialize_frame(frame()))
+    cache = ResultCache(max_bytes=size * 2, directory=directory)
+    cache.put(('ds', 'people', 0), frame())
+    cache.put(('ds', 'people', 1), frame(offset=1))
+    assert len(os.listdir(directory)) == 2
+    pd.testing.assert_frame_equal(cache.get(('ds', 'people', 1)), frame(offset=1))
+
+    cache.put(('ds', 'people', 2), frame(offset=2))  # 淘汰时删除文件
+    assert len(os.listdir(directory)) == 2
+    assert cache.get(('ds', 'people', 0)) is None
+
+    os.remove(cache._path(('ds', 'people', 2)))  # 文件被外部删除时视为未缓存
+    assert cache.get(('ds', 'people', 2)) is None
+
+    assert cache.invalidate('ds') == 2
+    assert os.listdir(directory) == []
+
+
+def test_invalidate():
+    cache = ResultCache()
+    for key in [('a', 'people', 0), ('a', 'people', 1), ('a', 'orders', 0), ('b', 'people', 0)]:
+        cache.put(key, frame(rows=5))
+    assert cache.invalidate('a', 'people') == 2
+    assert cache.get(('a', 'orders', 0)) is not None
+    assert cache.invalidate('b') == 1
+    assert cache.invalidate() == 1
+    assert cache.stats()['invalidations'] == 4
+    assert cache.stats()['bytes'] == 0
+
+
+def test_manager_invalidation_hooks(tmpdir, sqlite_datasource):
+    config = tmpdir.join('datasources.yaml')
+    config.write(
+        f"cache:\n"
+        f"  max_bytes: 1048576\n"
+        f"  ttl: 30\n"
+        f"  directory: {tmpdir.join('cache')}\n"
+        f"datasources: []\n"
+    )
+    manager = DataSourceManager(str(config))
+    assert (manager.result_cache.max_bytes, manager.result_cache.ttl) == (1048576, 30)
+    datasource = sqlite_datasource(checkpoint_interval=10)
+    manager.datasources['test'] = datasource
+    datasource.get_table_data('people', limit=10, offset=20)
+    assert len(datasource.keyset_checkpoints.get('people', '{}')) > 1
+
+    calls = []
+    manager.add_invalidation_hook(lambda *args: calls.append(args))
+    manager.result_cache.put(('test', 'people', 0), frame())
+    manager.result_cache.put(('test', 'orders', 0), frame())
+    assert manager.invalidate('test', 'people') == 1
+    assert calls == [('test', 'people')]
+    assert len(datasource.keyset_checkpoints.get('people', '{}')) == 1
+    assert manager.result_cache.get(('test', 'orders', 0)) is not None
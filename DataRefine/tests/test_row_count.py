@@ -0,0 +1,134 @@
+import threading
+import time
+
+import mock
+import pandas as pd
+
+import dtale.global_state as global_state
+from DataRefine.datasource.base import DataSource
+from DataRefine.datasource.paging import TablePageSource
+from DataRefine.datasource.row_count import RowCountService
+
+
+class CountingDataSource(DataSource):
+    """COUNT(*) 会阻塞到 release 被设置，用于模拟大表上耗时的精确计数"""
+
+    def __init__(self, df, estimate=None):
+        super().__init__('test', {})
+        self.df = df
+        self.estimate = estimate
+        self.counts = 0
+        self.release = threading.Event()
+
+    def create_engine(self):
+        raise NotImplementedError
+
+    def get_tables(self):
+        return []
+
+    def estimate_rows(self, table_name):
+        return self.estimate
+
+    def count_rows(self, table_name, filters=None):
+        self.release.wait(5)
+        self.counts += 1
+        return len(self.df)
+
+    def get_table_data(self, table_name, limit=10000, offset=0, filters=None, sort=None):
+        return self.df.iloc[offset:offset + limit].reset_index(drop=True)
+
+
+def wait_for_refresh(row_counts, datasource):
+    with row_counts._lock:
+        refreshing = row_counts._refreshing.get((datasource.name, 'people'))
+    if refreshing is not None:
+        refreshing.wait(5)
+
+
+def test_estimate_then_exact():
+    datasource = CountingDataSource(pd.DataFrame(dict(a=range(120))), estimate=100)
+    row_counts = RowCountService(ttl=300)
+    notified = []
+    row_counts.add_listener(lambda *args: notified.append(args))
+
+    assert row_counts.get(datasource, 'people') == {'total_rows': 100, 'exact': False, 'refreshing': True}
+    datasource.release.set()
+    wait_for_refresh(row_counts, datasource)
+    assert row_counts.peek('test', 'people') == {'total_rows': 120, 'exact': True, 'refreshing': False}
+    assert notified == [('test', 'people', 120)]
+
+    # 有效的精确值不会被估算值覆盖，也不会再执行 COUNT(*)
+    assert row_counts.get_exact(datasource, 'people') == 120
+    assert row_counts._store(('test', 'people'), 100, False)['total_rows'] == 120
+    assert datasource.counts == 1
+
+
+def test_ttl_and_invalidate():
+    datasource = CountingDataSource(pd.DataFrame(dict(a=range(10))))
+    datasource.release.set()
+    row_counts = RowCountService(ttl=-1, estimate=False)
+    assert row_counts.get(datasource, 'people') == {'total_rows': 10, 'exact': True, 'refreshing': False}
+    assert row_counts.peek('test', 'people') is None
+    row_counts.get_exact(datasource, 'people')
+    assert datasource.counts == 2  # 缓存立即过期
+
+    row_counts = RowCountService(ttl=300, estimate=False)
+    row_counts.get_exact(datasource, 'people')
+    row_counts.invalidate('test', 'other')
+    assert row_counts.peek('test', 'people') is not None
+    row_counts.invalidate('test')
+    assert row_counts.peek('test', 'people') is None
+
+
+def test_paged_instance_rows():
+    """分页实例先使用估算行数，不等待精确计数；精确行数完成或数据失效后更新"""
+    df = pd.DataFrame(dict(a=range(120)))
+    datasource = CountingDataSource(df, estimate=100)
+    row_counts = RowCountService(ttl=300)
+    source = TablePageSource(datasource, 'people', row_counts=row_counts)
+    instance = global_state.DtalePagedInstance(source, block_size=50, sample_size=10)
+    row_counts.add_listener(lambda *args: instance.refresh_rows())
+    assert instance.rows() == 100
+    assert len(instance.load_data(row_range=[90, 100])) == 10
+
+    datasource.release.set()
+    wait_for_refresh(row_counts, datasource)
+    assert instance.rows() == 120
+    assert list(instance.load_data(row_range=[110, 130])['a']) == list(range(110, 120))
+
+    datasource.df = df.head(60)
+    row_counts.invalidate('test', 'people')
+    datasource.estimate = None
+    instance.clear_cache()
+    assert instance.rows() == 60
+    assert len(instance.load_data(row_range=[50, 100])) == 10
+
+
+def test_get_paged_instance_concurrent(sqlite_datasource):
+    """并发打开同一张表时只创建一个分页实例"""
+    import DataRefine.app as app
+
+    datasource = sqlite_datasource()
+    startup_paged = app.startup_paged
+
+    def slow_startup(*args, **kwargs):
+        time.sleep(0.1)  # 让其他请求在实例注册之前进入
+        return startup_paged(*args, **kwargs)
+
+    data_ids = []
+    try:
+        with mock.patch('DataRefine.app.startup_paged', side_effect=slow_startup) as startup:
+            threads = [
+                threading.Thread(target=lambda: data_ids.append(app.get_paged_instance('test', 'people', datasource)))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert startup.call_count == 1
+        assert len(set(data_ids)) == 1 and len(data_ids) == 4
+        assert global_state.size() == 1
+    finally:
+        app.DATASOURCE_INSTANCES.clear()
+        global_state.cleanup()
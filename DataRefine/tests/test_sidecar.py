@@ -0,0 +1,101 @@
+import os
+import shutil
+
+import mock
+import pandas as pd
+
+from DataRefine.storage import sidecar
+from DataRefine.storage.sidecar import content_hash, find_sidecar, read_file, write_sidecar
+
+
+def build_csv(tmpdir, rows=10, name='people.csv'):
+    df = pd.DataFrame(dict(id=range(rows), age=[20 + i % 3 for i in range(rows)],
+                           name=[f'person {i}' for i in range(rows)]))
+    path = str(tmpdir.join(name))
+    df.to_csv(path, index=False)
+    return path, df
+
+
+def test_read_file(tmpdir):
+    path, df = build_csv(tmpdir)
+    assert find_sidecar(path) is None
+    pd.testing.assert_frame_equal(read_file(path), df)
+    found = find_sidecar(path)
+    assert found == os.path.join(str(tmpdir), '.sidecar', f'people.csv.{content_hash(path)}.parquet')
+
+    # 有旁路文件时不再解析 CSV，只读取需要的列
+    with mock.patch('DataRefine.storage.sidecar.pd.read_csv') as read_csv:
+        with mock.patch('DataRefine.storage.sidecar.pd.read_parquet', wraps=pd.read_parquet) as read_parquet:
+            output = read_file(path, columns=['name', 'age'])
+    read_csv.assert_not_called()
+    assert read_parquet.call_args[1]['columns'] == ['name', 'age']
+    pd.testing.assert_frame_equal(output, df[['name', 'age']])
+
+
+def test_read_file_columns_without_sidecar(tmpdir):
+    path, df = build_csv(tmpdir)
+    with mock.patch('DataRefine.storage.sidecar.write_sidecar') as write:
+        pd.testing.assert_frame_equal(read_file(path, columns=['age']), df[['age']])
+    pd.testing.assert_frame_equal(write.call_args[0][1], df)  # 旁路文件包含全部列
+
+
+def test_mtime_unchanged(tmpdir):
+    path, df = build_csv(tmpdir)
+    write_sidecar(path, df)
+    # mtime 及大小与索引一致时不计算哈希
+    with mock.patch('DataRefine.storage.sidecar.content_hash') as hash_file:
+        assert find_sidecar(path) is not None
+    hash_file.assert_not_called()
+
+
+def test_mtime_changed_same_content(tmpdir):
+    path, df = build_csv(tmpdir)
+    expected = write_sidecar(path, df)
+    os.utime(path, (1000, 1000))  # 如文件被重新复制，内容未变
+    with mock.patch('DataRefine.storage.sidecar.content_hash', wraps=content_hash) as hash_file:
+        assert find_sidecar(path) == expected
+        assert hash_file.call_count == 1
+        # 索引已更新为新的 mtime，下次不再计算哈希
+        assert find_sidecar(path) == expected
+        assert hash_file.call_count == 1
+
+    # 传入 digest 时使用传入的哈希
+    os.utime(path, (2000, 2000))
+    with mock.patch('DataRefine.storage.sidecar.content_hash') as hash_file:
+        assert find_sidecar(path, digest=content_hash(path)) == expected
+    hash_file.assert_not_called()
+
+
+def test_content_changed(tmpdir):
+    path, df = build_csv(tmpdir)
+    old = write_sidecar(path, df)
+    stat = os.stat(path)
+    changed = df.assign(name=df['name'].str.replace('person', 'member'))
+    changed.to_csv(path, index=False)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    assert os.path.getsize(path) == stat.st_size  # 大小不变，按内容哈希判断为过期
+    assert find_sidecar(path) is None
+
+    # 重新读取时写入新的旁路文件并删除过期的旁路文件
+    pd.testing.assert_frame_equal(read_file(path), changed)
+    new = find_sidecar(path)
+    assert new is not None and new != old
+    assert not os.path.exists(old)
+
+
+def test_missing_sidecar(tmpdir):
+    path, df = build_csv(tmpdir)
+    found = write_sidecar(path, df)
+    os.remove(found)
+    assert find_sidecar(path) is None
+
+    shutil.rmtree(os.path.dirname(found))
+    assert find_sidecar(path) is None
+
+
+def test_write_sidecar_failure(tmpdir):
+    path, _ = build_csv(tmpdir)
+    mixed = pd.DataFrame(dict(a=[1, 'x', 2.5]))  # 混合类型的 object 列无法写为 parquet
+    assert write_sidecar(path, mixed) is None
+    assert find_sidecar(path) is None
+    assert [f for f in os.listdir(os.path.join(str(tmpdir), sidecar.SIDECAR_DIR)) if f.endswith('.part')] == []
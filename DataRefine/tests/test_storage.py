@@ -0,0 +1,192 @@
+import io
+import os
+
+import mock
+import pytest
+
+from DataRefine.storage import LocalCOSStorage
+from DataRefine.storage.cache import LocalFileCache
+from DataRefine.storage.local_cos import LocalObjectClient
+
+
+def content(size):
+    return bytes(i % 251 for i in range(size))
+
+
+def build_storage(tmpdir, **kwargs):
+    return LocalCOSStorage(str(tmpdir.join('objects')), part_size=100, multipart_threshold=250, max_workers=2,
+                           **kwargs)
+
+
+def test_local_object_client(tmpdir):
+    client = LocalObjectClient(str(tmpdir))
+    client.put_object(Bucket='b', Body=b'0123456789', Key='a.csv')
+    assert client.head_object(Bucket='b', Key='a.csv')['Content-Length'] == '10'
+    assert client.get_object(Bucket='b', Key='a.csv')['Body'].get_raw_stream().read() == b'0123456789'
+    assert client.get_object(Bucket='b', Key='a.csv', Range='bytes=2-4')['Body'].get_raw_stream().read() == b'234'
+
+    upload_id = client.create_multipart_upload(Bucket='b', Key='c.csv')['UploadId']
+    parts = [client.upload_part(Bucket='b', Key='c.csv', Body=body, PartNumber=number, UploadId=upload_id)
+             for number, body in [(2, b'def'), (1, b'abc')]]
+    assert [p['ETag'] for p in parts] == [f'"{upload_id}-2"', f'"{upload_id}-1"']
+    client.complete_multipart_upload(Bucket='b', Key='c.csv', UploadId=upload_id, MultipartUpload={'Part': [
+        {'PartNumber': 2}, {'PartNumber': 1}
+    ]})
+    assert client.get_object(Bucket='b', Key='c.csv')['Body'].get_raw_stream().read() == b'abcdef'
+
+    client.delete_object(Bucket='b', Key='a.csv')
+    assert not os.path.exists(client._path('b', 'a.csv'))
+
+
+def test_single_upload(tmpdir):
+    storage = build_storage(tmpdir)
+    data = content(250)
+    location = storage.upload(io.BytesIO(data), 'small.csv')
+    assert storage.client.requests == ['put_object']
+    with open(location, 'rb') as f:
+        assert f.read() == data
+
+
+def test_multipart_upload(tmpdir):
+    storage = build_storage(tmpdir)
+    data = content(1050)
+    location = storage.upload(io.BytesIO(data), 'large.csv')
+    requests = storage.client.requests
+    assert requests[0] == 'create_multipart_upload'
+    assert requests.count('upload_part') == 11  # 10 个 100 字节的分块及最后 50 字节
+    assert requests[-1] == 'complete_multipart_upload'
+    assert 'put_object' not in requests
+    with open(location, 'rb') as f:
+        assert f.read() == data
+
+    # 通过 open_upload 分块写入的效果相同
+    with storage.open_upload('written.csv') as sink:
+        for i in range(0, len(data), 64):
+            sink.write(data[i:i + 64])
+    with open(sink.location, 'rb') as f:
+        assert f.read() == data
+
+
+def test_multipart_upload_abort(tmpdir):
+    storage = build_storage(tmpdir)
+    upload_part = storage.client.upload_part
+
+    def failing_part(**kwargs):
+        if kwargs['PartNumber'] == 3:
+            raise IOError('connection reset')
+        return upload_part(**kwargs)
+
+    with mock.patch.object(storage.client, 'upload_part', side_effect=failing_part):
+        with pytest.raises(IOError):
+            storage.upload(io.BytesIO(content(1050)), 'large.csv')
+    assert storage.client.requests[-1] == 'abort_multipart_upload'
+    assert 'complete_multipart_upload' not in storage.client.requests
+    assert storage.client._uploads == {}
+    assert not os.path.exists(storage.url('large.csv'))
+
+
+def test_ranged_download(tmpdir):
+    storage = build_storage(tmpdir)
+    data = content(1050)
+    storage.upload(io.BytesIO(data), 'large.csv')
+    storage.client.requests = []
+    with storage.download('large.csv') as f:
+        assert f.read() == data
+    assert storage.client.requests.count('get_object') == 11
+
+    storage.upload(io.BytesIO(content(100)), 'small.csv')
+    storage.client.requests = []
+    with storage.download('small.csv') as f:
+        assert f.read() == content(100)
+    assert storage.client.requests == ['head_object', 'get_object']
+
+    assert storage.download('missing.csv') is None
+    assert storage.local_path('large.csv') is None  # 没有开启本地缓存
+
+
+def test_download_cache(tmpdir):
+    cache_dir = str(tmpdir.join('cache'))
+    storage = build_storage(tmpdir, cache_dir=cache_dir)
+    data = content(1050)
+    storage.upload(io.BytesIO(data), 'large.csv')
+    storage.client.requests = []
+
+    # 上传时已写入缓存，打开时不需要下载
+    with storage.download('large.csv') as f:
+        assert f.read() == data
+    assert storage.client.requests == []
+    path = storage.local_path('large.csv')
+    assert path.startswith(cache_dir) and path.endswith('.csv')
+
+    # 缓存被删除后重新下载并写入缓存
+    storage.cache.remove('large.csv')
+    with storage.download('large.csv') as f:
+        assert f.read() == data
+    assert storage.client.requests.count('get_object') == 11
+    storage.client.requests = []
+    with storage.download('large.csv') as f:
+        assert f.read() == data
+    assert storage.client.requests == []
+
+    # 重启后从缓存目录恢复已有的缓存
+    reopened = build_storage(tmpdir, cache_dir=cache_dir)
+    with reopened.download('large.csv') as f:
+        assert f.read() == data
+    assert reopened.client.requests == []
+
+    storage.delete('large.csv')
+    assert storage.cache.get('large.csv') is None
+    assert not os.path.exists(path)
+    assert storage.download('large.csv') is None
+
+
+def test_cache_lru(tmpdir):
+    cache = LocalFileCache(str(tmpdir), max_bytes=250)
+    for key in ['a.csv', 'b.csv']:
+        with cache.writer(key) as f:
+            f.write(content(100))
+    assert cache.get('a.csv') is not None  # a.csv 变为最近使用
+
+    with cache.writer('c.csv') as f:
+        f.write(content(100))
+    assert cache.get('b.csv') is None
+    assert not os.path.exists(cache.path('b.csv'))
+    assert cache.get('a.csv') is not None
+    assert cache.get('c.csv') is not None
+    assert cache._bytes == 200
+
+    # 单个文件超过上限时仍然保留
+    with cache.writer('d.csv') as f:
+        f.write(content(300))
+    assert [cache.get(k) is not None for k in ['a.csv', 'c.csv', 'd.csv']] == [False, False, True]
+    assert cache._bytes == 300
+
+    # 写入出错时丢弃临时文件
+    with pytest.raises(ValueError):
+        with cache.writer('e.csv') as f:
+            f.write(content(100))
+            raise ValueError('failed')
+    assert cache.get('e.csv') is None
+    assert [f for f in os.listdir(str(tmpdir)) if f.endswith('.part')] == []
+
+    # 缓存文件被外部删除时视为未缓存
+    os.remove(cache.path('d.csv'))
+    assert cache.get('d.csv') is None
+    assert cache._bytes == 0
+
+
+def test_cache_reopen(tmpdir):
+    cache = LocalFileCache(str(tmpdir), max_bytes=250)
+    for i, key in enumerate(['a.csv', 'b.csv']):
+        with cache.writer(key) as f:
+            f.write(content(100))
+        os.utime(cache.path(key), (1000 + i, 1000 + i))
+
+    reopened = LocalFileCache(str(tmpdir), max_bytes=250)
+    assert reopened._bytes == 200
+    assert reopened.get('a.csv') == cache.path('a.csv')
+    # 按修改时间恢复使用顺序，b.csv 比刚读取过的 a.csv 更早被淘汰
+    with reopened.writer('c.csv') as f:
+        f.write(content(100))
+    assert reopened.get('b.csv') is None
+    assert reopened.get('a.csv') is not None
@@ -0,0 +1,94 @@
+import hashlib
+import io
+
+import mock
+import pandas as pd
+import pytest
+
+from DataRefine.storage.stream import FileTooLargeError, TeeReader, read_upload
+
+
+def frame(rows=1000):
+    return pd.DataFrame(dict(a=range(rows), b=[f'value {i}' for i in range(rows)]))
+
+
+def csv_bytes(df):
+    return df.to_csv(index=False).encode('utf-8')
+
+
+def test_tee_reader():
+    data = bytes(range(256)) * 100
+    sink = io.BytesIO()
+    reader = TeeReader(io.BytesIO(data), sink)
+    buf = bytearray(1000)
+    assert reader.readinto(buf) == 1000
+    assert bytes(buf) == data[:1000]
+
+    reader.drain()  # 解析器没有读取的数据也写入存储
+    assert sink.getvalue() == data
+    assert reader.size == len(data)
+    assert reader.digest.hexdigest() == hashlib.sha1(data).hexdigest()
+    assert reader.readinto(buf) == 0
+
+
+def test_tee_reader_max_size():
+    data = b'x' * 2500
+    sink = io.BytesIO()
+    reader = TeeReader(io.BytesIO(data), sink, max_size=2000)
+    buf = bytearray(1000)
+    reader.readinto(buf)
+    reader.readinto(buf)
+    with pytest.raises(FileTooLargeError):
+        reader.readinto(buf)
+    assert len(sink.getvalue()) == 2000  # 超过限制的数据不会写入存储
+
+    reader = TeeReader(io.BytesIO(data), io.BytesIO(), max_size=len(data))
+    reader.drain()
+    assert reader.size == len(data)
+
+
+def test_read_upload_csv():
+    df = frame()
+    data = csv_bytes(df)
+    sink = io.BytesIO()
+    with mock.patch('DataRefine.storage.stream.CSV_CHUNK_ROWS', 300):
+        with mock.patch('DataRefine.storage.stream.pd.concat', wraps=pd.concat) as concat:
+            output, digest = read_upload(io.BytesIO(data), sink, 'people.CSV')
+    assert len(concat.call_args[0][0]) == 4  # 按 300 行分批解析
+    pd.testing.assert_frame_equal(output, df)
+    assert sink.getvalue() == data
+    assert digest == hashlib.sha1(data).hexdigest()
+
+    # 只有一批时不需要合并
+    output, _ = read_upload(io.BytesIO(data), io.BytesIO(), 'people.csv')
+    pd.testing.assert_frame_equal(output, df)
+
+
+def test_read_upload_xlsx(tmpdir):
+    df = frame(100)
+    path = str(tmpdir.join('people.xlsx'))
+    df.to_excel(path, index=False)
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    sink = io.BytesIO()
+    with mock.patch('DataRefine.storage.stream.UPLOAD_CHUNK_SIZE', 1024):
+        output, digest = read_upload(io.BytesIO(data), sink, 'people.xlsx')
+    pd.testing.assert_frame_equal(output, df)
+    assert sink.getvalue() == data
+    assert digest == hashlib.sha1(data).hexdigest()
+
+
+def test_read_upload_too_large(tmpdir):
+    data = csv_bytes(frame())
+    with pytest.raises(FileTooLargeError):
+        read_upload(io.BytesIO(data), io.BytesIO(), 'people.csv', max_size=len(data) - 1)
+
+    # xlsx 的临时文件在超过限制时也会删除
+    with mock.patch('DataRefine.storage.stream.tempfile.tempdir', str(tmpdir)):
+        with pytest.raises(FileTooLargeError):
+            read_upload(io.BytesIO(data), io.BytesIO(), 'people.xlsx', max_size=100)
+    assert tmpdir.listdir() == []
+
+    output, _ = read_upload(io.BytesIO(data), io.BytesIO(), 'people.csv', max_size=len(data))
+    assert len(output) == 1000
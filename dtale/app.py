@@ -735,6 +735,13 @@ def show(data=None, data_loader=None, name=None, context_vars=None, **options):
     :type enable_custom_filters: bool, optional
     :param enable_web_uploads: If true, this will enable users to upload files using URLs from the UI
     :type enable_web_uploads: bool, optional
+    :param profile_workers: number of workers to spread the profiling of columns across on load
+    :type profile_workers: int, optional
+    :param profile_processes: If true, object-dtype columns will be profiled in a process pool
+    :type profile_processes: bool, optional
+    :param lazy_profiling: If true, column information (missing counts, outliers, skew...) will be loaded in the
+                           background rather than before returning
+    :type lazy_profiling: bool, optional
 
     :Example:
 
@@ -837,6 +844,9 @@ def show(data=None, data_loader=None, name=None, context_vars=None, **options):
             enable_web_uploads=final_options.get("enable_web_uploads"),
             main_title=final_options.get("main_title"),
             main_title_font=final_options.get("main_title_font"),
+            profile_workers=final_options.get("profile_workers"),
+            profile_processes=final_options.get("profile_processes"),
+            lazy_profiling=final_options.get("lazy_profiling"),
         )
         instance.started_with_open_browser = final_options["open_browser"]
         is_active = not running_with_flask_debug() and is_up(app_url)
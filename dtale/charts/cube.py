@@ -0,0 +1,292 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import dtale.global_state as global_state
+from dtale.utils import classify_type, find_dtype, make_list
+
+# aggregations which can be answered from the partial aggregates (count, sum, sum of squares, min & max) of a cube
+CUBE_AGGS = ["count", "sum", "mean", "std", "var", "min", "max"]
+
+# (data_id, entry key) -> (data version, bytes, value) of the factorized dimensions & partial aggregates of every cube
+_CUBE_STORE = OrderedDict()
+_CUBE_STATS = dict(bytes=0)
+_CUBE_LOCK = threading.Lock()
+
+
+def cube_max_bytes():
+    return int((global_state.get_chart_settings().get("cube_memory") or 0) * 1024**2)
+
+
+def clear_cube(data_id=None):
+    with _CUBE_LOCK:
+        if data_id is None:
+            _CUBE_STORE.clear()
+            _CUBE_STATS["bytes"] = 0
+            return
+        for key in [k for k in _CUBE_STORE if k[0] == str(data_id)]:
+            _CUBE_STATS["bytes"] -= _CUBE_STORE.pop(key)[1]
+
+
+def cube_info():
+    with _CUBE_LOCK:
+        return dict(
+            entries=len(_CUBE_STORE),
+            bytes=_CUBE_STATS["bytes"],
+            max_bytes=cube_max_bytes(),
+        )
+
+
+def _nbytes(value):
+    if isinstance(value, tuple):
+        return sum(_nbytes(v) for v in value)
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage())
+    return int(getattr(value, "nbytes", 0))
+
+
+class AggregationCube(object):
+    """
+    Pre-aggregated view of an instance's data for charts which repeatedly group the same dimensions (x-axis & group
+    columns) by different measures & aggregations.  Dimension columns are factorized once and their codes cached per
+    column, combinations of dimensions are then reduced to per-group partial aggregates (count, sum, sum of squares,
+    min & max) of each measure.  Counts, sums, means, standard deviations, variances, minimums & maximums are computed
+    from those partial aggregates without touching the rows of the data again.
+
+    Everything computed is kept in a store shared by all instances, capped at "cube_memory" (chart setting) megabytes
+    and tied to the version of the data so any change to it invalidates the cube.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param data: the unfiltered data of the instance
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param aliases: names the columns of data are referred to by in dimensions (EX: the x-axis is renamed to "x")
+    :type aliases: dict, optional
+    """
+
+    def __init__(self, data_id, data, aliases=None):
+        self.data_id = str(data_id)
+        self.data = data
+        self.data_version = global_state.get_data_version(data_id)
+        self.aliases = aliases or {}
+
+    def with_aliases(self, aliases):
+        return AggregationCube(self.data_id, self.data, aliases)
+
+    def _column(self, col):
+        return self.aliases.get(col, col)
+
+    def _cached(self, key, builder):
+        store_key = (self.data_id, key)
+        with _CUBE_LOCK:
+            entry = _CUBE_STORE.get(store_key)
+            if entry is not None and entry[0] == self.data_version:
+                _CUBE_STORE.move_to_end(store_key)
+                return entry[2]
+            # entries built from older versions of this data will never be hit again
+            for stale_key in [
+                k
+                for k, v in _CUBE_STORE.items()
+                if k[0] == self.data_id and v[0] != self.data_version
+            ]:
+                _CUBE_STATS["bytes"] -= _CUBE_STORE.pop(stale_key)[1]
+
+        value = builder()
+        nbytes = _nbytes(value)
+        max_bytes = cube_max_bytes()
+        if nbytes > max_bytes:
+            return value
+        with _CUBE_LOCK:
+            if store_key in _CUBE_STORE:
+                _CUBE_STATS["bytes"] -= _CUBE_STORE.pop(store_key)[1]
+            _CUBE_STORE[store_key] = (self.data_version, nbytes, value)
+            _CUBE_STATS["bytes"] += nbytes
+            while _CUBE_STATS["bytes"] > max_bytes:
+                _CUBE_STATS["bytes"] -= _CUBE_STORE.popitem(last=False)[1][1]
+        return value
+
+    def codes(self, col):
+        """
+        Factorized codes (-1 for NaN) & sorted unique values of a dimension column.
+
+        :param col: column name
+        :type col: str
+        :return: tuple of (:class:`numpy:numpy.ndarray`, :class:`pandas:pandas.Index`)
+        """
+
+        def _build():
+            codes, uniques = pd.factorize(self.data[col], sort=True)
+            dtype = "int32" if len(uniques) < np.iinfo("int32").max else "int64"
+            return codes.astype(dtype), pd.Index(uniques)
+
+        return self._cached(("codes", col), _build)
+
+    def groups(self, dims):
+        """
+        Group codes of every row for a combination of dimensions (-1 for rows with a NaN in any of them) and the
+        sorted index of the groups they point to.
+
+        :param dims: dimension columns
+        :type dims: list of str
+        :return: tuple of (:class:`numpy:numpy.ndarray`, :class:`pandas:pandas.Index`)
+        """
+        dims = tuple(dims)
+
+        def _build():
+            dim_codes = [self.codes(d) for d in dims]
+            sizes = [len(uniques) for _, uniques in dim_codes]
+            if np.prod([float(s) for s in sizes]) >= np.iinfo("int64").max:
+                raise OverflowError(
+                    "Too many combinations of {} to pre-aggregate".format(dims)
+                )
+            combined = np.zeros(len(self.data), dtype="int64")
+            valid = np.ones(len(self.data), dtype=bool)
+            for (codes, _), size in zip(dim_codes, sizes):
+                combined = combined * size + codes
+                valid &= codes >= 0
+            group_codes, group_keys = pd.factorize(combined[valid], sort=True)
+            rows = np.full(len(self.data), -1, dtype=group_codes.dtype)
+            rows[valid] = group_codes
+            levels, labels = [], []
+            for (_, uniques), size in reversed(list(zip(dim_codes, sizes))):
+                group_keys, level_codes = np.divmod(group_keys, size)
+                levels.insert(0, uniques)
+                labels.insert(0, level_codes)
+            if len(dims) == 1:
+                index = levels[0].take(labels[0])
+            else:
+                index = pd.MultiIndex(
+                    levels=levels, codes=labels, verify_integrity=False
+                )
+            return rows, index
+
+        return self._cached(("groups", dims), _build)
+
+    def partials(self, dims, measure):
+        """
+        Partial aggregates (count, sum, sum of squares, min & max) of a measure for each group of a combination of
+        dimensions.  Squares are summed around the mean of the measure to keep variances precise.
+
+        :param dims: dimension columns
+        :type dims: list of str
+        :param measure: column to aggregate
+        :type measure: str
+        :return: :class:`pandas:pandas.DataFrame`
+        """
+        dims = tuple(dims)
+
+        def _build():
+            rows, index = self.groups(dims)
+            valid = rows >= 0
+            values = self.data[measure].values[valid]
+            grouped = pd.Series(values).groupby(rows[valid])
+            partials = grouped.agg(["count", "sum", "min", "max"])
+            observed = values[~pd.isnull(values)]
+            shift = observed.mean() if len(observed) else 0
+            partials["sumsq"] = (
+                pd.Series(np.square(values - shift)).groupby(rows[valid]).sum()
+            )
+            partials["shift"] = shift
+            partials.index = index
+            return partials
+
+        return self._cached(("partials", dims, measure), _build)
+
+    def aggregate(self, dims, measures, agg):
+        """
+        Equivalent of ``df.groupby(dims)[measures].agg()`` computed from partial aggregates.  Columns are referred to
+        by their aliases here.
+
+        :param dims: dimension columns
+        :type dims: list of str
+        :param measures: columns to aggregate
+        :type measures: list of str
+        :param agg: one of :attr:`dtale.charts.cube.CUBE_AGGS`
+        :type agg: str
+        :return: :class:`pandas:pandas.DataFrame`
+        """
+        output = {}
+        for measure in make_list(measures):
+            partials = self.partials(
+                [self._column(d) for d in dims], self._column(measure)
+            )
+            if agg in ["count", "sum", "min", "max"]:
+                output[measure] = partials[agg]
+                continue
+            count = partials["count"].astype("float64")
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if agg == "mean":
+                    output[measure] = (partials["sum"] / count).where(count > 0)
+                    continue
+                shifted_sum = partials["sum"] - count * partials["shift"]
+                var = (partials["sumsq"] - shifted_sum**2 / count) / (count - 1)
+                var = var.clip(lower=0).where(count > 1)
+            output[measure] = np.sqrt(var) if agg == "std" else var
+        output = pd.DataFrame(output, columns=make_list(measures))
+        # the index of the partial aggregates is cached so it is renamed rather than altered
+        output.index = output.index.set_names(list(dims))
+        return output
+
+
+def _is_plain_column(data, col):
+    return isinstance(col, str) and col in data.columns
+
+
+def load_cube(
+    data_id,
+    data,
+    x,
+    y,
+    group_col=None,
+    group_type=None,
+    group_val=None,
+    z=None,
+    animate_by=None,
+    cleaners=None,
+    dropna=True,
+    **kwargs
+):
+    """
+    Returns the :class:`dtale.charts.cube.AggregationCube` of an instance if it can be used to aggregate the data of a
+    chart: cubes are enabled ("cube_memory" chart setting), the chart is built from all the rows of the instance and its
+    dimensions & measures are plain columns whose values are aggregated as they are (no date frequencies, binning,
+    cleaners, z-axis or animation).
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param data: data the chart is built from
+    :type data: :class:`pandas:pandas.DataFrame`
+    :return: :class:`dtale.charts.cube.AggregationCube` or None
+    """
+    if not cube_max_bytes() or global_state.get_data_version(data_id) is None:
+        return None
+    if global_state.is_arcticdb or z or animate_by or group_val or cleaners:
+        return None
+    group_col = make_list(group_col)
+    if len(group_col) and not dropna:
+        return None
+    raw_data = global_state.get_data(data_id)
+    if raw_data is None or len(raw_data) != len(data):  # filtered, sampled or zoomed
+        return None
+    dims, measures = group_col + [x], make_list(y)
+    cols = dims + measures
+    if len(set(cols)) != len(cols) or not all(
+        _is_plain_column(raw_data, c) for c in cols
+    ):
+        return None
+    for col in dims:
+        dtype = find_dtype(raw_data[col])
+        if dtype == "category":
+            return None
+        if col in group_col and (
+            classify_type(dtype) == "F"
+            or (classify_type(dtype) == "I" and group_type == "bins")
+        ):
+            return None
+    if any(classify_type(find_dtype(raw_data[c])) not in ["I", "F"] for c in measures):
+        return None
+    return AggregationCube(data_id, raw_data)
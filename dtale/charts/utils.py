@@ -5,6 +5,7 @@ import pandas as pd
 
 import dtale.global_state as global_state
 import dtale.pandas_util as pandas_util
+from dtale.charts.cube import CUBE_AGGS
 from dtale.column_analysis import handle_cleaners
 from dtale.constants import CHART_JOINER_CHAR
 from dtale.query import build_col_key, run_query
@@ -415,6 +416,363 @@ def check_exceptions(
         raise ChartBuildingError(limit_msg.format(data_limit))
 
 
+# charts whose points can be downsampled (rather than refused) once they exceed the points limit and the method used
+DOWNSAMPLE_CHARTS = {"line": "lttb", "scatter": "grid", "3d_scatter": "grid"}
+DOWNSAMPLE_GRID_SIZE = 200
+
+
+def _downsample_values(s):
+    """
+    Converts a series into floats which can be used for distance calculations in downsampling.  Dates are converted
+    to nanoseconds and any non-numeric values are converted to the position of their first appearance.
+    """
+    classifier = classify_type(find_dtype(s))
+    if classifier == "D":
+        return s.values.astype("datetime64[ns]").astype("int64").astype("float64")
+    if classifier in ["I", "F", "B"]:
+        return s.values.astype("float64")
+    return pd.factorize(s)[0].astype("float64")
+
+
+def minmax_indices(y, buckets):
+    """
+    Splits a series into equally sized buckets and returns the positions of the minimum & maximum values within each
+    bucket as well as the first & last positions of the series.  Buckets containing only missing values keep their
+    first position so gaps in the series are preserved.
+
+    :param y: values of the series
+    :type y: :class:`numpy:numpy.ndarray`
+    :param buckets: number of buckets to split the series into
+    :type buckets: int
+    :return: sorted positions
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    n = len(y)
+    bucket_ids = (np.arange(n) * buckets) // n
+    # buckets are only built from present values (idxmin & idxmax of buckets without any values aren't positions)
+    valid = ~pd.isnull(y)
+    groups = pd.Series(y[valid], index=np.flatnonzero(valid)).groupby(bucket_ids[valid])
+    missing = np.setdiff1d(bucket_ids, bucket_ids[valid])
+    positions = np.concatenate(
+        [
+            groups.idxmin().values,
+            groups.idxmax().values,
+            np.searchsorted(bucket_ids, missing),
+            [0, n - 1],
+        ]
+    )
+    return np.unique(positions.astype(int))
+
+
+def lttb_indices(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets downsampling of a series sorted by x.  Returns the positions of the `threshold`
+    points which best preserve the visual shape of the series.  Series much larger than the threshold are first reduced
+    to the minimums & maximums of 2 * threshold buckets (MinMaxLTTB) so the per-bucket loop stays short.
+
+    :param x: sorted x-axis values
+    :type x: :class:`numpy:numpy.ndarray`
+    :param y: y-axis values
+    :type y: :class:`numpy:numpy.ndarray`
+    :param threshold: number of points to keep
+    :type threshold: int
+    :return: sorted positions
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    if n > 4 * threshold:
+        preselected = minmax_indices(y, 2 * threshold)
+        if len(preselected) > threshold:
+            return preselected[_lttb(x[preselected], y[preselected], threshold)]
+        return preselected
+    return _lttb(x, y, threshold)
+
+
+def _lttb(x, y, threshold):
+    n = len(x)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (
+            (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        )
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(areas.argmax())
+        selected[i + 1] = a
+    return selected
+
+
+def _grid_positions(values, size):
+    lo, hi = np.nanmin(values), np.nanmax(values)
+    if hi == lo:
+        return np.zeros(len(values), dtype=int)
+    return np.clip(((values - lo) / (hi - lo) * size).astype(int), 0, size - 1)
+
+
+def grid_sample_indices(x, y, max_points, size=DOWNSAMPLE_GRID_SIZE):
+    """
+    Density-aware sampling of a scatter: points are binned into a size x size grid and each occupied cell keeps at most
+    the same number of (randomly chosen) points, with that cap set as high as `max_points` allows.  Sparse regions &
+    outliers are kept in full while dense regions are thinned.  Points are kept with probability cap / (points in
+    their cell) so no per-cell sorting is needed.
+
+    :param x: x-axis values
+    :type x: :class:`numpy:numpy.ndarray`
+    :param y: y-axis values
+    :type y: :class:`numpy:numpy.ndarray`
+    :param max_points: maximum number of points to keep
+    :type max_points: int
+    :param size: number of bins along each axis
+    :type size: int
+    :return: sorted positions
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    n = len(x)
+    if n <= max_points:
+        return np.arange(n)
+    cells = _grid_positions(x, size) * size + _grid_positions(y, size)
+    counts = np.bincount(cells)
+    occupied = counts[counts > 0]
+    # largest per-cell cap which keeps the total within max_points
+    lo, hi = 0, int(occupied.max())
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if np.minimum(occupied, mid).sum() <= max_points:
+            lo = mid
+        else:
+            hi = mid - 1
+    # with more occupied cells than points allowed each cell keeps a point with equal probability
+    cap = lo or float(max_points) / len(occupied)
+    random_state = np.random.RandomState(0)
+    keep = np.flatnonzero(
+        random_state.random_sample(n) < np.minimum(1.0, cap / counts[cells])
+    )
+    if len(keep) > max_points:
+        keep = np.sort(random_state.choice(keep, max_points, replace=False))
+    return keep
+
+
+def downsample_chart_data(data, x, y, max_points, method="lttb"):
+    """
+    Reduces the points of a chart to at most `max_points` rather than refusing to render it.
+
+    :param data: chart data sorted by x
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param x: column used for the x-axis
+    :type x: str
+    :param y: columns used for the y-axis, points kept for any of these series are kept for all of them
+    :type y: list of str
+    :param max_points: maximum number of points to return
+    :type max_points: int
+    :param method: "lttb" (line charts) or "grid" (scatter charts)
+    :type method: str
+    :return: :class:`pandas:pandas.DataFrame`
+    """
+    if len(data) <= max_points:
+        return data
+    y = make_list(y)
+    series_points = max(max_points // len(y), 3)
+    x_vals = _downsample_values(data[x])
+    sampler = grid_sample_indices if method == "grid" else lttb_indices
+    positions = np.unique(
+        np.concatenate(
+            [sampler(x_vals, _downsample_values(data[col]), series_points) for col in y]
+        )
+    )
+    return data.iloc[positions]
+
+
+def apply_chart_zoom(data, x, y, zoom):
+    """
+    Filters chart data down to the window a user has zoomed into so that window can be rendered at full resolution
+    (or downsampled far less).  Ranges only apply to numeric & date axes and to the same x/y they were selected on.
+
+    :param data: chart data
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param x: column used for the x-axis
+    :type x: str
+    :param y: columns used for the y-axis
+    :type y: list of str
+    :param zoom: dictionary of x, y & the x_range/y_range ([min, max]) zoomed into on them
+    :type zoom: dict
+    :return: tuple of (filtered data, code snippet)
+    """
+    code = []
+    if not zoom or zoom.get("x") != x or zoom.get("y") != make_list(y):
+        return data, code
+    y = make_list(y)
+    axes = [(x, zoom.get("x_range"))]
+    if len(y) == 1:
+        axes.append((y[0], zoom.get("y_range")))
+    for col, axis_range in axes:
+        if col not in data.columns or not axis_range:
+            continue
+        classifier = classify_type(find_dtype(data[col]))
+        if classifier not in ["I", "F", "D"]:
+            continue
+        lo, hi = axis_range
+        if classifier == "D":
+            lo, hi = pd.Timestamp(lo), pd.Timestamp(hi)
+        data = data[(data[col] >= lo) & (data[col] <= hi)]
+        code.append(
+            "df = df[(df['{col}'] >= {lo}) & (df['{col}'] <= {hi})]".format(
+                col=col,
+                lo="pd.Timestamp('{}')".format(lo) if classifier == "D" else lo,
+                hi="pd.Timestamp('{}')".format(hi) if classifier == "D" else hi,
+            )
+        )
+    return data, code
+
+
+# scatters & heatmaps with more points than the "raster_points" chart setting are binned into a grid of this many
+# cells along each axis and rendered as heatmaps
+RASTER_GRID_SIZE = 256
+
+
+def is_rasterizable(data, *cols):
+    """Rasterizing requires numeric or date values along each of the axes being binned"""
+    return all(classify_type(find_dtype(data[col])) in ["I", "F", "D"] for col in cols)
+
+
+def _bin_centers(s, edges):
+    centers = (edges[:-1] + edges[1:]) / 2
+    if classify_type(find_dtype(s)) == "D":
+        return pd.to_datetime(centers.astype("int64"))
+    return centers
+
+
+def _finite(s):
+    if classify_type(find_dtype(s)) in ["I", "F"]:
+        return s[np.isfinite(s.values.astype("float64"))]
+    return s
+
+
+def _bin_edges(values, size):
+    lo, hi = (np.min(values), np.max(values)) if len(values) else (0.0, 1.0)
+    if lo == hi:  # same handling of constant values as numpy.histogram
+        lo, hi = lo - 0.5, hi + 0.5
+    return np.linspace(lo, hi, size + 1)
+
+
+def _bin_positions(values, edges):
+    size = len(edges) - 1
+    positions = (values - edges[0]) / (edges[-1] - edges[0]) * size
+    return np.clip(positions.astype(int), 0, size - 1)
+
+
+def rasterize_chart_data(data, x, y, z=None, agg=None, size=RASTER_GRID_SIZE):
+    """
+    Bins the points of a chart into a size x size grid so it can be rendered as a heatmap whose payload depends on the
+    size of the grid rather than the number of rows.  Without a z-axis each cell holds the number of points which fall
+    into it, otherwise the z-values within each cell are aggregated.  Bins are equally sized (as in
+    :func:`numpy:numpy.histogram2d`) so cells are located arithmetically and filled using :func:`numpy:numpy.bincount`.
+
+    :param data: chart data
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param x: column used for the x-axis (numeric or date)
+    :type x: str
+    :param y: column used for the y-axis (numeric or date)
+    :type y: str
+    :param z: column to aggregate within each cell
+    :type z: str, optional
+    :param agg: count, sum, min, max or mean (any other aggregation of z falls back to mean)
+    :type agg: str, optional
+    :param size: number of bins along each axis
+    :type size: int
+    :return: dictionary of x & y (bin centers), z (grid of cell values where rows are y-bins & empty cells are NaN) and
+             points (number of rows binned)
+    :rtype: dict
+    """
+    data = data[[x, y] + ([z] if z is not None else [])].dropna()
+    x_vals, y_vals = _downsample_values(data[x]), _downsample_values(data[y])
+    # infinite values can't be binned (they would stretch the bins to infinity), as with numpy.histogram2d
+    finite = np.isfinite(x_vals) & np.isfinite(y_vals)
+    if not finite.all():
+        data, x_vals, y_vals = data[finite], x_vals[finite], y_vals[finite]
+    x_edges, y_edges = _bin_edges(x_vals, size), _bin_edges(y_vals, size)
+    cells = _bin_positions(y_vals, y_edges) * size + _bin_positions(x_vals, x_edges)
+    counts = np.bincount(cells, minlength=size * size)
+    if z is None or agg == "count":
+        values = counts.astype("float64")
+    elif agg in ["min", "max"]:
+        cell_vals = getattr(pd.Series(data[z].values).groupby(cells), agg)()
+        values = np.full(size * size, np.nan)
+        values[cell_vals.index.values] = cell_vals.values
+    else:
+        values = np.bincount(
+            cells, weights=data[z].values.astype("float64"), minlength=size * size
+        )
+        if agg != "sum":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = values / counts
+    values = np.where(counts > 0, values, np.nan)
+    return dict(
+        x=_bin_centers(data[x], x_edges),
+        y=_bin_centers(data[y], y_edges),
+        z=values.reshape(size, size),
+        points=len(data),
+    )
+
+
+def build_raster_chart(data, x, y, size=RASTER_GRID_SIZE):
+    """
+    Alternative to :meth:`dtale.charts.utils.build_base_chart` for scatters with more points than the "raster_points"
+    chart setting.  Rather than points, the density of each y-axis column is returned as a grid of counts (see
+    :meth:`dtale.charts.utils.rasterize_chart_data`).
+
+    :param data: chart data
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param x: column used for the x-axis
+    :type x: str
+    :param y: columns used for the y-axis
+    :type y: list of str
+    :param size: number of bins along each axis
+    :type size: int
+    :return: tuple of (dict of raster grids by y-axis column along with min/max ranges, code snippet)
+    """
+    y = make_list(y)
+    chart_data = data[[x] + y].rename(columns={x: "x"})
+    _, range_f = build_formatters(chart_data)
+    raster = {col: rasterize_chart_data(data, x, col, size=size) for col in y}
+    ret_data = dict(
+        raster=raster,
+        min={
+            col: fmt(_finite(chart_data[col]).min(), None)
+            for _, col, fmt in range_f.fmts
+        },
+        max={
+            col: fmt(_finite(chart_data[col]).max(), None)
+            for _, col, fmt in range_f.fmts
+        },
+        downsampled=dict(
+            total=len(data),
+            points=int(sum((~np.isnan(r["z"])).sum() for r in raster.values())),
+        ),
+    )
+    code = [
+        (
+            "\nimport numpy as np\n\n"
+            "finite = np.isfinite(df['{x}']) & np.isfinite(df['{y}'])\n"
+            "counts, x_edges, y_edges = np.histogram2d(\n"
+            "\tdf['{x}'][finite], df['{y}'][finite], bins={size}\n"
+            ")\n"
+            "counts[counts == 0] = np.nan"
+        ).format(x=x, y=col, size=size)
+        for col in y
+    ]
+    return ret_data, code
+
+
 def build_aggs(y, z=None, agg=None, extended_aggregation=[]):
     z_exists = len(make_list(z))
     agg_cols = make_list(y)
@@ -441,6 +799,7 @@ def build_agg_data(
     animate_by=None,
     extended_aggregation=[],
     dropna=True,
+    cube=None,
 ):
     """
     Builds aggregated data when an aggregation (sum, mean, max, min...) is selected from the front-end.
@@ -467,6 +826,8 @@ def build_agg_data(
                 :func: pandas.core.groupby.DataFrameGroupBy.  Possible values are: count, first, last mean,
                 median, min, max, std, var, mad, prod, sum
     :type extended_aggregation: list, optional
+    :param cube: pre-aggregated view of the data which supported aggregations are computed from rather than df
+    :type cube: :class:`dtale.charts.cube.AggregationCube`, optional
     :return: dataframe of aggregated data
     :rtype: :class:`pandas:pandas.DataFrame`
     """
@@ -538,7 +899,7 @@ def build_agg_data(
     else:
         groups = pandas_util.groupby(df, idx_cols, dropna=dropna)
         groups, code, group_cols = compute_aggs(
-            df, groups, aggs, idx_cols, group_col, dropna=dropna
+            df, groups, aggs, idx_cols, group_col, dropna=dropna, cube=cube
         )
 
     if animate_by is not None:
@@ -576,7 +937,7 @@ def parse_final_col(final_col):
     return final_col, None
 
 
-def compute_aggs(df, groups, aggs, idx_cols, group_col, dropna=True):
+def compute_aggs(df, groups, aggs, idx_cols, group_col, dropna=True, cube=None):
     all_code = []
     all_calculated_aggs = []
     all_calculated_cols = []
@@ -586,14 +947,25 @@ def compute_aggs(df, groups, aggs, idx_cols, group_col, dropna=True):
             func = "sum" if curr_agg == "pctsum" else "size"
             subidx_cols = [c for c in idx_cols if c not in make_list(group_col)]
             calc_group = getattr(groups[curr_agg_cols], func)()
-            calc_group = (
-                calc_group
-                / getattr(
-                    pandas_util.groupby(df, subidx_cols, dropna=dropna)[curr_agg_cols],
+            # the totals of each sub-group are the sums of the (far smaller) aggregated groups within it plus any
+            # rows whose group is NaN (those are dropped from the groups but not from the totals)
+            totals = pandas_util.groupby(
+                calc_group, subidx_cols, dropna=dropna
+            ).transform("sum")
+            group_cols = [c for c in idx_cols if c not in subidx_cols]
+            nan_groups = df[:0]
+            if dropna and len(group_cols):
+                nan_groups = df[df[group_cols].isnull().any(axis=1)]
+            if len(nan_groups):
+                nan_totals = getattr(
+                    pandas_util.groupby(nan_groups, subidx_cols, dropna=dropna)[
+                        curr_agg_cols
+                    ],
                     func,
                 )()
-                * 100
-            )
+                nan_totals = nan_totals.reindex(calc_group.index.droplevel(group_cols))
+                totals = totals + nan_totals.fillna(0).values
+            calc_group = calc_group / totals * 100
             if isinstance(calc_group, pd.Series):
                 calc_group.name = curr_agg_cols[0]
                 calc_group = calc_group.to_frame()
@@ -604,7 +976,7 @@ def compute_aggs(df, groups, aggs, idx_cols, group_col, dropna=True):
                 groups.name = curr_agg_cols[0]
             code = (
                 "{chart_data} = chart_data{groupby}[['{agg_cols}']].{agg}()\n"
-                "{chart_data} = {chart_data} / {chart_data}{subgroupby}.{agg}()"
+                "{chart_data} = {chart_data} / {chart_data}{subgroupby}.transform('sum') * 100"
             )
             code = code.format(
                 groupby=pandas_util.groupby_code(idx_cols, dropna=dropna),
@@ -615,35 +987,35 @@ def compute_aggs(df, groups, aggs, idx_cols, group_col, dropna=True):
             )
             all_code.append(code)
         elif curr_agg in ["first", "last"]:
-            agg_func = "head" if curr_agg == "first" else "tail"
-
-            def _build_first_last():
-                for col in curr_agg_cols:
-                    yield groups[[col]].apply(
-                        lambda x: getattr(
-                            x.sort_values(by=col, ascending=True), agg_func
-                        )(1)
-                    ).reset_index(-1, drop=True)
-
-            calc_group = pd.concat(list(_build_first_last()), axis=1)
+            # the first/last value of each group once sorted by that value is its minimum/maximum, NaNs are sorted
+            # last so the last value of any group containing them is NaN
+            agg_groups = groups[curr_agg_cols]
+            if curr_agg == "first":
+                calc_group = agg_groups.min()
+            else:
+                calc_group = agg_groups.max()
+                calc_group = calc_group.where(
+                    agg_groups.count().eq(agg_groups.size(), axis=0)
+                )
             all_code += [
                 (
-                    "groups = chart_data{groupby}\n"
-                    "\ndef _build_first_last():\n"
-                    "\tfor col in ['{agg_cols}']:\n"
-                    "\t\tyield groups[[col]].apply(\n"
-                    "\t\t\tlambda x: x.sort_values(by=col, ascending=True).{agg_func}(1)\n"
-                    "\t\t)\n\n"
-                    "{chart_data} = pd.DataFrame(list(_build_first_last()), columns=['{agg_cols}'])"
+                    "groups = chart_data{groupby}[['{agg_cols}']]\n"
+                    + (
+                        "{chart_data} = groups.min()"
+                        if curr_agg == "first"
+                        else "{chart_data} = groups.max().where(groups.count().eq(groups.size(), axis=0))"
+                    )
                 ).format(
                     groupby=pandas_util.groupby_code(idx_cols, dropna=dropna),
                     agg_cols="', '".join(curr_agg_cols),
-                    agg_func=agg_func,
                     chart_data=chart_data_key,
                 )
             ]
         else:
-            calc_group = getattr(groups[curr_agg_cols], curr_agg)()
+            if cube is not None and curr_agg in CUBE_AGGS:
+                calc_group = cube.aggregate(idx_cols, curr_agg_cols, curr_agg)
+            else:
+                calc_group = getattr(groups[curr_agg_cols], curr_agg)()
             all_code += [
                 "{chart_data} = chart_data{groupby}[['{agg_cols}']].{agg}()".format(
                     groupby=pandas_util.groupby_code(idx_cols, dropna=dropna),
@@ -697,6 +1069,8 @@ def build_base_chart(
     animate_by=None,
     cleaners=[],
     dropna=True,
+    downsample=None,
+    cube=None,
     **kwargs
 ):
     """
@@ -723,6 +1097,12 @@ def build_base_chart(
     :type agg: list, optional
     :param allow_duplicates: flag to allow duplicates to be ignored (usually for scatter plots)
     :type allow_duplicates: bool, optional
+    :param downsample: method ("lttb" or "grid") used to downsample the points of charts exceeding the points limit
+                       rather than refusing to render them (see :meth:`dtale.charts.utils.downsample_chart_data`)
+    :type downsample: str, optional
+    :param cube: pre-aggregated view of raw_data which supported aggregations are computed from (see
+                 :meth:`dtale.charts.cube.load_cube`)
+    :type cube: :class:`dtale.charts.cube.AggregationCube`, optional
     :return: dict
     """
     group_fmt_overrides = {
@@ -752,6 +1132,8 @@ def build_base_chart(
             1, len(data) + 1
         )  # sequential integers: 1, 2, ..., N
     y_cols = make_list(y)
+    if cube is not None:
+        cube = cube.with_aliases({x_col: x})
 
     z_col = kwargs.get("z")
     z_cols = make_list(z_col)
@@ -846,6 +1228,7 @@ def build_base_chart(
                 animate_by=animate_by,
                 extended_aggregation=extended_aggregation,
                 dropna=dropna,
+                cube=cube,
             )
             code += agg_code
 
@@ -872,6 +1255,41 @@ def build_base_chart(
         if dropna:
             data = data.dropna()
             code.append("chart_data = chart_data.dropna()")
+        downsampled = None
+        data_limit = global_state.get_chart_settings()[
+            "3d_points" if is_z else "scatter_points"
+        ]
+        if downsample and animate_by is None and len(data) > data_limit:
+            groups = list(pandas_util.groupby(data, group_col, dropna=dropna))
+            group_limit = data_limit // len(groups)
+            downsampled = dict(total=len(data))
+            data = pd.concat(
+                [
+                    downsample_chart_data(
+                        grp,
+                        x_col,
+                        y_cols if is_z else final_cols,
+                        group_limit,
+                        method=downsample,
+                    )
+                    for _, grp in groups
+                ]
+            )
+            downsampled["points"] = len(data)
+            code.append(
+                (
+                    "from dtale.charts.utils import downsample_chart_data\n\n"
+                    "chart_data = pd.concat([\n"
+                    "\tdownsample_chart_data(grp, 'x', ['{cols}'], {limit}, method='{method}')\n"
+                    "\tfor _, grp in chart_data.groupby(['{groups}'])\n"
+                    "])"
+                ).format(
+                    cols="', '".join(y_cols if is_z else final_cols),
+                    limit=group_limit,
+                    method=downsample,
+                    groups="', '".join(group_col),
+                )
+            )
         if return_raw:
             return data.rename(columns={x_col: x})
         data_f, range_f = build_formatters(data)
@@ -932,6 +1350,8 @@ def build_base_chart(
             ret_data["data"] = copy.deepcopy(ret_data["frames"][-1]["data"])
         else:
             ret_data["data"] = dict(_load_groups(data))
+        if downsampled is not None:
+            ret_data["downsampled"] = downsampled
         return ret_data, code
 
     main_group = [x]
@@ -969,6 +1389,7 @@ def build_base_chart(
             z=z_col,
             animate_by=animate_by,
             extended_aggregation=extended_aggregation,
+            cube=cube,
         )
         code += agg_code
     data = data.dropna()
@@ -981,6 +1402,20 @@ def build_base_chart(
     data_limit = global_state.get_chart_settings()[
         "3d_points" if is_z or animate_by is not None else "scatter_points"
     ]
+    downsampled = None
+    if downsample and animate_by is None and len(data) > data_limit:
+        downsampled = dict(total=len(data))
+        ds_cols = y_cols if is_z else final_cols
+        data = downsample_chart_data(
+            data, x_col, ds_cols, data_limit, method=downsample
+        )
+        downsampled["points"] = len(data)
+        code.append(
+            (
+                "from dtale.charts.utils import downsample_chart_data\n\n"
+                "chart_data = downsample_chart_data(chart_data, 'x', ['{cols}'], {limit}, method='{method}')"
+            ).format(cols="', '".join(ds_cols), limit=data_limit, method=downsample)
+        )
     check_exceptions(
         data[dupe_cols].rename(columns={x_col: x}),
         allow_duplicates or agg in ["raw", "drop_duplicates"],
@@ -1016,6 +1451,8 @@ def build_base_chart(
         ret_data["data"] = copy.deepcopy(ret_data["frames"][-1]["data"])
     else:
         ret_data["data"] = {str("all"): data_f.format_lists(data)}
+    if downsampled is not None:
+        ret_data["downsampled"] = downsampled
     return ret_data, code
 
 
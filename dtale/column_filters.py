@@ -7,7 +7,15 @@ from dtale.utils import classify_type, find_dtype, format_data, make_list
 from dtale.query import build_col_key
 
 
-class ArcticDBColumnFilter(object):
+class SavedColumnFilter(object):
+    """
+    Rebuilds the builder of a filter saved to an instance's settings (using the "meta" information saved with it) so
+    it can be compiled to other backends, such as ArcticDB's QueryBuilder or SQL.
+
+    :param saved_filter: filter saved to "columnFilters" or "outlierFilters" of an instance's settings
+    :type saved_filter: dict
+    """
+
     def __init__(self, saved_filter):
         self.cfg = saved_filter
         column, classification, filter_type = (
@@ -25,6 +33,10 @@ class ArcticDBColumnFilter(object):
             self.builder = OutlierFilter(column, self.classification, self.cfg)
 
 
+# kept for backwards compatibility
+ArcticDBColumnFilter = SavedColumnFilter
+
+
 class ColumnFilter(object):
     def __init__(self, data_id, column, cfg):
         self.data_id = data_id
@@ -122,6 +134,22 @@ class MissingOrPopulatedFilter(object):
         if self.cfg.get("populated", False):
             return query_builder[self.column] == query_builder[self.column]
 
+    def is_missing_or_populated(self):
+        # missing/populated flags take precedence over any other filter so there is no point binding its parameters
+        return self.cfg is None or (
+            self.cfg.get("missing", False) or self.cfg.get("populated", False)
+        )
+
+    def update_missing_or_populated_sql_builder(self, sql_builder, fltr=None):
+        if self.cfg is None or (
+            not self.cfg.get("missing", False) and not self.cfg.get("populated", False)
+        ):
+            return fltr
+        if self.cfg.get("missing", False):
+            return "{} IS NULL".format(sql_builder.col(self.column))
+        if self.cfg.get("populated", False):
+            return "{} IS NOT NULL".format(sql_builder.col(self.column))
+
 
 def handle_ne(query, operand):
     if operand != "=":
@@ -135,6 +163,60 @@ def handle_query_builder_ne(query, operand):
     return query
 
 
+def handle_sql_ne(query, operand):
+    if operand != "=":
+        return "NOT ({})".format(query)
+    return query
+
+
+class SQLBuilder(object):
+    """
+    Collects the pieces of a parameterized SQL statement compiled from D-Tale's saved filters & sorts.
+
+    :param dialect: SQL dialect being targeted ("mysql" or "hive"), used for functionality which differs between them
+    :type dialect: str, optional
+    :param paramstyle: DB-API parameter style of the driver executing the statement ("named" or "qmark")
+    :type paramstyle: str, optional
+    """
+
+    def __init__(self, dialect="mysql", paramstyle="named"):
+        self.dialect = dialect
+        self.paramstyle = paramstyle
+        self.params = []
+
+    def col(self, column):
+        return "`{}`".format(str(column).replace("`", "``"))
+
+    def param(self, value):
+        if isinstance(value, np.generic):
+            value = value.item()
+        self.params.append(value)
+        if self.paramstyle == "qmark":
+            return "?"
+        return ":p{}".format(len(self.params) - 1)
+
+    def bind(self):
+        if self.paramstyle == "qmark":
+            return list(self.params)
+        return {"p{}".format(i): v for i, v in enumerate(self.params)}
+
+    def like_pattern(self, raw, prefix="", suffix=""):
+        escaped = raw.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self.param("{}{}{}".format(prefix, escaped, suffix))
+
+    def length(self, column):
+        if self.dialect == "mysql":
+            return "CHAR_LENGTH({})".format(self.col(column))
+        return "LENGTH({})".format(self.col(column))
+
+    def case_sensitive_col(self, column):
+        # MySQL's default collations ignore case (& trailing spaces) so comparisons need to be made against the
+        # binary value
+        if self.dialect == "mysql":
+            return "BINARY {}".format(self.col(column))
+        return self.col(column)
+
+
 class StringFilter(MissingOrPopulatedFilter):
     def __init__(self, column, classification, cfg):
         super(StringFilter, self).__init__(column, classification, cfg)
@@ -260,6 +342,85 @@ class StringFilter(MissingOrPopulatedFilter):
             query_builder, fltr.get("query")
         )
 
+    def update_sql_builder(self, sql_builder):
+        if self.is_missing_or_populated():
+            return super(StringFilter, self).update_missing_or_populated_sql_builder(
+                sql_builder
+            )
+
+        action = self.cfg.get("action", "equals")
+        if action == "equals" and not len(self.cfg.get("value", [])):
+            return super(StringFilter, self).update_missing_or_populated_sql_builder(
+                sql_builder
+            )
+        elif action != "equals" and not self.cfg.get("raw"):
+            return super(StringFilter, self).update_missing_or_populated_sql_builder(
+                sql_builder
+            )
+
+        state = self.cfg.get("value", [])
+        case_sensitive = self.cfg.get("caseSensitive", False)
+        operand = self.cfg.get("operand", "=")
+        raw = self.cfg.get("raw")
+        col = sql_builder.col(self.column)
+        query = None
+        if action == "equals":
+            # pandas compares values exactly (case & trailing spaces) so collations must not be applied here either
+            col = sql_builder.case_sensitive_col(self.column)
+            if len(state) == 1:
+                query = "{} {} {}".format(
+                    col, "=" if operand == "=" else "<>", sql_builder.param(state[0])
+                )
+            else:
+                query = "{} {} ({})".format(
+                    col,
+                    "IN" if operand == "=" else "NOT IN",
+                    ", ".join(map(sql_builder.param, state)),
+                )
+        elif action in ["startswith", "endswith", "contains"]:
+            prefix = "" if action == "startswith" else "%"
+            suffix = "" if action == "endswith" else "%"
+            if case_sensitive:
+                query = "{} LIKE {}".format(
+                    sql_builder.case_sensitive_col(self.column),
+                    sql_builder.like_pattern(raw, prefix, suffix),
+                )
+            else:
+                query = "LOWER({}) LIKE {}".format(
+                    col, sql_builder.like_pattern(raw.lower(), prefix, suffix)
+                )
+            query = handle_sql_ne(query, operand)
+        elif action == "regex":
+            if sql_builder.dialect == "mysql":
+                query = "{} REGEXP {}".format(
+                    sql_builder.case_sensitive_col(self.column)
+                    if case_sensitive
+                    else col,
+                    sql_builder.param(raw),
+                )
+            else:
+                query = "{} RLIKE {}".format(
+                    col,
+                    sql_builder.param(raw if case_sensitive else "(?i){}".format(raw)),
+                )
+            query = handle_sql_ne(query, operand)
+        elif action == "length":
+            if "," in raw:
+                start, end = raw.split(",")
+                query = "{} BETWEEN {} AND {}".format(
+                    sql_builder.length(self.column),
+                    sql_builder.param(int(start)),
+                    sql_builder.param(int(end)),
+                )
+            else:
+                query = "{} = {}".format(
+                    sql_builder.length(self.column), sql_builder.param(int(raw))
+                )
+            query = handle_sql_ne(query, operand)
+        return super(StringFilter, self).update_missing_or_populated_sql_builder(
+            sql_builder, query
+        )
+
 
 class NumericFilter(MissingOrPopulatedFilter):
     def __init__(self, column, classification, cfg):
@@ -393,6 +554,53 @@ class NumericFilter(MissingOrPopulatedFilter):
             query_builder
         )
 
+    def update_sql_builder(self, sql_builder):
+        if self.is_missing_or_populated():
+            return super(NumericFilter, self).update_missing_or_populated_sql_builder(
+                sql_builder
+            )
+        cfg_val, cfg_operand, cfg_min, cfg_max = (
+            self.cfg.get(p) for p in ["value", "operand", "min", "max"]
+        )
+        col = sql_builder.col(self.column)
+        query = None
+        if cfg_operand in ["=", "ne"]:
+            state = make_list(cfg_val or [])
+            if len(state) == 1:
+                query = "{} {} {}".format(
+                    col,
+                    "=" if cfg_operand == "=" else "<>",
+                    sql_builder.param(state[0]),
+                )
+            elif len(state):
+                query = "{} {} ({})".format(
+                    col,
+                    "IN" if cfg_operand == "=" else "NOT IN",
+                    ", ".join(map(sql_builder.param, state)),
+                )
+        elif cfg_operand in ["<", ">", "<=", ">="]:
+            if cfg_val is not None:
+                query = "{} {} {}".format(col, cfg_operand, sql_builder.param(cfg_val))
+        elif cfg_operand in ["[]", "()"]:
+            if cfg_min is not None and cfg_min == cfg_max:
+                query = "{} = {}".format(col, sql_builder.param(cfg_min))
+            else:
+                queries = []
+                inclusive = "=" if cfg_operand == "[]" else ""
+                if cfg_min is not None:
+                    queries.append(
+                        "{} >{} {}".format(col, inclusive, sql_builder.param(cfg_min))
+                    )
+                if cfg_max is not None:
+                    queries.append(
+                        "{} <{} {}".format(col, inclusive, sql_builder.param(cfg_max))
+                    )
+                if len(queries):
+                    query = " AND ".join(queries)
+        return super(NumericFilter, self).update_missing_or_populated_sql_builder(
+            sql_builder, query
+        )
+
 
 class DateFilter(MissingOrPopulatedFilter):
     def __init__(self, column, classification, cfg):
@@ -462,3 +670,23 @@ class DateFilter(MissingOrPopulatedFilter):
         return super(DateFilter, self).update_missing_or_populated_query_builder(
             query_builder, fltr.get("query")
         )
+
+    def update_sql_builder(self, sql_builder):
+        if self.is_missing_or_populated():
+            return super(DateFilter, self).update_missing_or_populated_sql_builder(
+                sql_builder
+            )
+
+        start, end = (self.cfg.get(p) for p in ["start", "end"])
+        col = sql_builder.col(self.column)
+        queries = []
+        if start and start == end:
+            queries.append("{} = {}".format(col, sql_builder.param(start)))
+        else:
+            if start:
+                queries.append("{} >= {}".format(col, sql_builder.param(start)))
+            if end:
+                queries.append("{} <= {}".format(col, sql_builder.param(end)))
+        return super(DateFilter, self).update_missing_or_populated_sql_builder(
+            sql_builder, " AND ".join(queries) if len(queries) else None
+        )
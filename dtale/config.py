@@ -141,6 +141,22 @@ def load_app_settings(config):
     hide_drop_rows = get_config_val(
         config, curr_app_settings, "hide_drop_rows", section="app", getter="getboolean"
     )
+    profile_workers = get_config_val(
+        config, curr_app_settings, "profile_workers", section="app", getter="getint"
+    )
+    profile_processes = get_config_val(
+        config,
+        curr_app_settings,
+        "profile_processes",
+        section="app",
+        getter="getboolean",
+    )
+    upload_cache_dir = get_config_val(
+        config, curr_app_settings, "upload_cache_dir", section="app"
+    )
+    upload_cache_size = get_config_val(
+        config, curr_app_settings, "upload_cache_size", section="app", getter="getint"
+    )
 
     global_state.set_app_settings(
         dict(
@@ -165,6 +181,10 @@ def load_app_settings(config):
             hide_row_expanders=hide_row_expanders,
             enable_custom_filters=enable_custom_filters,
             enable_web_uploads=enable_web_uploads,
+            profile_workers=profile_workers,
+            profile_processes=profile_processes,
+            upload_cache_dir=upload_cache_dir,
+            upload_cache_size=upload_cache_size,
         )
     )
 
@@ -180,8 +200,23 @@ def load_chart_settings(config):
     three_dimensional_points = get_config_val(
         config, curr_chart_settings, "3d_points", section="charts", getter="getint"
     )
+    raster_points = get_config_val(
+        config, curr_chart_settings, "raster_points", section="charts", getter="getint"
+    )
+    cache_size = get_config_val(
+        config, curr_chart_settings, "cache_size", section="charts", getter="getint"
+    )
+    cube_memory = get_config_val(
+        config, curr_chart_settings, "cube_memory", section="charts", getter="getint"
+    )
     global_state.set_chart_settings(
-        {"scatter_points": scatter_points, "3d_points": three_dimensional_points}
+        {
+            "scatter_points": scatter_points,
+            "3d_points": three_dimensional_points,
+            "raster_points": raster_points,
+            "cache_size": cache_size,
+            "cube_memory": cube_memory,
+        }
     )
 
 
@@ -239,6 +274,9 @@ def build_show_options(options=None):
         enable_web_uploads=None,
         main_title=None,
         main_title_font=None,
+        profile_workers=None,
+        profile_processes=None,
+        lazy_profiling=False,
     )
     config_options = {}
     config = get_config()
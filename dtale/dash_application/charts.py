@@ -1,11 +1,14 @@
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
+import copy
+import functools
 import json
 import math
 import os
 import pprint
 import re
 import squarify
+import threading
 import traceback
 import urllib
 from logging import getLogger
@@ -24,19 +27,25 @@ import dtale.dash_application.components as dash_components
 import dtale.dash_application.custom_geojson as custom_geojson
 import dtale.global_state as global_state
 import dtale.pandas_util as pandas_util
+from dtale.charts.cube import load_cube
 from dtale.charts.utils import (
     AGGS,
+    DOWNSAMPLE_CHARTS,
     DUPES_MSG,
     YAXIS_CHARTS,
     ZAXIS_CHARTS,
+    apply_chart_zoom,
     build_agg_data,
     build_base_chart,
     build_final_cols,
     build_group_inputs_filter,
+    build_raster_chart,
     check_all_nan,
     check_exceptions,
     date_freq_handler,
+    is_rasterizable,
     parse_final_col,
+    rasterize_chart_data,
     retrieve_chart_data,
     valid_chart,
     weekday_tick_handler,
@@ -967,6 +976,61 @@ def scatter_code_builder(
     return code
 
 
+def scatter_raster_builder(
+    data, x, y, wrapper, colorscale=None, scale="linear", modal=False
+):
+    """
+    Builder function for scatters whose points have been binned into a grid (see
+    :meth:`dtale.charts.utils.build_raster_chart`).  The density of each y-axis column is rendered as a
+    :plotly:`plotly.graph_objs.Heatmap <plotly.graph_objs.Heatmap>` so the size of the figure depends on the size of the
+    grid rather than the number of points.
+
+    :param data: raster grids by y-axis column
+    :type data: dict
+    :param x: column to use for the X-Axis
+    :type x: str
+    :param y: columns to use for the Y-Axes
+    :type y: list of str
+    :param wrapper: wrapper function returned by :meth:`dtale.charts.utils.chart_wrapper`
+    :type wrapper: func
+    :param colorscale: colorscale of the counts
+    :type colorscale: str or list, optional
+    :param scale: how to scale the y-axis.  Options are linear or logrithmic.
+    :type scale: str
+    :return: list of heatmaps
+    :rtype: list of :dash:`dash_core_components.Graph <dash-core-components/graph>`
+    """
+
+    def _build_raster(y_val):
+        raster = data["raster"][y_val]
+        figure_cfg = {
+            "data": [
+                go.Heatmap(
+                    x=raster["x"],
+                    y=raster["y"],
+                    z=raster["z"],
+                    colorscale=build_colorscale(colorscale or "Blues"),
+                    colorbar={"title": "Count"},
+                    hovertemplate="%{x}, %{y}<br>Count: %{z}<extra></extra>",
+                )
+            ],
+            "layout": build_layout(
+                dict_merge(
+                    build_title(x, y_val),
+                    dict(
+                        xaxis=dict(title=update_label_for_freq_and_agg(x)),
+                        yaxis=dict(
+                            title=update_label_for_freq_and_agg(y_val), type=scale
+                        ),
+                    ),
+                )
+            ),
+        }
+        return wrapper(graph_wrapper(figure=figure_cfg, modal=modal))
+
+    return [_build_raster(y_val) for y_val in make_list(y)]
+
+
 def surface_builder(
     data, x, y, z, axes_builder, wrapper, agg=None, colorscale=None, modal=False
 ):
@@ -1921,6 +1985,80 @@ def heatmap_builder(data_id, export=False, **inputs):
         x_title = update_label_for_freq_and_agg(x)
         y_title = update_label_for_freq_and_agg(y)
         z_title = z
+        if (
+            agg != "corr"
+            and animate_by is None
+            and len(data) > global_state.get_chart_settings()["raster_points"]
+            and is_rasterizable(data, x, y, z)
+        ):  # too many cells to pivot, so bin x & y into a grid and aggregate z within each cell
+            raster_agg = agg if agg in ["count", "sum", "min", "max"] else "mean"
+            raster = rasterize_chart_data(data, x, y, z=z, agg=raster_agg)
+            z_title = "{} ({})".format(z_title, AGGS[raster_agg])
+            if raster_agg in ["min", "max"]:
+                agg_code = (
+                    "cells = np.digitize(chart_data['{x}'], x_edges[1:-1]) * {size} + np.digitize(\n"
+                    "\tchart_data['{y}'], y_edges[1:-1]\n"
+                    ")\n"
+                    "cell_vals = chart_data['{z}'].groupby(cells).{agg}()\n"
+                    "grid = np.full({size} * {size}, np.nan)\n"
+                    "grid[cell_vals.index] = cell_vals.values\n"
+                    "chart_data = grid.reshape({size}, {size}).T"
+                )
+            else:
+                agg_code = (
+                    "sums, _, _ = np.histogram2d(\n"
+                    "\tchart_data['{x}'], chart_data['{y}'], bins=[x_edges, y_edges], weights=chart_data['{z}']\n"
+                    ")\n"
+                    "chart_data = {grid}.T"
+                )
+            code.append(
+                (
+                    "\nimport numpy as np\n\n"
+                    "chart_data = chart_data.dropna()\n"
+                    "counts, x_edges, y_edges = np.histogram2d(chart_data['{x}'], chart_data['{y}'], bins={size})\n"
+                    + agg_code
+                ).format(
+                    x=x,
+                    y=y,
+                    z=z,
+                    size=len(raster["x"]),
+                    agg=raster_agg,
+                    grid=dict(count="counts", sum="sums").get(
+                        raster_agg, "(sums / counts)"
+                    ),
+                )
+            )
+            chart = graph_wrapper(
+                style={"margin-right": "auto", "margin-left": "auto"},
+                figure={
+                    "data": [
+                        go.Heatmap(
+                            x=raster["x"],
+                            y=raster["y"],
+                            z=raster["z"],
+                            colorscale=hm_kwargs["colorscale"],
+                            showscale=True,
+                            colorbar={"title": z_title},
+                            hovertemplate=(
+                                "{x}: %{{x}}<br>{y}: %{{y}}<br>{z}: %{{z}}<extra></extra>"
+                            ).format(x=x, y=y, z=z_title),
+                        )
+                    ],
+                    "layout": build_layout(
+                        dict_merge(
+                            dict(
+                                xaxis=dict(title=x_title, zeroline=False),
+                                yaxis=dict(title=y_title, zeroline=False),
+                            ),
+                            build_title(x, y, z=z),
+                        )
+                    ),
+                },
+                modal=inputs.get("modal", False),
+            )
+            if export:
+                return chart
+            return wrapper(chart), code
         sort_cols = [x, y]
         if animate_by:
             sort_cols = [animate_by] + sort_cols
@@ -3512,6 +3650,157 @@ def build_choropleth(inputs, raw_data, layout):
     return chart, code
 
 
+# inputs which determine the output of build_figure_data, any others (colorscale, scale, yaxis, cpg, trendline...) only
+# change how that output is drawn
+CHART_DATA_INPUTS = [
+    "chart_type",
+    "query",
+    "x",
+    "y",
+    "z",
+    "group",
+    "group_type",
+    "group_val",
+    "bins_val",
+    "bin_type",
+    "agg",
+    "window",
+    "rolling_comp",
+    "animate_by",
+    "extended_aggregation",
+    "cleaners",
+    "dropna",
+    "zoom",
+    "load",
+    "load_type",
+    "stratified_group",
+]
+CHART_DATA_INPUT_PREFIXES = (
+    "treemap_",
+    "funnel_",
+    "clustergram_",
+    "pareto_",
+    "histogram_",
+)
+
+# cache key -> (data_id, data version, (chart data, code)) of the most recently built charts, least recently used first
+_CHART_CACHE = OrderedDict()
+_CHART_CACHE_STATS = dict(hits=0, misses=0)
+_CHART_CACHE_LOCK = threading.Lock()
+
+
+def build_chart_cache_key(data_id, inputs):
+    """
+    Builds the key chart data is cached under: the data version of the instance, its predefined filters & the inputs
+    which determine the output of :meth:`dtale.dash_application.charts.build_figure_data`.  Returns None for charts
+    which cannot be cached (data which has no version or queries referencing context variables).
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param inputs: chart inputs
+    :type inputs: dict
+    :return: str
+    """
+    data_version = global_state.get_data_version(data_id)
+    if data_version is None:
+        return None
+    if global_state.get_context_variables(data_id) and "@" in (
+        inputs.get("query") or ""
+    ):
+        return None
+    curr_settings = global_state.get_settings(data_id) or {}
+    return json.dumps(
+        [
+            str(data_id),
+            data_version,
+            curr_settings.get("predefinedFilters"),
+            {
+                k: v
+                for k, v in inputs.items()
+                if k in CHART_DATA_INPUTS or k.startswith(CHART_DATA_INPUT_PREFIXES)
+            },
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def chart_cache_info():
+    """
+    Hit rate & size of the chart data cache.
+
+    :return: dict of hits, misses, hit_rate, size & max_size
+    """
+    with _CHART_CACHE_LOCK:
+        hits, misses = _CHART_CACHE_STATS["hits"], _CHART_CACHE_STATS["misses"]
+        return dict(
+            hits=hits,
+            misses=misses,
+            hit_rate=hits / float(hits + misses) if hits + misses else 0.0,
+            size=len(_CHART_CACHE),
+            max_size=global_state.get_chart_settings().get("cache_size") or 0,
+        )
+
+
+def clear_chart_cache(data_id=None):
+    with _CHART_CACHE_LOCK:
+        if data_id is None:
+            _CHART_CACHE.clear()
+            _CHART_CACHE_STATS.update(dict(hits=0, misses=0))
+            return
+        for key in [k for k, v in _CHART_CACHE.items() if v[0] == str(data_id)]:
+            _CHART_CACHE.pop(key)
+
+
+def memoize_chart_data(func):
+    """
+    Decorator for :meth:`dtale.dash_application.charts.build_figure_data` which keeps the output of the last
+    "cache_size" (chart setting) charts built.  Callbacks which only change how a chart is drawn (colorscale, axis
+    scale, chart-per-group...) rebuild it from the cached aggregation rather than re-running the query & aggregation
+    against the full dataframe.  Entries are tied to the version of the data so any change to it invalidates them.
+    """
+
+    @functools.wraps(func)
+    def _memoized(data_id, data=None, **inputs):
+        max_size = global_state.get_chart_settings().get("cache_size") or 0
+        key = None
+        if data is None and max_size > 0:
+            data_version = global_state.get_data_version(data_id)
+            key = build_chart_cache_key(data_id, inputs)
+        if key is None:
+            return func(data_id, data=data, **inputs)
+
+        with _CHART_CACHE_LOCK:
+            cached = _CHART_CACHE.get(key)
+            if cached is not None:
+                _CHART_CACHE.move_to_end(key)
+            _CHART_CACHE_STATS["hits" if cached is not None else "misses"] += 1
+        if cached is not None:
+            logger.debug("chart data cache hit: {}".format(chart_cache_info()))
+            # chart builders alter the data they're given
+            return copy.deepcopy(cached[2])
+
+        output = func(data_id, **inputs)
+        if output[0] is None:
+            return output
+        data_id = str(data_id)
+        with _CHART_CACHE_LOCK:
+            # entries built from older versions of this data will never be hit again
+            for stale_key in [
+                k
+                for k, v in _CHART_CACHE.items()
+                if v[0] == data_id and v[1] != data_version
+            ]:
+                _CHART_CACHE.pop(stale_key)
+            _CHART_CACHE[key] = (data_id, data_version, copy.deepcopy(output))
+            while len(_CHART_CACHE) > max_size:
+                _CHART_CACHE.popitem(last=False)
+        return output
+
+    return _memoized
+
+
+@memoize_chart_data
 def build_figure_data(
     data_id,
     chart_type=None,
@@ -3532,6 +3821,7 @@ def build_figure_data(
     extended_aggregation=[],
     cleaners=[],
     dropna=True,
+    zoom=None,
     **kwargs
 ):
     """
@@ -3558,6 +3848,9 @@ def build_figure_data(
     :type window: int, optional
     :param rolling_comp: computation to use in rolling aggregations
     :type rolling_comp: str, optional
+    :param zoom: x/y window a user has zoomed into on a downsampled chart (see
+                 :meth:`dtale.charts.utils.apply_chart_zoom`)
+    :type zoom: dict, optional
     :param kwargs: optional keyword arguments, here in case invalid arguments are passed to this function
     :type kwargs: dict
     :return: dictionary of series data, min/max ranges of columns used in chart
@@ -3588,6 +3881,7 @@ def build_figure_data(
     ):
         return None, None
 
+    instance_data = data is None
     data = run_query(
         data if data is not None else handle_predefined(data_id),
         query,
@@ -3641,11 +3935,35 @@ def build_figure_data(
         chart_kwargs["animate_by"] = animate_by
     if chart_type in ZAXIS_CHARTS:
         chart_kwargs["z"] = z
+    if chart_type in DOWNSAMPLE_CHARTS:
+        chart_kwargs["downsample"] = DOWNSAMPLE_CHARTS[chart_type]
+        if agg in [None, "raw"]:
+            data, zoom_code = apply_chart_zoom(data, x, y, zoom)
+        else:  # aggregated y-values can only be windowed along the x-axis
+            data, zoom_code = apply_chart_zoom(
+                data, x, y, dict_merge(zoom, dict(y_range=None)) if zoom else None
+            )
+        if not len(data):
+            return None, None
+        code += zoom_code
     if (
         not y and chart_type != "histogram"
     ):  # this is to handle when a user wants to see the count of just the x-axis
         data.loc[:, "count"] = 1
         y = "count"
+    if (
+        chart_type == "scatter"
+        and agg in [None, "raw"]
+        and not group
+        and not extended_aggregation
+        and len(data) > global_state.get_chart_settings()["raster_points"]
+        and is_rasterizable(data, x, *make_list(y))
+    ):  # too many points to send to the browser, even downsampled, so render their density instead
+        data, chart_code = build_raster_chart(data, x, y)
+        return data, code + chart_code
+    # data passed in (EX: drilldowns) can't be aggregated from the instance's cube
+    if instance_data:
+        chart_kwargs["cube"] = load_cube(data_id, data, x, y, **chart_kwargs)
     data, chart_code = build_base_chart(data, x, y, unlimited_data=True, **chart_kwargs)
     return data, code + chart_code
 
@@ -3824,6 +4142,8 @@ def build_chart(data_id=None, data=None, **inputs):
             return build_error(data["error"], data["traceback"]), None, code, ""
 
         range_data = dict(min=data["min"], max=data["max"])
+        if "downsampled" in data:
+            range_data["downsampled"] = data["downsampled"]
         axis_inputs = inputs.get("yaxis") or {}
         chart_builder = chart_wrapper(data_id, data, inputs)
         x, y, z, agg, group, animate_by, trendline, scale, extended_aggregation = (
@@ -3867,6 +4187,23 @@ def build_chart(data_id=None, data=None, **inputs):
             chart, pie_code = pie_builder(data, x, y, chart_builder, **chart_inputs)
             return (chart, range_data, code + pie_code, export_all_charts_href)
 
+        if "raster" in data:
+            return (
+                cpg_chunker(
+                    scatter_raster_builder(
+                        data,
+                        x,
+                        y,
+                        chart_builder,
+                        colorscale=inputs.get("colorscale"),
+                        scale=scale,
+                    )
+                ),
+                range_data,
+                code,
+                export_all_charts_href,
+            )
+
         axes_builder = build_axes(
             data, x, axis_inputs, z=z, scale=scale, data_id=data_id
         )
@@ -4080,6 +4417,11 @@ def build_raw_chart(data_id=None, **inputs):
         if chart_type == "pie":
             return pie_builder(data, x, y, chart_builder, **chart_inputs)
 
+        if "raster" in data:
+            return scatter_raster_builder(
+                data, x, y, chart_builder, colorscale=colorscale
+            )
+
         axes_builder = build_axes(data, x, axis_inputs, z=z, data_id=data_id)
         if chart_type == "scatter":
             return scatter_builder(
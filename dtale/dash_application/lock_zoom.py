@@ -1,8 +1,56 @@
+import dash
 import plotly.graph_objs as go
 from dash.dependencies import Input, Output, State
 
 from dtale.charts.utils import MAX_GROUPS
+from dtale.dash_application.charts import build_chart, find_figures
 from dtale.dash_application.exceptions import DtalePreventUpdate
+from dtale.utils import dict_merge, make_list
+
+ZOOM_CHARTS = ["line", "scatter"]
+
+
+def build_zoom(relayout_data, inputs, range_data):
+    """
+    Converts the relayoutData of a chart into the x/y window the user zoomed into.  Only charts whose points were
+    downsampled need re-querying, every point of other charts has already been sent to the browser.
+
+    :param relayout_data: relayoutData of a :dash:`dash_core_components.Graph <dash-core-components/graph>`
+    :type relayout_data: dict
+    :param inputs: inputs the chart was built from
+    :type inputs: dict
+    :param range_data: min/max ranges (and whether the chart was downsampled) of the chart
+    :type range_data: dict
+    :return: zoom window (or None if the user reset the axes)
+    :rtype: dict
+    :raises DtalePreventUpdate: if the chart does not need to be re-queried
+    """
+    if (
+        not relayout_data
+        or (inputs or {}).get("chart_type") not in ZOOM_CHARTS
+        or not (range_data or {}).get("downsampled")
+    ):
+        raise DtalePreventUpdate
+    if relayout_data.get("xaxis.autorange") or relayout_data.get("yaxis.autorange"):
+        return None
+
+    def _axis_range(axis):
+        axis_range = relayout_data.get("{}.range".format(axis))
+        if axis_range is None:
+            axis_range = [
+                relayout_data.get("{}.range[{}]".format(axis, i)) for i in range(2)
+            ]
+        return axis_range if None not in axis_range else None
+
+    x_range, y_range = _axis_range("xaxis"), _axis_range("yaxis")
+    if x_range is None and y_range is None:  # EX: autosize or dragmode changes
+        raise DtalePreventUpdate
+    return dict(
+        x=inputs.get("x"),
+        y=make_list(inputs.get("y")),
+        x_range=x_range,
+        y_range=y_range,
+    )
 
 
 def init_callbacks(dash_app):
@@ -14,12 +62,32 @@ def init_callbacks(dash_app):
             figure.update_layout(scene_camera=relayout_data["scene.camera"])
         return figure
 
+    def zoom_window(chart_idx):
+        def _zoom_window(clicks, relayout_data, figure, inputs, range_data):
+            triggered = [t["prop_id"] for t in dash.callback_context.triggered]
+            if "chart-{}.relayoutData".format(chart_idx) not in triggered:
+                return lock_zoom(clicks, relayout_data, figure)
+            zoom = build_zoom(relayout_data, inputs, range_data)
+            charts, _, _, _ = build_chart(**dict_merge(inputs, dict(zoom=zoom)))
+            figures = []
+            for chart in make_list(charts):
+                find_figures(chart, figures)
+            if len(figures) < chart_idx:
+                raise DtalePreventUpdate
+            return figures[chart_idx - 1]
+
+        return _zoom_window
+
     for i in range(1, MAX_GROUPS + 1):
         dash_app.callback(
             Output("chart-{}".format(i), "figure"),
-            [Input("lock-zoom-btn", "n_clicks")],
             [
-                State("chart-{}".format(i), "relayoutData"),
+                Input("lock-zoom-btn", "n_clicks"),
+                Input("chart-{}".format(i), "relayoutData"),
+            ],
+            [
                 State("chart-{}".format(i), "figure"),
+                State("last-chart-input-data", "data"),
+                State("range-data", "data"),
             ],
-        )(lock_zoom)
+        )(zoom_window(i))
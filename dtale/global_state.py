@@ -1,10 +1,17 @@
+import copy
+import json
 import string
 import inspect
+import threading
+import uuid
 
+from collections import OrderedDict
 from logging import getLogger
+
+import pandas as pd
 from six import PY3
 
-from dtale.utils import dict_merge, format_data
+from dtale.utils import dict_merge, format_data, get_url_quote, get_url_unquote
 
 try:
     from collections.abc import MutableMapping
@@ -35,11 +42,21 @@ APP_SETTINGS = {
     "enable_custom_filters": False,
     "enable_web_uploads": False,
     "hide_row_expanders": False,
+    "profile_workers": None,
+    "profile_processes": False,
+    "upload_cache_dir": None,
+    "upload_cache_size": 1024,
 }
 
 AUTH_SETTINGS = {"active": False, "username": None, "password": None}
 
-CHART_SETTINGS = {"scatter_points": 15000, "3d_points": 40000}
+CHART_SETTINGS = {
+    "scatter_points": 15000,
+    "3d_points": 40000,
+    "raster_points": 500000,
+    "cache_size": 32,
+    "cube_memory": 0,
+}
 
 
 class DtaleInstance(object):
@@ -52,6 +69,8 @@ class DtaleInstance(object):
     _settings = None
     _name = ""
     _rows = 0
+    _data_version = None
+    _paged = False
 
     def __init__(self, data):
         self._data = data
@@ -103,6 +122,14 @@ class DtaleInstance(object):
     def settings(self):
         return self._settings
 
+    @property
+    def data_version(self):
+        return self._data_version
+
+    @property
+    def paged(self):
+        return self._paged
+
     @property
     def is_xarray_dataset(self):
         if self._dataset is not None:
@@ -112,6 +139,7 @@ class DtaleInstance(object):
     @data.setter
     def data(self, data):
         self._data = data
+        self._rows = 0 if data is None else len(data)
 
     @name.setter
     def name(self, name):
@@ -145,6 +173,10 @@ class DtaleInstance(object):
     def settings(self, settings):
         self._settings = settings
 
+    @data_version.setter
+    def data_version(self, data_version):
+        self._data_version = data_version
+
 
 LARGE_ARCTICDB = 1000000
 
@@ -244,11 +276,231 @@ class DtaleArcticDBInstance(DtaleInstance):
             pass
 
 
+PAGED_BLOCK_SIZE = 1000
+PAGED_MAX_BLOCKS = 100
+PAGED_SAMPLE_SIZE = 10000
+
+
+class DtalePagedInstance(DtaleInstance):
+    """
+    Instance whose rows live in an external source (EX: a database table) and are only fetched, in blocks, as the
+    grid requests them.  The source must implement:
+
+     - count_rows(filters=None): the total number of rows, this can be an estimate when :meth:`refresh_rows` is called
+       once the exact count is known
+     - load_rows(start, end, filters=None, sort=None): a dataframe containing rows [start, end)
+
+    "filters" contains the saved "columnFilters" & "invertFilter" settings and "sort" the grid's sort information so
+    that sources can apply them to the entire dataset (see :meth:`dtale.query.build_sql_where`).  Any keyword arguments
+    passed to :meth:`load_data` or :meth:`rows` are handed through to the source and become part of the cache key.
+    The "data" of this instance is only a sample of the first PAGED_SAMPLE_SIZE rows, this is what column-level
+    functionality (describe, charts...) will operate on.
+
+    Since the source is usually backed by a live connection, these instances are meant for the default in-memory
+    store.
+    """
+
+    _paged = True
+
+    def __init__(
+        self,
+        source,
+        data=None,
+        block_size=PAGED_BLOCK_SIZE,
+        max_blocks=PAGED_MAX_BLOCKS,
+        sample_size=PAGED_SAMPLE_SIZE,
+    ):
+        self.source = source
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self._blocks = OrderedDict()
+        self._counts = {}
+        self._lock = threading.Lock()
+        if data is None:
+            data = source.load_rows(0, sample_size)
+        super(DtalePagedInstance, self).__init__(data)
+        self._rows = source.count_rows()
+
+    def __getstate__(self):
+        # stores pickling their instances don't persist the lock or the cached blocks
+        state = dict(self.__dict__)
+        state.pop("_lock", None)
+        state["_blocks"] = OrderedDict()
+        state["_counts"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _cache_key(self, kwargs):
+        return json.dumps(kwargs, sort_keys=True, default=str)
+
+    def _load_block(self, block, **kwargs):
+        key = (block, self._cache_key(kwargs))
+        with self._lock:
+            if key in self._blocks:
+                self._blocks.move_to_end(key)
+                return self._blocks[key]
+        start = block * self.block_size
+        block_df = self.source.load_rows(start, start + self.block_size, **kwargs)
+        with self._lock:
+            self._blocks[key] = block_df
+            while len(self._blocks) > self.max_blocks:
+                self._blocks.popitem(last=False)
+        return block_df
+
+    def refresh_rows(self):
+        """Reloads the total number of rows from the source (EX: an exact count replacing an estimate)"""
+        self._rows = self.source.count_rows()
+
+    def clear_cache(self):
+        """Drops cached blocks & counts after the rows of the source have changed"""
+        with self._lock:
+            self._blocks.clear()
+            self._counts.clear()
+        self.refresh_rows()
+
+    def load_data(self, row_range=None, columns=None, **kwargs):
+        if row_range is None:
+            return self._data
+        start, end = row_range
+        end = min(end, self.rows(**kwargs))
+        if end <= start:
+            return self._data.iloc[:0]
+        blocks = [
+            self._load_block(block, **kwargs)
+            for block in range(
+                start // self.block_size, (end - 1) // self.block_size + 1
+            )
+        ]
+        offset = (start // self.block_size) * self.block_size
+        data = pd.concat(blocks, ignore_index=True) if len(blocks) > 1 else blocks[0]
+        data = data.iloc[start - offset : end - offset].reset_index(drop=True)
+        return data if columns is None else data[columns]
+
+    def rows(self, **kwargs):
+        kwargs.pop("sort", None)  # sorting doesn't change the number of rows
+        if not kwargs:
+            return self._rows
+        key = self._cache_key(kwargs)
+        if key not in self._counts:
+            self._counts[key] = self.source.count_rows(**kwargs)
+        return self._counts[key]
+
+    @property
+    def is_large(self):
+        return True
+
+    @DtaleInstance.data.setter
+    def data(self, data):
+        # only the sample is replaced, the number of rows still comes from the source
+        self._data = data
+
+
 class DtaleBaseStore(dict):
     def build_instance(self, data_id, data=None):
         return DtaleInstance(data)
 
 
+INSTANCE_FIELDS = [
+    "data",
+    "name",
+    "dataset",
+    "dataset_dim",
+    "dtypes",
+    "metadata",
+    "context_variables",
+    "history",
+    "settings",
+    "data_version",
+    "rows",
+    "paged",
+]
+
+
+class DtaleFieldStore(DtaleBaseStore):
+    """
+    Base class for serializing stores (shelve, redis...) which persist each property of a :class:`DtaleInstance`
+    under its own key ("<data_id>::data", "<data_id>::settings", ...) alongside a lightweight copy of the instance
+    stored under "<data_id>". This way updating something small like settings doesn't re-serialize the DataFrame.
+
+    Subclasses must implement _read, _write, _remove & _raw_keys against their backend.
+    """
+
+    FIELD_SEP = "::"
+
+    def _read(self, key):
+        raise NotImplementedError
+
+    def _write(self, key, value):
+        raise NotImplementedError
+
+    def _remove(self, key):
+        raise NotImplementedError
+
+    def _raw_keys(self):
+        raise NotImplementedError
+
+    def _field_key(self, key, field):
+        return "{}{}{}".format(key, self.FIELD_SEP, field)
+
+    def get(self, key):
+        key = str(key)
+        instance = self._read(key)
+        if instance is None:
+            return None
+        for field in INSTANCE_FIELDS:
+            setattr(instance, "_{}".format(field), self.get_field(key, field))
+        return instance
+
+    def get_field(self, key, field):
+        value = self._read(self._field_key(str(key), field))
+        if value is None and field == "name":
+            return ""
+        if value is None and field == "rows":
+            return 0
+        if value is None and field == "paged":
+            return False
+        return value
+
+    def set_field(self, key, field, value):
+        self._write(self._field_key(str(key), field), value)
+        if field == "data":  # keep the row count of the instance in sync with its data
+            self._write(
+                self._field_key(str(key), "rows"), 0 if value is None else len(value)
+            )
+
+    def __setitem__(self, key, value):
+        key = str(key)
+        instance = copy.copy(value)
+        for field in INSTANCE_FIELDS:
+            self.set_field(key, field, getattr(value, "_{}".format(field), None))
+            instance.__dict__.pop("_{}".format(field), None)
+        self._write(key, instance)
+
+    def __delitem__(self, key):
+        key = str(key)
+        for field in INSTANCE_FIELDS:
+            self._remove(self._field_key(key, field))
+        self._remove(key)
+
+    def __contains__(self, key):
+        return str(key) in self.keys()
+
+    def keys(self):
+        return [k for k in self._raw_keys() if self.FIELD_SEP not in k]
+
+    def to_dict(self):
+        return {k: self.get(k) for k in self.keys()}
+
+    def items(self):
+        return self.to_dict().items()
+
+    def __len__(self):
+        return len(self.keys())
+
+
 class DtaleArcticDB(DtaleBaseStore):
     """Interface allowing dtale to use 'arcticdb' databases for global data storage."""
 
@@ -346,6 +598,7 @@ class DefaultStore(object):
     def __init__(self):
         self._data_store = DtaleBaseStore()
         self._data_names = dict()
+        self._data_fingerprints = dict()
 
     # Use int for data_id for easier sorting
     def build_data_id(self):
@@ -367,6 +620,12 @@ class DefaultStore(object):
     def is_arcticdb(self):
         return isinstance(self._data_store, DtaleArcticDB)
 
+    def is_paged(self, data_id):
+        # only the "paged" marker is read so stores persisting fields separately don't load the data
+        if not self.contains(data_id):
+            return False
+        return bool(self._get_field(data_id, "paged"))
+
     # exposing  _data_store for custom data store plugins.
     @property
     def store(self):
@@ -409,7 +668,29 @@ class DefaultStore(object):
         self._data_store[data_id] = new_data
         return data_id
 
+    def _get_field(self, data_id, field):
+        if (
+            data_id is not None
+            and hasattr(self._data_store, "get_field")
+            and self.contains(data_id)
+        ):
+            return self._data_store.get_field(str(data_id), field)
+        return getattr(self.get_data_inst(data_id), field)
+
+    def _set_field(self, data_id, field, val):
+        data_id = str(data_id)
+        if hasattr(self._data_store, "set_field"):
+            if not self.contains(data_id):
+                self.new_data_inst(data_id)
+            self._data_store.set_field(data_id, field, val)
+            return
+        data_inst = self.get_data_inst(data_id)
+        setattr(data_inst, field, val)
+        self._data_store[data_id] = data_inst
+
     def get_data(self, data_id, **kwargs):
+        if not kwargs:
+            return self._get_field(data_id, "data")
         return self.get_data_inst(data_id).load_data(**kwargs)
 
     def get_data_id_by_name(self, data_name):
@@ -423,26 +704,48 @@ class DefaultStore(object):
         )
         return data_id
 
+    def get_data_id_by_fingerprint(self, fingerprint):
+        data_id = next(
+            (
+                key
+                for key, value in self._data_fingerprints.items()
+                if value == fingerprint
+            ),
+            None,
+        )
+        if data_id is not None and not self.contains(data_id):
+            self._data_fingerprints.pop(data_id, None)
+            return None
+        return data_id
+
+    def get_unfingerprinted_ids(self):
+        # unmodified data whose fingerprint wasn't built when it was loaded
+        return [
+            key
+            for key, value in list(self._data_fingerprints.items())
+            if value is None and self.contains(key)
+        ]
+
     def get_dataset(self, data_id):
-        return self.get_data_inst(data_id).dataset
+        return self._get_field(data_id, "dataset")
 
     def get_dataset_dim(self, data_id):
-        return self.get_data_inst(data_id).dataset_dim
+        return self._get_field(data_id, "dataset_dim")
 
     def get_dtypes(self, data_id):
-        return self.get_data_inst(data_id).dtypes
+        return self._get_field(data_id, "dtypes")
 
     def get_context_variables(self, data_id):
-        return self.get_data_inst(data_id).context_variables
+        return self._get_field(data_id, "context_variables")
 
     def get_history(self, data_id):
-        return self.get_data_inst(data_id).history
+        return self._get_field(data_id, "history")
 
     def get_name(self, data_id):
-        return self.get_data_inst(data_id).name
+        return self._get_field(data_id, "name")
 
     def get_settings(self, data_id):
-        return self.get_data_inst(data_id).settings
+        return self._get_field(data_id, "settings")
 
     def get_query(self, data_id):
         if load_flag(data_id, "enable_custom_filters", False):
@@ -451,7 +754,10 @@ class DefaultStore(object):
         return None
 
     def get_metadata(self, data_id):
-        return self.get_data_inst(data_id).metadata
+        return self._get_field(data_id, "metadata")
+
+    def get_data_version(self, data_id):
+        return self._get_field(data_id, "data_version")
 
     def set_data(self, data_id=None, val=None):
         if data_id is None:
@@ -459,80 +765,64 @@ class DefaultStore(object):
         data_id = str(data_id)
         if data_id not in self._data_store.keys():
             data_id = self.new_data_inst(data_id)
-        data_inst = self.get_data_inst(data_id)
-        data_inst.data = val
-        self._data_store[data_id] = data_inst
+        self._set_field(data_id, "data", val)
+        # the data no longer matches the fingerprint it was loaded with
+        self._data_fingerprints.pop(data_id, None)
+        # unique token (rather than a counter) so caches in other processes can't confuse old & new data
+        self._set_field(data_id, "data_version", uuid.uuid4().hex)
 
     def set_dataset(self, data_id, val):
-        data_id = str(data_id)
-        data_inst = self.get_data_inst(data_id)
-        data_inst.dataset = val
-        self._data_store[data_id] = data_inst
+        self._set_field(data_id, "dataset", val)
 
     def set_dataset_dim(self, data_id, val):
-        data_id = str(data_id)
-        data_inst = self.get_data_inst(data_id)
-        data_inst.dataset_dim = val
-        self._data_store[data_id] = data_inst
+        self._set_field(data_id, "dataset_dim", val)
 
     def set_dtypes(self, data_id, val):
-        data_id = str(data_id)
-        data_inst = self.get_data_inst(data_id)
-        data_inst.dtypes = val
-        self._data_store[data_id] = data_inst
+        self._set_field(data_id, "dtypes", val)
 
     def set_name(self, data_id, val):
         if val in [None, ""]:
             return
-        if val in self._data_names:
+        if val in self._data_names and self._data_names[val] != str(data_id):
             raise Exception("Name {} already exists!".format(val))
-        data_id = str(data_id)
-        data_inst = self.get_data_inst(data_id)
-        self._data_names[val] = data_id
-        data_inst.name = val
-        self._data_store[data_id] = data_inst
+        self._data_names[val] = str(data_id)
+        self._set_field(data_id, "name", val)
+
+    def set_fingerprint(self, data_id, val):
+        self._data_fingerprints[str(data_id)] = val
 
     def set_context_variables(self, data_id, val):
-        data_id = str(data_id)
-        data_inst = self.get_data_inst(data_id)
-        data_inst.context_variables = val
-        self._data_store[data_id] = data_inst
+        self._set_field(data_id, "context_variables", val)
 
     def set_settings(self, data_id, val):
-        data_id = str(data_id)
-        data_inst = self.get_data_inst(data_id)
-        data_inst.settings = val
-        self._data_store[data_id] = data_inst
+        self._set_field(data_id, "settings", val)
 
     def set_metadata(self, data_id, val):
-        data_id = str(data_id)
-        data_inst = self.get_data_inst(data_id)
-        data_inst.metadata = val
-        self._data_store[data_id] = data_inst
+        self._set_field(data_id, "metadata", val)
 
     def set_history(self, data_id, val):
-        data_id = str(data_id)
-        data_inst = self.get_data_inst(data_id)
-        data_inst.history = val
-        self._data_store[data_id] = data_inst
+        self._set_field(data_id, "history", val)
 
     def delete_instance(self, data_id):
         data_id = str(data_id)
-        instance = self._data_store.get(data_id)
-        if instance:
-            if instance.name:
-                try:
-                    del self._data_names[instance.name]
-                except KeyError:
-                    pass
+        if not self.contains(data_id):
+            return
+        name = self.get_name(data_id)
+        if name:
             try:
-                del self._data_store[data_id]
+                del self._data_names[name]
             except KeyError:
                 pass
+        self._data_fingerprints.pop(data_id, None)
+        try:
+            del self._data_store[data_id]
+        except KeyError:
+            pass
 
     def clear_store(self):
         self._data_store.clear()
         self._data_names.clear()
+        self._data_fingerprints.clear()
 
 
 """
@@ -666,6 +956,11 @@ def set_chart_settings(settings):
 
 
 def cleanup(data_id=None):
+    from dtale.charts.cube import clear_cube
+    from dtale.query import clear_view_cache
+
+    clear_view_cache(data_id)
+    clear_cube(data_id)
     if data_id is None:
         _default_store.clear_store()
     else:
@@ -776,61 +1071,39 @@ def use_shelve_store(directory):
     :return: None
     """
     import shelve
-    import time
     from os.path import join
-    from threading import Thread
 
-    class DtaleShelf(DtaleBaseStore):
+    class DtaleShelf(DtaleFieldStore):
         """Interface allowing dtale to use 'shelf' databases for global data storage."""
 
         def __init__(self, filename):
             self.filename = filename
-            self.db = shelve.open(self.filename, flag="c", writeback=True)
-            # super hacky autosave
-            t = Thread(target=self.save_db)
-            t.daemon = True
-            t.start()
+            # each property of an instance lives under its own key and is always re-assigned when it changes so
+            # writeback (which re-pickles every cached entry on sync) isn't needed
+            self.db = shelve.open(self.filename, flag="c", writeback=False)
 
-        def get(self, key):
+        def _read(self, key):
             # using str here because shelve doesn't support int keys
-            key = str(key)
-            return self.db.get(key)
+            return self.db.get(str(key))
 
-        def __setitem__(self, key, value):
-            key = str(key)
-            self.db[key] = value
+        def _write(self, key, value):
+            self.db[str(key)] = value
             self.db.sync()
 
-        def __delitem__(self, key):
-            key = str(key)
-            del self.db[key]
+        def _remove(self, key):
+            self.db.pop(str(key), None)
             self.db.sync()
 
+        def _raw_keys(self):
+            return list(self.db.keys())
+
         def __contains__(self, key):
-            key = str(key)
-            return key in self.db
+            return str(key) in self.db
 
         def clear(self):
             self.db.clear()
             self.db.sync()
 
-        def to_dict(self):
-            return dict(self.db)
-
-        def items(self):
-            return self.to_dict().items()
-
-        def keys(self):
-            return self.to_dict().keys()
-
-        def __len__(self):
-            return len(self.db)
-
-        def save_db(self):
-            while True:
-                self.db.sync()
-                time.sleep(5)
-
     def create_shelf(name):
         file_path = join(directory, name)
         return DtaleShelf(file_path)
@@ -855,47 +1128,34 @@ def use_redis_store(directory, *args, **kwargs):
     except ImportError:
         raise Exception("redislite must be installed")
 
-    class DtaleRedis(DtaleBaseStore, Redis):
+    class DtaleRedis(DtaleFieldStore, Redis):
         """Wrapper class around Redis() to make it work as a global data store in dtale."""
 
         def __init__(self, file_path, *args, **kwargs):
-            super(Redis, self).__init__(file_path, *args, **kwargs)
-
-        def __setitem__(self, key, value):
-            key = str(key)
-            self.set(key, value)
-
-        def __delitem__(self, key):
-            key = str(key)
-            super(Redis, self).__delitem__(str(key))
-
-        def __contains__(self, key):
-            key = str(key)
-            return super(Redis, self).__contains__(str(key))
+            Redis.__init__(self, file_path, *args, **kwargs)
 
-        def get(self, name, *args, **kwargs):
-            value = super(Redis, self).get(name, *args, **kwargs)
+        def _read(self, key):
+            value = Redis.get(self, key)
             if value is not None:
                 return pickle.loads(value)
 
-        def keys(self):
-            return [str(k) for k in super(Redis, self).keys()]
+        def _write(self, key, value):
+            return Redis.set(self, key, pickle.dumps(value))
 
-        def set(self, name, value, *args, **kwargs):
-            value = pickle.dumps(value)
-            return super(Redis, self).set(name, value, *args, **kwargs)
+        def _remove(self, key):
+            Redis.delete(self, key)
 
-        def clear(self):
-            self.flushdb()
-
-        def to_dict(self):
-            return {k.decode("utf-8"): self.get(k) for k in super(Redis, self).keys()}
+        def _raw_keys(self):
+            return [
+                k.decode("utf-8") if isinstance(k, bytes) else str(k)
+                for k in Redis.keys(self)
+            ]
 
-        def items(self):
-            return self.to_dict().items()
+        def __contains__(self, key):
+            return bool(Redis.exists(self, str(key)))
 
-        def __len__(self):
-            return len(self.keys())
+        def clear(self):
+            self.flushdb()
 
     def create_redis(name):
         file_path = join(directory, name + ".db")
@@ -904,6 +1164,128 @@ def use_redis_store(directory, *args, **kwargs):
     use_store(DtaleRedis, create_redis)
 
 
+def use_arrow_store(directory):
+    """
+    Configure dtale to use memory-mapped Arrow IPC files for the global data store. Each instance's dataframe is
+    written to its own file and read back through a memory-map, so multiple python processes (gunicorn workers) share
+    the same pages through the OS page cache rather than each unpickling their own copy. The remaining properties of
+    an instance (settings, dtypes...) are small and are pickled into files alongside it.
+
+    :param directory: directory that the arrow files will be stored in
+    :type directory: str
+    :return: None
+    """
+    import os
+    import pickle
+
+    import pandas as pd
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise Exception("pyarrow must be installed")
+
+    class DtaleArrow(DtaleFieldStore):
+        """Interface allowing dtale to use memory-mapped Arrow IPC files for global data storage."""
+
+        ARROW_EXT = ".arrow"
+        PICKLE_EXT = ".pkl"
+
+        def __init__(self, path):
+            self.path = path
+            if not os.path.isdir(self.path):
+                os.makedirs(self.path)
+
+        def _file_path(self, key, ext):
+            return os.path.join(self.path, get_url_quote()(str(key), safe="") + ext)
+
+        def _replace(self, file_path, write_func):
+            # write to a temporary file & swap it in so readers in other processes never see a partial file
+            tmp_path = "{}.{}.tmp".format(file_path, os.getpid())
+            try:
+                write_func(tmp_path)
+                os.replace(tmp_path, file_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        def _write_arrow(self, file_path, value):
+            table = pa.Table.from_pandas(value)
+
+            def _write(tmp_path):
+                with pa.OSFile(tmp_path, "wb") as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+
+            self._replace(file_path, _write)
+
+        def _read_arrow(self, file_path):
+            with pa.memory_map(file_path, "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+            return table.to_pandas(split_blocks=True)
+
+        def _read(self, key):
+            arrow_path = self._file_path(key, self.ARROW_EXT)
+            if os.path.exists(arrow_path):
+                return self._read_arrow(arrow_path)
+            pickle_path = self._file_path(key, self.PICKLE_EXT)
+            if os.path.exists(pickle_path):
+                with open(pickle_path, "rb") as f:
+                    return pickle.load(f)
+            return None
+
+        def _write(self, key, value):
+            # the new file is swapped in before the one with the other extension is removed so readers in other
+            # processes always find one of them
+            if isinstance(value, pd.DataFrame):
+                try:
+                    self._write_arrow(self._file_path(key, self.ARROW_EXT), value)
+                    self._remove_file(key, self.PICKLE_EXT)
+                    return
+                except (pa.ArrowException, TypeError, ValueError):
+                    # columns arrow can't represent (mixed-type objects...) fall back to pickle
+                    logger.debug(
+                        "unable to store {} as arrow, using pickle".format(key)
+                    )
+
+            def _write(tmp_path):
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            self._replace(self._file_path(key, self.PICKLE_EXT), _write)
+            self._remove_file(key, self.ARROW_EXT)
+
+        def _remove_file(self, key, ext):
+            try:
+                os.remove(self._file_path(key, ext))
+            except OSError:  # doesn't exist or was already removed by another process
+                pass
+
+        def _remove(self, key):
+            for ext in [self.ARROW_EXT, self.PICKLE_EXT]:
+                self._remove_file(key, ext)
+
+        def _raw_keys(self):
+            keys = set()
+            for file_name in os.listdir(self.path):
+                name, ext = os.path.splitext(file_name)
+                if ext in [self.ARROW_EXT, self.PICKLE_EXT]:
+                    keys.add(get_url_unquote()(name))
+            return sorted(keys)
+
+        def __contains__(self, key):
+            return os.path.exists(self._file_path(key, self.PICKLE_EXT))
+
+        def clear(self):
+            for key in self._raw_keys():
+                self._remove(key)
+
+    def create_arrow(name):
+        return DtaleArrow(os.path.join(directory, name))
+
+    use_store(DtaleArrow, create_arrow)
+
+
 def use_arcticdb_store(*args, **kwargs):
     """
     Configure dtale to use arcticdb for a persistent global data store.
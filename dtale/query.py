@@ -1,3 +1,5 @@
+import json
+
 import pandas as pd
 
 import dtale.global_state as global_state
@@ -30,6 +32,50 @@ def inner_build_query(settings, query=None):
     return joined_query_segs
 
 
+def build_sql_where(settings, sql_builder):
+    """
+    Compiles the column filters saved to an instance's settings into a parameterized SQL WHERE clause (without the
+    "WHERE" keyword).  Free-text queries & outlier filters are pandas-specific and are not included.
+
+    :param settings: instance settings (columnFilters, invertFilter...)
+    :type settings: dict
+    :param sql_builder: builder collecting the parameters of the statement
+    :type sql_builder: :class:`dtale.column_filters.SQLBuilder`
+    :return: str or None
+    """
+    from dtale.column_filters import SavedColumnFilter
+
+    clauses = []
+    for filter_cfg in (settings.get("columnFilters") or {}).values():
+        clause = SavedColumnFilter(filter_cfg).builder.update_sql_builder(sql_builder)
+        if clause is not None:
+            clauses.append("({})".format(clause))
+    if not len(clauses):
+        return None
+    where = " AND ".join(clauses)
+    if settings.get("invertFilter", False):
+        where = "NOT ({})".format(where)
+    return where
+
+
+def build_sql_order_by(sort, sql_builder):
+    """
+    Compiles the sort information from the grid into a SQL ORDER BY clause (without the "ORDER BY" keyword).
+
+    :param sort: list of [column, direction] pairs
+    :type sort: list
+    :param sql_builder: builder used for quoting column names
+    :type sql_builder: :class:`dtale.column_filters.SQLBuilder`
+    :return: str or None
+    """
+    clauses = [
+        "{} {}".format(sql_builder.col(col), direction)
+        for col, direction in sort or []
+        if direction in ["ASC", "DESC"]
+    ]
+    return ", ".join(clauses) if len(clauses) else None
+
+
 def load_index_filter(data_id):
     curr_settings = global_state.get_settings(data_id) or {}
     column_filters = curr_settings.get("columnFilters") or {}
@@ -59,7 +105,7 @@ def build_query_builder(data_id):
 
 
 def inner_build_query_builder(settings, query_builder):
-    from dtale.column_filters import ArcticDBColumnFilter
+    from dtale.column_filters import SavedColumnFilter
 
     result = None
     for p in ["columnFilters", "outlierFilters"]:
@@ -72,13 +118,13 @@ def inner_build_query_builder(settings, query_builder):
                 if col in settings.get("indexes", []):
                     idx += 1
                     continue
-                fltr = ArcticDBColumnFilter(filter_cfg)
+                fltr = SavedColumnFilter(filter_cfg)
                 result = fltr.builder.update_query_builder(query_builder)
                 idx += 1
             for col, filter_cfg in filter_items[idx:]:
                 if col in settings.get("indexes", []):
                     continue
-                fltr = ArcticDBColumnFilter(filter_cfg)
+                fltr = SavedColumnFilter(filter_cfg)
                 query_seg = fltr.builder.update_query_builder(query_builder)
                 if query_seg is not None:
                     result &= query_seg
@@ -193,6 +239,87 @@ def handle_predefined(data_id, df=None):
     return df
 
 
+# data_id -> (view key, row positions) of the last filtered view of the main grid for each instance
+_VIEW_CACHE = {}
+
+
+def build_view_key(data_id, query, sort=None, highlight_filter=False):
+    curr_settings = global_state.get_settings(data_id) or {}
+    return (
+        global_state.get_data_version(data_id),
+        json.dumps(sort, default=str),
+        query,
+        json.dumps(curr_settings.get("predefinedFilters"), sort_keys=True, default=str),
+        highlight_filter,
+    )
+
+
+def clear_view_cache(data_id=None):
+    if data_id is None:
+        _VIEW_CACHE.clear()
+    else:
+        _VIEW_CACHE.pop(str(data_id), None)
+
+
+def run_cached_query(
+    data_id, df, query, context_vars=None, sort=None, highlight_filter=False
+):
+    """
+    Wrapper around :meth:`dtale.query.run_query` for the main grid which remembers the positions of the rows which
+    survived predefined filters & the query. Subsequent requests with the same data version, sort, query, predefined
+    filters & highlighting (EX: scrolling) take those rows rather than re-running the filters.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param df: (sorted) dataframe for this instance
+    :type df: :class:`pandas:pandas.DataFrame`
+    :param query: query string
+    :type query: str
+    :param context_vars: dictionary of user-defined variables which can be referenced by name in query strings
+    :type context_vars: dict, optional
+    :param sort: sort specification applied to df, [[col1, dir1], ..., [colN, dirN]]
+    :type sort: list, optional
+    :param highlight_filter: if true, then highlight which rows will be filtered rather than drop them
+    :type highlight_filter: boolean, optional
+    :return: filtered dataframe (and filtered indexes if highlight_filter is true)
+    """
+
+    def _run():
+        return run_query(
+            handle_predefined(data_id, df),
+            query,
+            context_vars,
+            ignore_empty=True,
+            highlight_filter=highlight_filter,
+        )
+
+    data_id = str(data_id)
+    view_key = build_view_key(data_id, query, sort, highlight_filter)
+    if (
+        view_key[0] is None
+        or not df.index.is_unique
+        or (context_vars and "@" in (query or ""))
+    ):
+        return _run()
+
+    cached_key, positions, filtered_indexes = _VIEW_CACHE.get(data_id, (None,) * 3)
+    if cached_key == view_key:
+        filtered = df if positions is None else df.take(positions)
+        if highlight_filter:
+            return filtered, filtered_indexes
+        return filtered
+
+    result = _run()
+    filtered, filtered_indexes = result if highlight_filter else (result, None)
+    positions = None
+    if len(filtered) != len(df):
+        positions = df.index.get_indexer(filtered.index)
+        if (positions < 0).any():  # predefined filter handlers altered the index
+            return result
+    _VIEW_CACHE[data_id] = (view_key, positions, filtered_indexes)
+    return result
+
+
 def load_filterable_data(data_id, req, query=None, columns=None):
     filtered = get_bool_arg(req, "filtered")
     if global_state.is_arcticdb:
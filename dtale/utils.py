@@ -1,6 +1,7 @@
 from __future__ import division
 
 import decimal
+import hashlib
 import json
 import os
 import socket
@@ -319,6 +320,29 @@ def json_timestamp(x, nan_display="", **kwargs):
         return nan_display
 
 
+def format_datetimes(s):
+    """
+    Vectorized equivalent of calling :meth:`dtale.utils.json_date` with its default format on each value of a
+    datetime :class:`pandas:pandas.Series` (missing values are returned as None)
+
+    :param s: datetime series (timezone-aware series are formatted using their wall time)
+    :type s: :class:`pandas:pandas.Series`
+    :return: list of date strings
+    :rtype: list
+    """
+    if getattr(s.dt, "tz", None) is not None:
+        s = s.dt.tz_localize(None)
+    values = s.values.astype("datetime64[us]")
+    micros = values.astype("int64")
+    output = np.datetime_as_string(values, unit="us").astype(object)
+    no_micros = micros % 1000000 == 0
+    output[no_micros] = np.datetime_as_string(values[no_micros], unit="s")
+    no_time = micros % (86400 * 1000000) == 0
+    output[no_time] = np.datetime_as_string(values[no_time], unit="D")
+    output[np.isnat(values)] = None
+    return [None if v is None else v.replace("T", " ") for v in output.tolist()]
+
+
 class JSONFormatter(object):
     """
     Class for formatting dictionaries and lists of dictionaries into JSON compliant data
@@ -335,6 +359,8 @@ class JSONFormatter(object):
 
     def __init__(self, nan_display="", as_string=False):
         self.fmts = []
+        # (type, kwargs) for each entry in fmts, used by format_columns to format entire columns at once
+        self.col_specs = []
         self.nan_display = nan_display
         self.as_string = as_string
 
@@ -343,6 +369,7 @@ class JSONFormatter(object):
             return json_string(x, nan_display=nan_display)
 
         self.fmts.append([idx, name, f])
+        self.col_specs.append(("string", {}))
 
     def add_int(self, idx, name=None, as_string=False):
         def f(x, nan_display):
@@ -351,6 +378,7 @@ class JSONFormatter(object):
             )
 
         self.fmts.append([idx, name, f])
+        self.col_specs.append(("int", dict(as_string=as_string)))
 
     def add_float(self, idx, name=None, precision=6, as_string=False):
         def f(x, nan_display):
@@ -362,6 +390,7 @@ class JSONFormatter(object):
             )
 
         self.fmts.append([idx, name, f])
+        self.col_specs.append(("float", dict(precision=precision, as_string=as_string)))
 
     def add_timestamp(self, idx, name=None, as_string=False):
         def f(x, nan_display):
@@ -370,12 +399,14 @@ class JSONFormatter(object):
             )
 
         self.fmts.append([idx, name, f])
+        self.col_specs.append(("timestamp", dict(as_string=as_string)))
 
     def add_date(self, idx, name=None, fmt="%Y-%m-%d %H:%M:%S.%f"):
         def f(x, nan_display):
             return json_date(x, fmt=fmt, nan_display=nan_display)
 
         self.fmts.append([idx, name, f])
+        self.col_specs.append(("date", dict(fmt=fmt)))
 
     def add_json(self, idx, name=None):
         def f(x, nan_display):
@@ -384,6 +415,7 @@ class JSONFormatter(object):
             return x
 
         self.fmts.append([idx, name, f])
+        self.col_specs.append(("json", {}))
 
     def format_dict(self, lst):
         return {
@@ -394,6 +426,88 @@ class JSONFormatter(object):
     def format_dicts(self, lsts):
         return list(map(self.format_dict, lsts))
 
+    def format_column(self, s, f, spec):
+        """
+        Format an entire :class:`pandas:pandas.Series` at once. Output is identical to applying the formatter, f, to
+        each value but common dtypes (ints, floats, strings, booleans & datetimes) are handled using numpy/pandas
+        operations rather than calling f per value.
+
+        :param s: column to format
+        :type s: :class:`pandas:pandas.Series`
+        :param f: per-value formatter registered for this column
+        :type f: func
+        :param spec: type of formatter & its arguments
+        :type spec: tuple
+        :return: list of formatted values
+        :rtype: list
+        """
+        fmt_type, kwargs = spec
+        as_string = kwargs.get("as_string") or self.as_string
+        nan_display = self.nan_display
+        kind = s.dtype.kind if isinstance(s.dtype, np.dtype) else None
+
+        def _fill(output, mask, val):
+            for i in np.flatnonzero(mask):
+                output[i] = val
+            return output
+
+        if fmt_type == "int" and not as_string and kind in ["i", "u"]:
+            return s.tolist()
+        if fmt_type == "float" and not as_string and kind == "f":
+            values = s.values
+            precision = kwargs["precision"]
+            # builtin round rather than numpy.round because numpy.round's scaling doesn't always match it
+            output = [round(v, precision) for v in values.tolist()]
+            output = _fill(output, np.isnan(values), nan_display)
+            return _fill(output, np.isinf(values), "inf")
+        if fmt_type == "date" and s.dtype.kind == "M":
+            if kwargs["fmt"] == "%Y-%m-%d %H:%M:%S.%f":
+                output = format_datetimes(s)
+            else:
+                output = (
+                    s.dt.strftime(kwargs["fmt"])
+                    .str.replace(r"\.000000$", "", regex=True)
+                    .str.replace(r" 00:00:00$", "", regex=True)
+                    .tolist()
+                )
+            return _fill(output, s.isnull().values, nan_display)
+        if fmt_type == "string":
+            if kind == "b":
+                return np.where(s.values, "True", "False").tolist()
+            if kind == "O" and pd.api.types.infer_dtype(s, skipna=True) in [
+                "string",
+                "empty",
+            ]:
+                return _fill(s.tolist(), s.isnull().values, nan_display)
+        return [f(v, nan_display=nan_display) for v in s]
+
+    def format_columns(self, df, index_name=None, start=0):
+        """
+        Columnar equivalent of `format_dicts(df.itertuples())` which formats each column at once using
+        :meth:`dtale.utils.JSONFormatter.format_column` and then zips the results into row dictionaries.
+
+        :param df: dataframe to format
+        :type df: :class:`pandas:pandas.DataFrame`
+        :param index_name: if specified, each row will also contain this key with its row number
+        :type index_name: str, optional
+        :param start: row number of the first row in df
+        :type start: int, optional
+        :return: list of dictionaries
+        :rtype: list
+        """
+        names, columns = [], []
+        if index_name is not None:
+            names.append(index_name)
+            columns.append(range(start, start + len(df)))
+        for (idx, name, f), spec in zip(self.fmts, self.col_specs):
+            # the same positions as itertuples, 0 is the index
+            s = pd.Series(df.index) if idx == 0 else df.iloc[:, idx - 1]
+            names.append(name)
+            columns.append(self.format_column(s, f, spec))
+        if not len(columns):
+            return [{} for _ in range(len(df))]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
     def format_lists(self, df):
         return {
             name: [f(v, nan_display=self.nan_display) for v in df[name].values]
@@ -748,6 +862,36 @@ class DuplicateDataError(Exception):
         self.data_id = data_id
 
 
+def build_data_fingerprint(data):
+    """
+    Builds a content fingerprint of a dataframe so repeat loads of the same data can be detected without comparing it
+    to every dataframe already loaded.  The fingerprint covers:
+     - shape, column names & data types
+     - the hashed values of every row (vectorized by :meth:`pandas:pandas.util.hash_pandas_object`)
+
+    :param data: dataframe to fingerprint
+    :type data: :class:`pandas:pandas.DataFrame`
+    :return: str
+    """
+    digest = hashlib.sha1()
+    header = [
+        list(data.shape),
+        [[str(col), str(dtype)] for col, dtype in data.dtypes.items()],
+    ]
+    digest.update(json.dumps(header).encode("utf-8"))
+    try:
+        digest.update(pd.util.hash_pandas_object(data, index=False).values.tobytes())
+    except TypeError:
+        # unhashable values (EX: lists), only the columns containing them are hashed by their string representations
+        for _, s in data.items():
+            try:
+                hashed = pd.util.hash_pandas_object(s, index=False)
+            except TypeError:
+                hashed = pd.util.hash_pandas_object(s.astype(str), index=False)
+            digest.update(hashed.values.tobytes())
+    return digest.hexdigest()
+
+
 def triple_quote(val):
     return '"""{}"""'.format(val)
 
@@ -776,6 +920,236 @@ def export_to_parquet_buffer(data):
     return parquet_buffer
 
 
+EXPORT_CHUNK_SIZE = 100000
+
+
+def export_to_csv_chunks(data, tsv=False, columns=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Generator which yields a dataframe as CSV/TSV text in chunks of rows so that exports never need to hold the
+    entire file in memory.
+
+    :param data: dataframe to export
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param tsv: if True, use tabs as the delimiter
+    :type tsv: bool, optional
+    :param columns: columns (and their ordering) to export, defaults to all columns
+    :type columns: list, optional
+    :param chunk_size: number of rows to write per chunk
+    :type chunk_size: int, optional
+    :return: generator of str
+    """
+    kwargs = dict(index=False)
+    if tsv:
+        kwargs["sep"] = "\t"
+    columns = list(data.columns) if columns is None else columns
+    header = data.iloc[:0][columns].to_csv(**kwargs)
+
+    def _chunks():
+        if not len(data):
+            yield header
+            return
+        for start in range(0, len(data), chunk_size):
+            chunk = data.iloc[start : start + chunk_size][columns]
+            yield chunk.to_csv(header=start == 0, **kwargs)
+
+    return _chunks()
+
+
+class _ChunkSink(object):
+    """
+    Minimal writable file-like object which buffers whatever is written to it until it is drained.
+    """
+
+    def __init__(self):
+        self.buffer = BytesIO()
+        self.position = 0
+        self.closed = False
+
+    def write(self, b):
+        self.buffer.write(b)
+        self.position += len(b)
+        return len(b)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        output = self.buffer.getvalue()
+        self.buffer = BytesIO()
+        return output
+
+
+def export_to_parquet_chunks(data, columns=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Generator which yields a dataframe as a gzip-compressed parquet file one row group at a time so that exports
+    never need to hold the entire file in memory.
+
+    :param data: dataframe to export
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param columns: columns (and their ordering) to export, defaults to all columns
+    :type columns: list, optional
+    :param chunk_size: number of rows to write per row group
+    :type chunk_size: int, optional
+    :return: generator of bytes
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "In order to use the parquet exporter you must install pyarrow!"
+        )
+    columns = list(data.columns) if columns is None else columns
+    schema = pa.Schema.from_pandas(data.iloc[:0][columns], preserve_index=False)
+    for i, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            # object columns need their values inspected in order to infer their type
+            field_type = pa.array(data[field.name], from_pandas=True).type
+            schema = schema.set(i, pa.field(field.name, field_type))
+
+    def _chunks():
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema, compression="gzip")
+        try:
+            for start in range(0, len(data), chunk_size):
+                chunk = data.iloc[start : start + chunk_size][columns]
+                writer.write_table(
+                    pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                )
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+    return _chunks()
+
+
+UPLOAD_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def build_upload_cache_key(contents, *options):
+    """
+    Builds the key uploaded files are cached under: a hash of the file's contents along with the options used to
+    parse it.
+
+    :param contents: raw bytes of the uploaded file or a seekable file object, which is hashed in chunks (rather than
+                     being read into memory) and rewound for parsing
+    :type contents: bytes or file
+    :return: str
+    """
+    digest = hashlib.sha1()
+    if hasattr(contents, "read"):
+        for chunk in iter(lambda: contents.read(UPLOAD_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        contents.seek(0)
+    else:
+        digest.update(contents)
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_upload_cache(cache_dir, key):
+    """
+    Loads the parquet copies of a previously parsed upload and marks it as recently used.
+
+    :param cache_dir: directory parsed uploads are cached in
+    :type cache_dir: str
+    :param key: key built by :meth:`dtale.utils.build_upload_cache_key`
+    :type key: str
+    :return: dict of name -> :class:`pandas:pandas.DataFrame` or None if the upload has not been cached
+    """
+    index = os.path.join(cache_dir, "{}.json".format(key))
+    if not os.path.exists(index):
+        return None
+    try:
+        with open(index, "r") as f:
+            names = json.load(f)
+        dfs = {
+            name: pd.read_parquet(
+                os.path.join(cache_dir, "{}.{}.parquet".format(key, i))
+            )
+            for i, name in enumerate(names)
+        }
+        os.utime(index, None)
+        return dfs
+    except BaseException as ex:
+        logger.debug("unable to load cached upload {}: {}".format(key, ex))
+        return None
+
+
+def save_upload_cache(cache_dir, key, dfs, max_bytes=None):
+    """
+    Saves parquet copies of the dataframes parsed from an upload so repeat uploads of the same file skip parsing.
+    Dataframes which cannot be written to parquet (EX: mixed-type object columns) are not cached.
+
+    :param cache_dir: directory parsed uploads are cached in
+    :type cache_dir: str
+    :param key: key built by :meth:`dtale.utils.build_upload_cache_key`
+    :type key: str
+    :param dfs: name -> dataframe parsed from the upload
+    :type dfs: dict
+    :param max_bytes: size the cache is kept under by evicting the least recently used uploads
+    :type max_bytes: int, optional
+    """
+    try:
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        for i, df in enumerate(dfs.values()):
+            df.to_parquet(os.path.join(cache_dir, "{}.{}.parquet".format(key, i)))
+        # the index is written last so partially written caches are never loaded
+        with open(os.path.join(cache_dir, "{}.json".format(key)), "w") as f:
+            json.dump(list(dfs.keys()), f)
+    except BaseException as ex:
+        logger.debug("unable to cache upload {}: {}".format(key, ex))
+    if max_bytes:
+        evict_upload_cache(cache_dir, max_bytes, keep=key)
+
+
+def evict_upload_cache(cache_dir, max_bytes, keep=None):
+    """
+    Removes the least recently used uploads (by the modification times of their files, which loading an upload
+    refreshes) from the cache until its files take up at most `max_bytes`.
+
+    :param cache_dir: directory parsed uploads are cached in
+    :type cache_dir: str
+    :param max_bytes: maximum size of the files in the cache
+    :type max_bytes: int
+    :param keep: key of an upload which should not be evicted (EX: the one just saved)
+    :type keep: str, optional
+    """
+    entries = {}
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        size, used, paths = entries.get(name.split(".")[0], (0, 0, []))
+        entries[name.split(".")[0]] = (
+            size + stat.st_size,
+            max(used, stat.st_mtime),
+            paths + [path],
+        )
+    total = sum(size for size, _, _ in entries.values())
+    for key, (size, _, paths) in sorted(entries.items(), key=lambda e: e[1][1]):
+        if total <= max_bytes:
+            break
+        if key == keep:
+            continue
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        total -= size
+
+
 def is_app_root_defined(app_root):
     return app_root is not None and app_root != "/"
 
@@ -2,9 +2,11 @@
 from __future__ import absolute_import, division
 
 import os
+import threading
 import time
 from builtins import map, range, str, zip
 from collections import namedtuple
+from contextlib import contextmanager
 from functools import wraps
 from logging import getLogger
 
@@ -38,7 +40,12 @@ import dtale.global_state as global_state
 import dtale.pandas_util as pandas_util
 import dtale.predefined_filters as predefined_filters
 from dtale import dtale
-from dtale.charts.utils import build_base_chart, CHART_POINTS_LIMIT
+from dtale.charts.utils import (
+    RASTER_GRID_SIZE,
+    build_base_chart,
+    is_rasterizable,
+    rasterize_chart_data,
+)
 from dtale.cli.clickutils import retrieve_meta_info_and_version
 from dtale.column_analysis import ColumnAnalysis
 from dtale.column_builders import ColumnBuilder, printable
@@ -65,20 +72,23 @@ from dtale.query import (
     handle_predefined,
     load_filterable_data,
     load_index_filter,
+    run_cached_query,
     run_query,
 )
 from dtale.timeseries_analysis import TimeseriesAnalysis
 from dtale.utils import (
     DuplicateDataError,
     apply,
+    build_data_fingerprint,
     build_formatters,
     build_shutdown_url,
+    build_upload_cache_key,
     build_url,
     classify_type,
     coord_type,
     dict_merge,
     divide_chunks,
-    export_to_csv_buffer,
+    export_to_csv_chunks,
     find_dtype,
     find_dtype_formatter,
     format_data,
@@ -97,6 +107,7 @@ from dtale.utils import (
     json_timestamp,
     jsonify,
     jsonify_error,
+    load_upload_cache,
     read_file,
     make_list,
     optimize_df,
@@ -104,6 +115,7 @@ from dtale.utils import (
     retrieve_grid_params,
     running_with_flask_debug,
     running_with_pytest,
+    save_upload_cache,
     sort_df_for_grid,
     unique_count,
 )
@@ -124,6 +136,77 @@ def exception_decorator(func):
     return _handle_exceptions
 
 
+# every read-modify-write of an instance's dtypes happens under this lock so that background profiling (see
+# :meth:`dtale.views.store_profiled_columns`) and edits from the front-end (new columns, renames, type conversions...)
+# can't overwrite each other's changes
+_DTYPES_LOCK = threading.RLock()
+
+
+def dtypes_decorator(func):
+    @wraps(func)
+    def _lock_dtypes(*args, **kwargs):
+        with _DTYPES_LOCK:
+            return func(*args, **kwargs)
+
+    return _lock_dtypes
+
+
+def unpaged_decorator(func):
+    """
+    Rejects edits to instances whose rows are paged from an external source (see
+    :class:`dtale.global_state.DtalePagedInstance`).  Only a sample of their rows is held in memory so new columns,
+    renames & cell edits would never reach the rows fetched from the source.
+    """
+
+    @wraps(func)
+    def _reject_paged(*args, **kwargs):
+        data_id = kwargs.get("data_id", args[0] if len(args) else None)
+        if global_state.is_paged(data_id):
+            raise NotImplementedError(
+                "{} is not supported for data paged from an external source".format(
+                    func.__name__
+                )
+            )
+        return func(*args, **kwargs)
+
+    return _reject_paged
+
+
+# filters which are only applied in pandas and can't be handed to the source of a paged instance
+PAGED_UNSUPPORTED_FILTERS = ["query", "outlierFilters", "predefinedFilters"]
+
+
+def check_paged_filters(data_id, settings):
+    """
+    Rejects filters that can't be pushed down to the source of a paged instance, only column filters are compiled to
+    the source's query language (see :meth:`dtale.query.build_sql_where`).
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param settings: settings (or updates to them) containing filters
+    :type settings: dict
+    """
+    if not global_state.is_paged(data_id):
+        return
+
+    def _active(prop):
+        value = settings.get(prop)
+        if prop == "predefinedFilters":
+            return any(
+                v.get("active", True) and v.get("value") is not None
+                for v in (value or {}).values()
+            )
+        return bool(value)
+
+    unsupported = [prop for prop in PAGED_UNSUPPORTED_FILTERS if _active(prop)]
+    if len(unsupported):
+        raise NotImplementedError(
+            "{} can't be applied to data paged from an external source, only column filters are supported".format(
+                ", ".join(unsupported)
+            )
+        )
+
+
 def matplotlib_decorator(func):
     @wraps(func)
     def _handle_matplotlib(*args, **kwargs):
@@ -717,6 +800,103 @@ class DtaleData(object):
             logger.debug("You must ipython>=5.0 installed to use this functionality")
 
 
+def profile_column(s, col, dtype, col_index, visible=True, col_ranges=None):
+    """
+    Builds the descriptive information (missing counts, outliers, skew, kurtosis...) for a single column.  This is
+    kept at the module-level and is free of any global state so that it can be shipped to worker threads/processes.
+
+    :param s: column data
+    :type s: :class:`pandas:pandas.Series`
+    :param col: column name
+    :type col: str
+    :param dtype: column data type
+    :type dtype: str
+    :param col_index: position of the column within the dataframe
+    :type col_index: int
+    :param visible: whether the column is visible on the front-end
+    :type visible: bool, optional
+    :param col_ranges: minimum and maximum value for column (if applicable)
+    :type col_ranges: dict, optional
+    :return: dict
+    """
+    dtype_data = dict(
+        name=col,
+        dtype=dtype,
+        index=col_index,
+        visible=visible,
+        hasOutliers=0,
+        hasMissing=1,
+    )
+    dtype_data["unique_ct"] = unique_count(s)
+    dtype_data["hasMissing"] = int(s.isnull().sum())
+    all_null = dtype_data["hasMissing"] == len(s)
+    classification = classify_type(dtype)
+    if (
+        classification in ["F", "I"] and not all_null and col_ranges is not None
+    ):  # floats/ints
+        if not any((np.isnan(v) or np.isinf(v) for v in col_ranges.values())):
+            dtype_data = dict_merge(col_ranges, dtype_data)
+
+        # load outlier information
+        o_s, o_e = calc_outlier_range(s)
+        if not any((np.isnan(v) or np.isinf(v) for v in [o_s, o_e])):
+            dtype_data["hasOutliers"] += int(((s < o_s) | (s > o_e)).sum())
+            dtype_data["outlierRange"] = dict(lower=o_s, upper=o_e)
+        skew_val = pandas_util.run_function(s, "skew")
+        if skew_val is not None:
+            dtype_data["skew"] = json_float(skew_val)
+        kurt_val = pandas_util.run_function(s, "kurt")
+        if kurt_val is not None:
+            dtype_data["kurt"] = json_float(kurt_val)
+
+    if classification in ["F", "I"] and not all_null:
+        # build variance flag
+        unique_ct = dtype_data["unique_ct"]
+        check1 = (unique_ct / len(s)) < 0.1
+        check2 = False
+        if check1 and unique_ct >= 2:
+            val_counts = s.value_counts()
+            check2 = (val_counts.values[0] / val_counts.values[1]) > 20
+        dtype_data["lowVariance"] = bool(check1 and check2)
+        dtype_data["coord"] = coord_type(s)
+
+    if classification in ["D"] and not all_null:
+        timestamps = apply(s, lambda x: json_timestamp(x, np.nan))
+        skew_val = pandas_util.run_function(timestamps, "skew")
+        if skew_val is not None:
+            dtype_data["skew"] = json_float(skew_val)
+        kurt_val = pandas_util.run_function(timestamps, "kurt")
+        if kurt_val is not None:
+            dtype_data["kurt"] = json_float(kurt_val)
+
+    if classification == "S" and not dtype_data["hasMissing"]:
+        if (
+            dtype.startswith("category")
+            and classify_type(s.dtype.categories.dtype.name) == "S"
+        ):
+            dtype_data["hasMissing"] += int(
+                (apply(s, lambda x: str(x).strip()) == "").sum()
+            )
+        else:
+            dtype_data["hasMissing"] += int((s.astype("str").str.strip() == "").sum())
+
+    return dtype_data
+
+
+def _profile_column_args(data, dtypes, data_ranges, prev_dtypes, col_index, col):
+    visible = True
+    if prev_dtypes and col in prev_dtypes:
+        visible = prev_dtypes[col].get("visible", True)
+    return (
+        data[col],
+        col,
+        dtypes.get(col),
+        col_index,
+        visible,
+        data_ranges.get(col),
+    )
+
+
 def dtype_formatter(data, dtypes, data_ranges, prev_dtypes=None):
     """
     Helper function to build formatter for the descriptive information about each column in the dataframe you
@@ -736,80 +916,133 @@ def dtype_formatter(data, dtypes, data_ranges, prev_dtypes=None):
     """
 
     def _formatter(col_index, col):
-        visible = True
-        dtype = dtypes.get(col)
-        if prev_dtypes and col in prev_dtypes:
-            visible = prev_dtypes[col].get("visible", True)
-        s = data[col]
-        dtype_data = dict(
-            name=col,
-            dtype=dtype,
-            index=col_index,
-            visible=visible,
-            hasOutliers=0,
-            hasMissing=1,
+        args = _profile_column_args(
+            data, dtypes, data_ranges, prev_dtypes, col_index, col
         )
         if global_state.is_arcticdb:
-            return dtype_data
+            s, col, dtype, col_index, visible, _ = args
+            return dict(
+                name=col,
+                dtype=dtype,
+                index=col_index,
+                visible=visible,
+                hasOutliers=0,
+                hasMissing=1,
+            )
+        return profile_column(*args)
 
-        dtype_data["unique_ct"] = unique_count(s)
-        dtype_data["hasMissing"] = int(s.isnull().sum())
-        classification = classify_type(dtype)
-        if (
-            classification in ["F", "I"] and not s.isnull().all() and col in data_ranges
-        ):  # floats/ints
-            col_ranges = data_ranges[col]
-            if not any((np.isnan(v) or np.isinf(v) for v in col_ranges.values())):
-                dtype_data = dict_merge(col_ranges, dtype_data)
-
-            # load outlier information
-            o_s, o_e = calc_outlier_range(s)
-            if not any((np.isnan(v) or np.isinf(v) for v in [o_s, o_e])):
-                dtype_data["hasOutliers"] += int(((s < o_s) | (s > o_e)).sum())
-                dtype_data["outlierRange"] = dict(lower=o_s, upper=o_e)
-            skew_val = pandas_util.run_function(s, "skew")
-            if skew_val is not None:
-                dtype_data["skew"] = json_float(skew_val)
-            kurt_val = pandas_util.run_function(s, "kurt")
-            if kurt_val is not None:
-                dtype_data["kurt"] = json_float(kurt_val)
-
-        if classification in ["F", "I"] and not s.isnull().all():
-            # build variance flag
-            unique_ct = dtype_data["unique_ct"]
-            check1 = (unique_ct / len(data[col])) < 0.1
-            check2 = False
-            if check1 and unique_ct >= 2:
-                val_counts = s.value_counts()
-                check2 = (val_counts.values[0] / val_counts.values[1]) > 20
-            dtype_data["lowVariance"] = bool(check1 and check2)
-            dtype_data["coord"] = coord_type(s)
-
-        if classification in ["D"] and not s.isnull().all():
-            timestamps = apply(s, lambda x: json_timestamp(x, np.nan))
-            skew_val = pandas_util.run_function(timestamps, "skew")
-            if skew_val is not None:
-                dtype_data["skew"] = json_float(skew_val)
-            kurt_val = pandas_util.run_function(timestamps, "kurt")
-            if kurt_val is not None:
-                dtype_data["kurt"] = json_float(kurt_val)
-
-        if classification == "S" and not dtype_data["hasMissing"]:
-            if (
-                dtype.startswith("category")
-                and classify_type(s.dtype.categories.dtype.name) == "S"
-            ):
-                dtype_data["hasMissing"] += int(
-                    (apply(s, lambda x: str(x).strip()) == "").sum()
-                )
-            else:
-                dtype_data["hasMissing"] += int(
-                    (s.astype("str").str.strip() == "").sum()
-                )
+    return _formatter
 
-        return dtype_data
 
-    return _formatter
+@contextmanager
+def column_profilers(workers=None, processes=False):
+    """
+    Context manager yielding the pools :meth:`dtale.views.profile_columns` profiles columns with so they can be
+    created once and shared by every batch of columns profiled, rather than starting up a new pool (and new
+    processes) for each batch.  Yields None when profiling will be serial.
+
+    :param workers: number of workers in each pool
+    :type workers: int, optional
+    :param processes: if True, also create a process pool for object-dtype columns
+    :type processes: bool, optional
+    :return: dict of "threads" & optionally "processes" executors or None
+    """
+    if (workers or 1) <= 1 or global_state.is_arcticdb:
+        yield None
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    executors = dict(threads=ThreadPoolExecutor(max_workers=workers))
+    if processes:
+        executors["processes"] = ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield executors
+    finally:
+        for executor in executors.values():
+            executor.shutdown()
+
+
+def profile_columns(
+    data,
+    dtypes,
+    data_ranges,
+    prev_dtypes,
+    columns,
+    workers=None,
+    processes=False,
+    executors=None,
+):
+    """
+    Builds the descriptive information for a list of (column index, column name) pairs.  When more than one worker
+    is specified the columns will be profiled concurrently using a thread pool (most of this work is done in numpy
+    /pandas routines which release the GIL).  If "processes" is True then object-dtype columns, whose profiling is
+    mostly pure-python, will be sent to a process pool instead.  Results are always returned in the order of
+    "columns" and are identical to profiling them serially.
+
+    :param data: dataframe
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param dtypes: column data type
+    :type dtypes: dict
+    :param data_ranges: dictionary containing minimum and maximum value for column (if applicable)
+    :type data_ranges: dict
+    :param prev_dtypes: previous column information for syncing updates to pre-existing columns
+    :type prev_dtypes: dict
+    :param columns: list of (column index, column name) pairs to profile
+    :type columns: list
+    :param workers: number of workers to profile columns with
+    :type workers: int, optional
+    :param processes: if True, profile object-dtype columns in a process pool
+    :type processes: bool, optional
+    :param executors: pools from :meth:`dtale.views.column_profilers` to profile with, if not specified pools will be
+                      created for this call
+    :type executors: dict, optional
+    :return: list of dict
+    """
+    dtype_f = dtype_formatter(data, dtypes, data_ranges, prev_dtypes)
+    if (workers or 1) <= 1 or len(columns) <= 1 or global_state.is_arcticdb:
+        return [dtype_f(i, c) for i, c in columns]
+
+    def _is_object(col):
+        return processes and data[col].dtype == np.dtype("O")
+
+    proc_cols = [(i, c) for i, c in columns if _is_object(c)]
+    if executors is None:
+        with column_profilers(
+            min(workers, len(columns)), processes=len(proc_cols) > 0
+        ) as executors:
+            return profile_columns(
+                data,
+                dtypes,
+                data_ranges,
+                prev_dtypes,
+                columns,
+                workers=workers,
+                processes=processes,
+                executors=executors,
+            )
+
+    if "processes" not in executors:
+        proc_cols = []
+    proc_indexes = set(i for i, _ in proc_cols)
+    thread_cols = [(i, c) for i, c in columns if i not in proc_indexes]
+    proc_futures = [
+        (
+            c,
+            executors["processes"].submit(
+                profile_column,
+                *_profile_column_args(data, dtypes, data_ranges, prev_dtypes, i, c)
+            ),
+        )
+        for i, c in proc_cols
+    ]
+    thread_futures = [
+        (c, executors["threads"].submit(dtype_f, i, c)) for i, c in thread_cols
+    ]
+    results = {}
+    for c, future in thread_futures + proc_futures:
+        results[c] = future.result()
+    return [results[c] for _, c in columns]
 
 
 def calc_data_ranges(data, dtypes={}):
@@ -831,38 +1064,261 @@ def calc_data_ranges(data, dtypes={}):
             return {}
 
 
-def build_dtypes_state(data, prev_state=None, ranges=None):
+def build_dtypes_state(
+    data, prev_state=None, ranges=None, refresh=None, workers=None, processes=False
+):
     """
     Helper function to build globally managed state pertaining to a D-Tale instances columns & data types
 
     :param data: dataframe to build data type information for
     :type data: :class:`pandas:pandas.DataFrame`
+    :param prev_state: previous column information for syncing updates to pre-existing columns
+    :type prev_state: list, optional
+    :param ranges: dictionary containing minimum and maximum value for each column
+    :type ranges: dict, optional
+    :param refresh: if specified, only these columns (along with any columns which are new or whose data type has
+                    changed) will have their information recalculated, all others will reuse their information from
+                    prev_state
+    :type refresh: list, optional
+    :param workers: number of workers to spread column profiling across (defaults to serial)
+    :type workers: int, optional
+    :param processes: if True, profile object-dtype columns in a process pool rather than a thread pool
+    :type processes: bool, optional
     :return: a list of dictionaries containing column names, indexes and data types
     """
     prev_dtypes = {c["name"]: c for c in prev_state or []}
     dtypes = get_dtypes(data)
-    loaded_ranges = ranges or calc_data_ranges(data, dtypes)
-    dtype_f = dtype_formatter(data, dtypes, loaded_ranges, prev_dtypes)
-    return [dtype_f(i, c) for i, c in enumerate(data.columns)]
+
+    def _reuse(col):
+        if refresh is None or col in refresh:
+            return False
+        prev_dtype = prev_dtypes.get(col, {})
+        return not prev_dtype.get("pending") and prev_dtype.get("dtype") == dtypes[col]
+
+    profile_cols = [c for c in data.columns if not _reuse(c)]
+    if ranges:
+        loaded_ranges = ranges
+    elif not len(profile_cols):
+        loaded_ranges = {}
+    elif len(profile_cols) == len(data.columns):
+        loaded_ranges = calc_data_ranges(data, dtypes)
+    else:
+        loaded_ranges = calc_data_ranges(data[profile_cols], dtypes)
+    profiled = profile_columns(
+        data,
+        dtypes,
+        loaded_ranges,
+        prev_dtypes,
+        [(i, c) for i, c in enumerate(data.columns) if not _reuse(c)],
+        workers=workers,
+        processes=processes,
+    )
+    profiled = dict(zip([c for c in data.columns if not _reuse(c)], profiled))
+    return [
+        dict_merge(prev_dtypes[c], dict(index=i)) if _reuse(c) else profiled[c]
+        for i, c in enumerate(data.columns)
+    ]
+
+
+def build_pending_dtypes_state(data, prev_state=None):
+    """
+    Helper function to build the bare minimum of column information (names, indexes & data types) for a dataframe.
+    Every column will be flagged as "pending" until :meth:`dtale.views.profile_in_background` or
+    :meth:`dtale.views.load_dtype_info` fills in the rest of its descriptive information.
+
+    :param data: dataframe to build data type information for
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param prev_state: previous column information for syncing updates to pre-existing columns
+    :type prev_state: list, optional
+    :return: a list of dictionaries containing column names, indexes and data types
+    """
+    prev_dtypes = {c["name"]: c for c in prev_state or []}
+    dtypes = get_dtypes(data)
+    return [
+        dict(
+            name=c,
+            dtype=dtypes[c],
+            index=i,
+            visible=prev_dtypes.get(c, {}).get("visible", True),
+            hasOutliers=0,
+            hasMissing=1,
+            pending=True,
+        )
+        for i, c in enumerate(data.columns)
+    ]
+
+
+_PROFILING = {}
+
+
+def is_profiling(data_id):
+    """
+    Whether the columns of a D-Tale instance are still being profiled in the background
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :return: bool
+    """
+    return data_id in _PROFILING
+
+
+def store_profiled_columns(data_id, data_version, profiled):
+    """
+    Swaps in the descriptive information for columns which are still flagged as "pending" for a D-Tale instance.
+    Updates built against an older version of the data are ignored.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param data_version: version of the data the columns were profiled against
+    :type data_version: str
+    :param profiled: list of column information built by :meth:`dtale.views.profile_columns`
+    :type profiled: list
+    """
+    with _DTYPES_LOCK:
+        if not global_state.contains(data_id):
+            return
+        if global_state.get_data_version(data_id) != data_version:
+            return
+        profiled = {c["name"]: c for c in profiled}
+
+        def _merge(col):
+            if not col.get("pending") or col["name"] not in profiled:
+                return col
+            return dict_merge(
+                profiled[col["name"]], dict(index=col["index"], visible=col["visible"])
+            )
+
+        dtypes = global_state.get_dtypes(data_id) or []
+        global_state.set_dtypes(data_id, [_merge(col) for col in dtypes])
+
+
+def profile_in_background(data_id, data, ranges=None, workers=None, processes=False):
+    """
+    Profiles the columns of a D-Tale instance on a daemon thread, storing the results as each batch of columns
+    completes so that consumers can pick them up as soon as they're available.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param data: dataframe to profile
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param ranges: dictionary containing minimum and maximum value for each column
+    :type ranges: dict, optional
+    :param workers: number of workers to spread column profiling across (defaults to serial)
+    :type workers: int, optional
+    :param processes: if True, profile object-dtype columns in a process pool rather than a thread pool
+    :type processes: bool, optional
+    :return: :class:`threading.Thread`
+    """
+    data_version = global_state.get_data_version(data_id)
+
+    def _profile():
+        try:
+            dtypes = get_dtypes(data)
+            loaded_ranges = ranges or calc_data_ranges(data, dtypes)
+            columns = list(enumerate(data.columns))
+            batch_size = max(workers or 1, 1) * 4
+            has_objects = any(data[c].dtype == np.dtype("O") for _, c in columns)
+            with column_profilers(
+                workers, processes=processes and has_objects
+            ) as executors:
+                for start in range(0, len(columns), batch_size):
+                    if global_state.get_data_version(data_id) != data_version:
+                        break
+                    profiled = profile_columns(
+                        data,
+                        dtypes,
+                        loaded_ranges,
+                        {},
+                        columns[start : start + batch_size],
+                        workers=workers,
+                        processes=processes,
+                        executors=executors,
+                    )
+                    store_profiled_columns(data_id, data_version, profiled)
+        except BaseException:
+            logger.exception("Error profiling columns for {}".format(data_id))
+        finally:
+            if _PROFILING.get(data_id) is thread:
+                _PROFILING.pop(data_id, None)
+
+    thread = threading.Thread(target=_profile)
+    thread.daemon = True
+    _PROFILING[data_id] = thread
+    thread.start()
+    return thread
+
+
+def load_dtype_info(data_id, col):
+    """
+    Returns the information for a column, profiling it on-demand if it is still flagged as "pending"
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param col: column name
+    :type col: str
+    :return: dict
+    """
+    dtype_info = global_state.get_dtype_info(data_id, col)
+    if dtype_info is None or not dtype_info.get("pending"):
+        return dtype_info
+    data_version = global_state.get_data_version(data_id)
+    data = global_state.get_data(data_id)[[col]]
+    dtypes = get_dtypes(data)
+    dtype_f = dtype_formatter(data, dtypes, calc_data_ranges(data, dtypes))
+    store_profiled_columns(data_id, data_version, [dtype_f(dtype_info["index"], col)])
+    return global_state.get_dtype_info(data_id, col)
+
+
+def find_duplicate_data(data, fingerprint=None):
+    """
+    Looks up the content fingerprint (see :meth:`dtale.utils.build_data_fingerprint`) of a piece of data in the
+    fingerprints of unmodified data loaded previously.  Data is only fingerprinted when it's loaded if duplicates are
+    being checked for, so the fingerprints of any other data loaded are built here as they're needed (and only for data
+    with the same shape, columns & data types).
+
+    :param data: dataframe to look up
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param fingerprint: pre-computed fingerprint of `data`
+    :type fingerprint: str, optional
+    :return: data_id of the duplicate data or None
+    """
+    fingerprint = fingerprint or build_data_fingerprint(data)
+    data_id = global_state.get_data_id_by_fingerprint(fingerprint)
+    if data_id is not None:
+        return data_id
+    for data_id in global_state.get_unfingerprinted_ids():
+        data_version = global_state.get_data_version(data_id)
+        existing = global_state.get_data(data_id)
+        if (
+            existing is None
+            or existing.shape != data.shape
+            or not existing.dtypes.equals(data.dtypes)
+        ):
+            continue
+        existing_fingerprint = build_data_fingerprint(existing)
+        if global_state.get_data_version(data_id) != data_version:
+            continue
+        global_state.set_fingerprint(data_id, existing_fingerprint)
+        if existing_fingerprint == fingerprint:
+            return data_id
+    return None
 
 
-def check_duplicate_data(data):
+def check_duplicate_data(data, fingerprint=None):
     """
-    This function will do a rough check to see if a user has already loaded this piece of data to D-Tale to avoid
-    duplicated state.  The checks that take place are:
-     - shape (# of rows & # of columns
-     - column names and ordering of columns (eventually might add dtype checking as well...)
+    This function will check to see if a user has already loaded this piece of data to D-Tale to avoid duplicated
+    state.  Rather than comparing against every piece of data loaded it looks up the content fingerprint of the data
+    (see :meth:`dtale.views.find_duplicate_data`).
 
     :param data: dataframe to validate
     :type data: :class:`pandas:pandas.DataFrame`
+    :param fingerprint: pre-computed fingerprint of `data`
+    :type fingerprint: str, optional
     :raises :class:`dtale.utils.DuplicateDataError`: if duplicate data exists
     """
-    cols = [str(col) for col in data.columns]
-
-    for d_id, datainst in global_state.items():
-        d_cols = [str(col) for col in datainst.data.columns]
-        if datainst.data.shape == data.shape and cols == d_cols:
-            raise DuplicateDataError(d_id)
+    data_id = find_duplicate_data(data, fingerprint)
+    if data_id is not None:
+        raise DuplicateDataError(data_id)
 
 
 def convert_xarray_to_dataset(dataset, **indexers):
@@ -914,6 +1370,7 @@ def startup(
     data_id=None,
     context_vars=None,
     ignore_duplicate=True,
+    reuse_duplicate=False,
     allow_cell_edits=True,
     inplace=False,
     drop_index=False,
@@ -945,6 +1402,9 @@ def startup(
     force_save=True,
     main_title=None,
     main_title_font=None,
+    profile_workers=None,
+    profile_processes=None,
+    lazy_profiling=False,
 ):
     """
     Loads and stores data globally
@@ -962,6 +1422,9 @@ def startup(
                          such as filters
     :type context_vars: dict, optional
     :param ignore_duplicate: if set to True this will not test whether this data matches any previously loaded to D-Tale
+    :param reuse_duplicate: if set to True and identical data (by content fingerprint) has already been loaded to D-Tale
+                            and left unmodified then that instance will be returned rather than storing another copy
+    :type reuse_duplicate: bool, optional
     :param allow_cell_edits: If false, this will not allow users to edit cells directly in their D-Tale grid
     :type allow_cell_edits: bool, optional
     :param inplace: If true, this will call `reset_index(inplace=True)` on the dataframe used as a way to save memory.
@@ -1010,6 +1473,16 @@ def startup(
     :param highlight_filter: if True, then highlight rows on the frontend which will be filtered when applying a filter
                              rather than hiding them from the dataframe
     :type highlight_filter: boolean, optional
+    :param profile_workers: number of workers to spread the profiling of columns across, defaults to the
+                            "profile_workers" app setting
+    :type profile_workers: int, optional
+    :param profile_processes: if True, profile object-dtype columns in a process pool, defaults to the
+                              "profile_processes" app setting
+    :type profile_processes: boolean, optional
+    :param lazy_profiling: if True, only column names & data types will be loaded before returning and the remaining
+                           column information (missing counts, outliers, skew, kurtosis...) will be profiled in the
+                           background
+    :type lazy_profiling: boolean, optional
     """
 
     if (
@@ -1076,6 +1549,9 @@ def startup(
             enable_web_uploads=enable_web_uploads,
             main_title=main_title,
             main_title_font=main_title_font,
+            profile_workers=profile_workers,
+            profile_processes=profile_processes,
+            lazy_profiling=lazy_profiling,
         )
         startup_code = (
             "from arcticdb import Arctic\n"
@@ -1152,6 +1628,9 @@ def startup(
                 enable_web_uploads=enable_web_uploads,
                 main_title=main_title,
                 main_title_font=main_title_font,
+                profile_workers=profile_workers,
+                profile_processes=profile_processes,
+                lazy_profiling=lazy_profiling,
             )
 
             global_state.set_dataset(instance._data_id, data)
@@ -1159,9 +1638,26 @@ def startup(
             return instance
 
         data, curr_index = format_data(data, inplace=inplace, drop_index=drop_index)
-        # check to see if this dataframe has already been loaded to D-Tale
-        if data_id is None and not ignore_duplicate and not global_state.is_arcticdb:
-            check_duplicate_data(data)
+        fingerprint = None
+        # hashing every row isn't free so data is only fingerprinted when duplicates are being checked for, the
+        # fingerprints of data loaded without them are built if & when they're needed
+        if (
+            data_id is None
+            and not global_state.is_arcticdb
+            and (reuse_duplicate or not ignore_duplicate)
+        ):
+            fingerprint = build_data_fingerprint(data)
+            existing_id = find_duplicate_data(data, fingerprint)
+            if (
+                reuse_duplicate
+                and existing_id is not None
+                and name in [None, "", global_state.get_name(existing_id)]
+            ):
+                logger.debug("reusing duplicate data loaded to {}".format(existing_id))
+                return DtaleData(existing_id, url, is_proxy=is_proxy, app_root=app_root)
+            # check to see if this dataframe has already been loaded to D-Tale
+            if not ignore_duplicate and existing_id is not None:
+                raise DuplicateDataError(existing_id)
 
         logger.debug(
             "pytest: {}, flask-debug: {}".format(
@@ -1239,6 +1735,8 @@ def startup(
         ):
             data = data[curr_locked + [c for c in data.columns if c not in curr_locked]]
             global_state.set_data(data_id, data)
+            if not global_state.is_arcticdb:
+                global_state.set_fingerprint(data_id, fingerprint)
         dtypes_data = data
         ranges = None
         if global_state.is_arcticdb:
@@ -1253,9 +1751,24 @@ def startup(
                     curr_locked
                     + [c for c in dtypes_data.columns if c not in curr_locked]
                 ]
-        dtypes_state = build_dtypes_state(
-            dtypes_data, global_state.get_dtypes(data_id) or [], ranges=ranges
-        )
+        app_settings = global_state.get_app_settings()
+        if profile_workers is None:
+            profile_workers = app_settings.get("profile_workers")
+        if profile_processes is None:
+            profile_processes = app_settings.get("profile_processes")
+        lazy_profiling = lazy_profiling and not global_state.is_arcticdb
+        if lazy_profiling:
+            dtypes_state = build_pending_dtypes_state(
+                dtypes_data, global_state.get_dtypes(data_id) or []
+            )
+        else:
+            dtypes_state = build_dtypes_state(
+                dtypes_data,
+                global_state.get_dtypes(data_id) or [],
+                ranges=ranges,
+                workers=profile_workers,
+                processes=profile_processes,
+            )
 
         for col in dtypes_state:
             if show_columns and col["name"] not in show_columns:
@@ -1272,7 +1785,16 @@ def startup(
             for col in dtypes_state:
                 if col["name"] in is_empty:
                     col["visible"] = False
-        global_state.set_dtypes(data_id, dtypes_state)
+        with _DTYPES_LOCK:
+            global_state.set_dtypes(data_id, dtypes_state)
+        if lazy_profiling:
+            profile_in_background(
+                data_id,
+                dtypes_data,
+                ranges=ranges,
+                workers=profile_workers,
+                processes=profile_processes,
+            )
         global_state.set_context_variables(
             data_id, build_context_variables(data_id, context_vars)
         )
@@ -1295,6 +1817,45 @@ def startup(
         raise NoDataLoadedException("No data has been loaded into this D-Tale session!")
 
 
+def startup_paged(
+    url="",
+    source=None,
+    data_id=None,
+    block_size=global_state.PAGED_BLOCK_SIZE,
+    max_blocks=global_state.PAGED_MAX_BLOCKS,
+    sample_size=global_state.PAGED_SAMPLE_SIZE,
+    **kwargs
+):
+    """
+    Loads a D-Tale instance whose rows are fetched from an external source (EX: a database table) in blocks as the
+    grid scrolls rather than loading the entire dataset into memory.  Column-level functionality will operate on a
+    sample of the first "sample_size" rows and actions altering the data (building columns, renames, cell edits...)
+    are rejected.
+
+    :param url: the base URL that D-Tale is running from to be referenced in redirects
+    :type url: str
+    :param source: object implementing count_rows(**kwargs) & load_rows(start, end, **kwargs)
+    :param data_id: identifier for the instance, defaults to the next available integer
+    :type data_id: str, optional
+    :param block_size: number of rows to fetch from the source at a time
+    :type block_size: int, optional
+    :param max_blocks: maximum number of blocks to keep cached
+    :type max_blocks: int, optional
+    :param sample_size: number of rows to load for column-level functionality
+    :type sample_size: int, optional
+    :param kwargs: any additional keyword arguments supported by :meth:`dtale.views.startup`
+    :return: :class:`dtale.views.DtaleData`
+    """
+    instance = global_state.DtalePagedInstance(
+        source, block_size=block_size, max_blocks=max_blocks, sample_size=sample_size
+    )
+    data_id = global_state.new_data_inst(data_id, instance=instance)
+    kwargs.setdefault(
+        "allow_cell_edits", False
+    )  # edits are rejected, see unpaged_decorator
+    return startup(url, data=instance.load_data(), data_id=data_id, **kwargs)
+
+
 def is_vscode():
     if os.environ.get("VSCODE_PID") is not None:
         return True
@@ -1635,6 +2196,7 @@ def update_settings(data_id):
     if not global_state.load_flag(data_id, "enable_custom_filters", False):
         updated_settings.pop("query", None)
 
+    check_paged_filters(data_id, updated_settings)
     global_state.update_settings(data_id, updated_settings)
     return jsonify(dict(success=True))
 
@@ -1754,6 +2316,7 @@ def save_range_highlights(data_id):
     return jsonify(dict(success=True))
 
 
+@dtypes_decorator
 def refresh_col_indexes(data_id):
     """
     Helper function to sync column indexes to current state of dataframe for data_id.
@@ -1841,6 +2404,7 @@ def update_locked(data_id):
 
 @dtale.route("/update-visibility/<data_id>", methods=["POST"])
 @exception_decorator
+@dtypes_decorator
 def update_visibility(data_id):
     """
     :class:`flask:flask.Flask` route to handle saving state associated visiblity of columns on the front-end
@@ -1876,6 +2440,8 @@ def update_visibility(data_id):
 
 @dtale.route("/build-column/<data_id>")
 @exception_decorator
+@dtypes_decorator
+@unpaged_decorator
 def build_column(data_id):
     """
     :class:`flask:flask.Flask` route to handle the building of new columns in a dataframe. Some of the operations the
@@ -2016,6 +2582,8 @@ def reshape_data(data_id):
 
 @dtale.route("/build-replacement/<data_id>")
 @exception_decorator
+@dtypes_decorator
+@unpaged_decorator
 def build_replacement(data_id):
     """
     :class:`flask:flask.Flask` route to handle the replacement of specific values within a column in a dataframe. Some
@@ -2136,10 +2704,16 @@ def dtypes(data_id):
             ...,
             {index: N, name: colN, dtype: float64}
         ],
+        profiling: True if column information is still being loaded in the background (these columns will be
+                   flagged as "pending"),
         success: True/False
     }
     """
-    return jsonify(dtypes=global_state.get_dtypes(data_id), success=True)
+    return jsonify(
+        dtypes=global_state.get_dtypes(data_id),
+        profiling=is_profiling(data_id),
+        success=True,
+    )
 
 
 def build_sequential_diffs(s, col, sort=None):
@@ -2298,7 +2872,7 @@ def describe(data_id):
     data = load_filterable_data(data_id, request, columns=columns_to_load)
     data = data[[column]]
     additional_aggs = None
-    dtype = global_state.get_dtype_info(data_id, column)
+    dtype = load_dtype_info(data_id, column)
     classification = classify_type(dtype["dtype"])
     if classification == "I":
         additional_aggs = ["sum", "median", "mode", "var", "sem"]
@@ -2430,7 +3004,7 @@ def variance(data_id):
     check1 = bool((unique_ct / s_size) < 0.1)
     code.append("check1 = (unique_ct / s_size) < 0.1")
     return_data = dict(check1=dict(unique=unique_ct, size=s_size, result=check1))
-    dtype = global_state.get_dtype_info(data_id, column)
+    dtype = load_dtype_info(data_id, column)
     if unique_ct >= 2:
         val_counts = s.value_counts()
         check2 = bool((val_counts.values[0] / val_counts.values[1]) > 20)
@@ -2540,7 +3114,8 @@ def toggle_outlier_filter(data_id):
             k: v for k, v in outlierFilters.items() if k != column
         }
     else:
-        dtype_info = global_state.get_dtype_info(data_id, column)
+        check_paged_filters(data_id, dict(outlierFilters={column: {}}))
+        dtype_info = load_dtype_info(data_id, column)
         outlier_range, min_val, max_val = (
             dtype_info.get(p) for p in ["outlierRange", "min", "max"]
         )
@@ -2555,6 +3130,8 @@ def toggle_outlier_filter(data_id):
 
 @dtale.route("/delete-col/<data_id>")
 @exception_decorator
+@dtypes_decorator
+@unpaged_decorator
 def delete_col(data_id):
     columns = get_json_arg(request, "cols")
     data = global_state.get_data(data_id)
@@ -2576,6 +3153,8 @@ def delete_col(data_id):
 
 @dtale.route("/rename-col/<data_id>")
 @exception_decorator
+@dtypes_decorator
+@unpaged_decorator
 def rename_col(data_id):
     column = get_str_arg(request, "col")
     rename = get_str_arg(request, "rename")
@@ -2604,6 +3183,8 @@ def rename_col(data_id):
 
 @dtale.route("/duplicate-col/<data_id>")
 @exception_decorator
+@dtypes_decorator
+@unpaged_decorator
 def duplicate_col(data_id):
     column = get_str_arg(request, "col")
     data = global_state.get_data(data_id)
@@ -2637,6 +3218,8 @@ def duplicate_col(data_id):
 
 @dtale.route("/edit-cell/<data_id>")
 @exception_decorator
+@dtypes_decorator
+@unpaged_decorator
 def edit_cell(data_id):
     column = get_str_arg(request, "col")
     row_index = get_int_arg(request, "rowIndex")
@@ -2727,7 +3310,7 @@ def edit_cell(data_id):
 
 
 def build_filter_vals(series, data_id, column, fmt):
-    dtype_info = global_state.get_dtype_info(data_id, column)
+    dtype_info = load_dtype_info(data_id, column)
     vals = list(series.dropna().unique())
     try:
         vals = sorted(vals)
@@ -2784,6 +3367,45 @@ def save_column_filter(data_id):
     return jsonify(success=True, currFilters=curr_filters)
 
 
+def load_row_ranges(instance, ids, total, columns, locked, f, **kwargs):
+    """
+    Loads the rows requested by the grid from instances which can load specific row ranges (ArcticDB, paged
+    datasources...) and formats them for the front-end.
+
+    :param instance: instance to load rows from
+    :type instance: :class:`dtale.global_state.DtaleInstance`
+    :param ids: dash separated strings "START-END" stating ranges of row indexes to be returned to the screen
+    :type ids: list
+    :param total: total number of rows available
+    :type total: int
+    :param columns: columns to load
+    :type columns: list
+    :param locked: locked columns which need to be moved to the front
+    :type locked: list
+    :param f: grid formatter
+    :type f: :class:`dtale.utils.JSONFormatter`
+    :return: dict of row index -> formatted row
+    """
+    results = {}
+    for sub_range in ids:
+        sub_range = list(map(int, sub_range.split("-")))
+        if len(sub_range) == 1:
+            start, end = sub_range[0], sub_range[0]
+        else:
+            start, end = sub_range
+        sub_df = instance.load_data(
+            row_range=[start, total if end >= total else end + 1],
+            columns=columns,
+            **kwargs
+        )
+        sub_df, _ = format_data(sub_df)
+        sub_df = sub_df[locked + [c for c in sub_df.columns if c not in locked]]
+        sub_df = f.format_columns(sub_df, index_name=IDX_COL, start=start)
+        for i, d in zip(range(start, end + 1), sub_df):
+            results[i] = d
+    return results
+
+
 @dtale.route("/data/<data_id>")
 @exception_decorator
 def get_data(data_id):
@@ -2856,8 +3478,7 @@ def get_data(data_id):
                 data = data[
                     curr_locked + [c for c in data.columns if c not in curr_locked]
                 ]
-                results = f.format_dicts(data.itertuples())
-                results = [dict_merge({IDX_COL: i}, r) for i, r in enumerate(results)]
+                results = f.format_columns(data, index_name=IDX_COL)
             elif query_builder:
                 df = instance.load_data(
                     query_builder=query_builder,
@@ -2873,10 +3494,10 @@ def get_data(data_id):
                     sub_range = list(map(int, sub_range.split("-")))
                     if len(sub_range) == 1:
                         sub_df = df.iloc[sub_range[0] : sub_range[0] + 1]
-                        sub_df = f.format_dicts(sub_df.itertuples())
-                        results[sub_range[0]] = dict_merge(
-                            {IDX_COL: sub_range[0]}, sub_df[0]
+                        sub_df = f.format_columns(
+                            sub_df, index_name=IDX_COL, start=sub_range[0]
                         )
+                        results[sub_range[0]] = sub_df[0]
                     else:
                         [start, end] = sub_range
                         sub_df = (
@@ -2884,9 +3505,11 @@ def get_data(data_id):
                             if end >= total - 1
                             else df.iloc[start : end + 1]
                         )
-                        sub_df = f.format_dicts(sub_df.itertuples())
+                        sub_df = f.format_columns(
+                            sub_df, index_name=IDX_COL, start=start
+                        )
                         for i, d in zip(range(start, end + 1), sub_df):
-                            results[i] = dict_merge({IDX_COL: i}, d)
+                            results[i] = d
             elif len(date_range):
                 df = instance.load_data(columns=columns_to_load, **date_range)
                 total = len(df)
@@ -2896,10 +3519,10 @@ def get_data(data_id):
                     sub_range = list(map(int, sub_range.split("-")))
                     if len(sub_range) == 1:
                         sub_df = df.iloc[sub_range[0] : sub_range[0] + 1]
-                        sub_df = f.format_dicts(sub_df.itertuples())
-                        results[sub_range[0]] = dict_merge(
-                            {IDX_COL: sub_range[0]}, sub_df[0]
+                        sub_df = f.format_columns(
+                            sub_df, index_name=IDX_COL, start=sub_range[0]
                         )
+                        results[sub_range[0]] = sub_df[0]
                     else:
                         [start, end] = sub_range
                         sub_df = (
@@ -2907,40 +3530,53 @@ def get_data(data_id):
                             if end >= total - 1
                             else df.iloc[start : end + 1]
                         )
-                        sub_df = f.format_dicts(sub_df.itertuples())
-                        for i, d in zip(range(start, end + 1), sub_df):
-                            results[i] = dict_merge({IDX_COL: i}, d)
-            else:
-                for sub_range in ids:
-                    sub_range = list(map(int, sub_range.split("-")))
-                    if len(sub_range) == 1:
-                        sub_df = instance.load_data(
-                            row_range=[sub_range[0], sub_range[0] + 1],
-                            columns=columns_to_load,
-                        )
-                        sub_df, _ = format_data(sub_df)
-                        sub_df = sub_df[
-                            curr_locked
-                            + [c for c in sub_df.columns if c not in curr_locked]
-                        ]
-                        sub_df = f.format_dicts(sub_df.itertuples())
-                        results[sub_range[0]] = dict_merge(
-                            {IDX_COL: sub_range[0]}, sub_df[0]
-                        )
-                    else:
-                        [start, end] = sub_range
-                        sub_df = instance.load_data(
-                            row_range=[start, total if end >= total else end + 1],
-                            columns=columns_to_load,
+                        sub_df = f.format_columns(
+                            sub_df, index_name=IDX_COL, start=start
                         )
-                        sub_df, _ = format_data(sub_df)
-                        sub_df = sub_df[
-                            curr_locked
-                            + [c for c in sub_df.columns if c not in curr_locked]
-                        ]
-                        sub_df = f.format_dicts(sub_df.itertuples())
                         for i, d in zip(range(start, end + 1), sub_df):
-                            results[i] = dict_merge({IDX_COL: i}, d)
+                            results[i] = d
+            else:
+                results = load_row_ranges(
+                    instance, ids, total, columns_to_load, curr_locked, f
+                )
+    elif global_state.is_paged(data_id):
+        check_paged_filters(
+            data_id,
+            dict_merge(curr_settings, dict(query=global_state.get_query(data_id))),
+        )
+        col_types = global_state.get_dtypes(data_id) or []
+        columns_to_load = [c["name"] for c in col_types if c["visible"]]
+        f = grid_formatter(
+            [c for c in col_types if c["visible"]],
+            nan_display=curr_settings.get("nanDisplay", "nan"),
+        )
+        if params.get("sort") is not None:
+            curr_settings = dict_merge(curr_settings, dict(sortInfo=params["sort"]))
+        else:
+            curr_settings = {k: v for k, v in curr_settings.items() if k != "sortInfo"}
+        global_state.set_settings(data_id, curr_settings)
+        # sorts & column filters are handed to the source so they can be applied to the full dataset
+        paged_kwargs = {}
+        column_filters = curr_settings.get("columnFilters") or {}
+        if len(column_filters):
+            paged_kwargs["filters"] = dict(
+                columnFilters=column_filters,
+                invertFilter=curr_settings.get("invertFilter", False),
+            )
+        if params.get("sort"):
+            paged_kwargs["sort"] = params["sort"]
+        instance = global_state.store.get(data_id)
+        total = instance.rows(**paged_kwargs)
+        results = {}
+        if total:
+            if export:
+                export_rows = get_int_arg(request, "export_rows") or total
+                ids = ["0-{}".format(min(export_rows, total) - 1)]
+            results = load_row_ranges(
+                instance, ids, total, columns_to_load, curr_locked, f, **paged_kwargs
+            )
+            if export:
+                results = [results[i] for i in sorted(results)]
     else:
         data = global_state.get_data(data_id)
 
@@ -2950,11 +3586,14 @@ def get_data(data_id):
         if any(c not in curr_dtypes for c in data.columns):
             data, _ = format_data(data)
             data = data[curr_locked + [c for c in data.columns if c not in curr_locked]]
-            global_state.set_data(data_id, data)
-            global_state.set_dtypes(
-                data_id,
-                build_dtypes_state(data, global_state.get_dtypes(data_id) or []),
-            )
+            with _DTYPES_LOCK:
+                global_state.set_data(data_id, data)
+                global_state.set_dtypes(
+                    data_id,
+                    build_dtypes_state(
+                        data, global_state.get_dtypes(data_id) or [], refresh=[]
+                    ),
+                )
 
         col_types = global_state.get_dtypes(data_id)
         f = grid_formatter(
@@ -2968,11 +3607,12 @@ def get_data(data_id):
         else:
             curr_settings = {k: v for k, v in curr_settings.items() if k != "sortInfo"}
         filtered_indexes = []
-        data = run_query(
-            handle_predefined(data_id),
+        data = run_cached_query(
+            data_id,
+            data,
             final_query,
             global_state.get_context_variables(data_id),
-            ignore_empty=True,
+            sort=params.get("sort"),
             highlight_filter=highlight_filter,
         )
         if highlight_filter:
@@ -2986,17 +3626,16 @@ def get_data(data_id):
                 export_rows = get_int_arg(request, "export_rows")
                 if export_rows:
                     data = data.head(export_rows)
-                results = f.format_dicts(data.itertuples())
-                results = [dict_merge({IDX_COL: i}, r) for i, r in enumerate(results)]
+                results = f.format_columns(data, index_name=IDX_COL)
             else:
                 for sub_range in ids:
                     sub_range = list(map(int, sub_range.split("-")))
                     if len(sub_range) == 1:
                         sub_df = data.iloc[sub_range[0] : sub_range[0] + 1]
-                        sub_df = f.format_dicts(sub_df.itertuples())
-                        results[sub_range[0]] = dict_merge(
-                            {IDX_COL: sub_range[0]}, sub_df[0]
+                        sub_df = f.format_columns(
+                            sub_df, index_name=IDX_COL, start=sub_range[0]
                         )
+                        results[sub_range[0]] = sub_df[0]
                         if highlight_filter and sub_range[0] in filtered_indexes:
                             results[sub_range[0]]["__filtered"] = True
                     else:
@@ -3006,9 +3645,11 @@ def get_data(data_id):
                             if end >= total - 1
                             else data.iloc[start : end + 1]
                         )
-                        sub_df = f.format_dicts(sub_df.itertuples())
+                        sub_df = f.format_columns(
+                            sub_df, index_name=IDX_COL, start=start
+                        )
                         for i, d in zip(range(start, end + 1), sub_df):
-                            results[i] = dict_merge({IDX_COL: i}, d)
+                            results[i] = d
                             if highlight_filter and i in filtered_indexes:
                                 results[i]["__filtered"] = True
     columns = [
@@ -3095,7 +3736,10 @@ def load_filtered_ranges(data_id):
     if not final_query:
         return {}
     curr_filtered_ranges = curr_settings.get("filteredRanges", {})
-    if final_query == curr_filtered_ranges.get("query"):
+    data_version = global_state.get_data_version(data_id)
+    if final_query == curr_filtered_ranges.get("query") and data_version == (
+        curr_filtered_ranges.get("dataVersion")
+    ):
         return jsonify(curr_filtered_ranges)
     data = run_query(
         handle_predefined(data_id),
@@ -3111,8 +3755,16 @@ def load_filtered_ranges(data_id):
 
     numeric_cols = [col for col in data.columns if _filter_numeric(col)]
     filtered_ranges = calc_data_ranges(data[numeric_cols])
+    app_settings = global_state.get_app_settings()
+    # requests can lower the number of workers used but never exceed the "profile_workers" app setting
+    max_workers = app_settings.get("profile_workers") or 1
+    workers = get_int_arg(request, "workers", max_workers)
     updated_dtypes = build_dtypes_state(
-        data, global_state.get_dtypes(data_id) or [], filtered_ranges
+        data,
+        global_state.get_dtypes(data_id) or [],
+        filtered_ranges,
+        workers=max(min(workers or 1, max_workers), 1),
+        processes=app_settings.get("profile_processes"),
     )
     updated_dtypes = {col["name"]: col for col in updated_dtypes}
     overall_min, overall_max = None, None
@@ -3121,6 +3773,7 @@ def load_filtered_ranges(data_id):
         overall_max = max([v["max"] for v in filtered_ranges.values()])
     curr_settings["filteredRanges"] = dict(
         query=final_query,
+        dataVersion=data_version,
         ranges=filtered_ranges,
         dtypes=updated_dtypes,
         overall=dict(min=overall_min, max=overall_max),
@@ -3139,27 +3792,21 @@ def data_export(data_id):
         global_state.get_context_variables(data_id),
         ignore_empty=True,
     )
-    data = data[
-        [
-            c["name"]
-            for c in sorted(curr_dtypes, key=lambda c: c["index"])
-            if c["visible"]
-        ]
+    columns = [
+        c["name"] for c in sorted(curr_dtypes, key=lambda c: c["index"]) if c["visible"]
     ]
     file_type = get_str_arg(request, "type", "csv")
     if file_type in ["csv", "tsv"]:
         tsv = file_type == "tsv"
-        csv_buffer = export_to_csv_buffer(data, tsv=tsv)
+        csv_chunks = export_to_csv_chunks(data, tsv=tsv, columns=columns)
         filename = build_chart_filename("data", ext=file_type)
-        return send_file(csv_buffer.getvalue(), filename, "text/{}".format(file_type))
+        return send_file_stream(csv_chunks, filename, "text/{}".format(file_type))
     elif file_type == "parquet":
-        from dtale.utils import export_to_parquet_buffer
+        from dtale.utils import export_to_parquet_chunks
 
-        parquet_buffer = export_to_parquet_buffer(data)
+        parquet_chunks = export_to_parquet_chunks(data, columns=columns)
         filename = build_chart_filename("data", ext="parquet.gzip")
-        return send_file(
-            parquet_buffer.getvalue(), filename, "application/octet-stream"
-        )
+        return send_file_stream(parquet_chunks, filename, "application/octet-stream")
     return jsonify(success=False)
 
 
@@ -3607,7 +4254,8 @@ def get_scatter(data_id):
             spearman: 0.879,
         }
         x: col1,
-        y: col2
+        y: col2,
+        raster: {total: 1000000, points: 9876} (only when the points were binned into a grid of counts)
     } or {error: 'Exception message', traceback: 'Exception stacktrace'}
     """
     cols = get_json_arg(request, "cols")
@@ -3706,17 +4354,28 @@ def get_scatter(data_id):
         ).format(col1=col1, col2=col2, idx_col=idx_col)
     )
 
-    max_points = global_state.get_chart_settings()["scatter_points"]
-    if len(data) > max_points:
-        return jsonify(
-            stats=stats,
-            code="\n".join(code),
-            error="Dataset exceeds {:,} records, cannot render scatter. Please apply filter...".format(
-                max_points
-            ),
-            traceback=CHART_POINTS_LIMIT,
+    chart_settings = global_state.get_chart_settings()
+    if len(data) > chart_settings["raster_points"] and is_rasterizable(data, *cols):
+        # bin the points into a grid, each occupied cell is returned as a point holding the count of points within it
+        size = min(RASTER_GRID_SIZE, int(np.sqrt(chart_settings["scatter_points"])))
+        raster = rasterize_chart_data(data, col1, col2, size=size)
+        y_pos, x_pos = np.nonzero(~np.isnan(raster["z"]))
+        raster_data = pd.DataFrame(
+            {
+                col1: raster["x"][x_pos],
+                col2: raster["y"][y_pos],
+                "count": raster["z"][y_pos, x_pos].astype("int"),
+            }
+        )
+        data, _code = build_base_chart(
+            raster_data, col1, [col2, "count"], allow_duplicates=True
+        )
+        data["raster"] = dict(total=raster["points"], points=len(raster_data))
+    else:
+        # scatters exceeding the points limit are downsampled (stats above are still computed from all points)
+        data, _code = build_base_chart(
+            data, cols[0], y_cols, allow_duplicates=True, downsample="grid"
         )
-    data, _code = build_base_chart(data, cols[0], y_cols, allow_duplicates=True)
     data["x"] = cols[0]
     data["y"] = cols[1]
     data["stats"] = stats
@@ -3865,6 +4524,13 @@ def send_file(output, filename, content_type):
     return resp
 
 
+def send_file_stream(chunks, filename, content_type):
+    resp = Response(chunks)
+    resp.headers["Content-Disposition"] = "attachment; filename=%s" % filename
+    resp.headers["Content-Type"] = content_type
+    return resp
+
+
 @dtale.route("/chart-export/<data_id>")
 @exception_decorator
 def chart_export(data_id):
@@ -3960,20 +4626,38 @@ def build_csv_kwargs(request):
 def upload():
     if not request.files:
         raise Exception("No file data loaded!")
+    cache_dir = global_state.get_app_settings().get("upload_cache_dir")
+    cache_size = global_state.get_app_settings().get("upload_cache_size")
+    cache_bytes = int(cache_size * 1024**2) if cache_size else None
     for filename in request.files:
         contents = request.files[filename]
         _, ext = os.path.splitext(filename)
         if ext in [".csv", ".tsv"]:
             kwargs = build_csv_kwargs(request)
-            df = pd.read_csv(
-                StringIO(contents.read().decode()), engine="python", **kwargs
-            )
+            raw = contents.read()
+            cache_key = build_upload_cache_key(raw, kwargs) if cache_dir else None
+            cached = load_upload_cache(cache_dir, cache_key) if cache_dir else None
+            if cached:
+                df = cached["data"]
+            else:
+                df = pd.read_csv(StringIO(raw.decode()), engine="python", **kwargs)
+                if cache_dir:
+                    save_upload_cache(
+                        cache_dir, cache_key, {"data": df}, max_bytes=cache_bytes
+                    )
             return load_new_data(
                 df, "df = pd.read_csv('{}', engine='python', sep=None)".format(filename)
             )
         if ext in [".xls", ".xlsx"]:
             engine = "xlrd" if ext == ".xls" else "openpyxl"
-            dfs = pd.read_excel(contents, sheet_name=None, engine=engine)
+            if cache_dir:
+                cache_key = build_upload_cache_key(contents, engine)
+                dfs = load_upload_cache(cache_dir, cache_key)
+                if dfs is None:
+                    dfs = pd.read_excel(contents, sheet_name=None, engine=engine)
+                    save_upload_cache(cache_dir, cache_key, dfs, max_bytes=cache_bytes)
+            else:
+                dfs = pd.read_excel(contents, sheet_name=None, engine=engine)
 
             def build_xls_code(sheet_name):
                 return "df = pd.read_excel('{}', sheet_name='{}', engine='{}')".format(
@@ -4275,6 +4959,8 @@ def build_missingno_chart(chart_type, data_id):
 
 @dtale.route("/drop-filtered-rows/<data_id>")
 @exception_decorator
+@dtypes_decorator
+@unpaged_decorator
 def drop_filtered_rows(data_id):
     curr_settings = global_state.get_settings(data_id) or {}
     final_query = build_query(data_id, global_state.get_query(data_id))
@@ -160,6 +160,9 @@ export const Correlations: React.FC = () => {
       const data = chart.data.datasets[point[0].datasetIndex].data;
       if (data) {
         const index = (data[point[0].index] as corrUtils.CorrelationScatterPoint)?._corr_index;
+        if (index === undefined) {
+          return; // points of rasterized scatters are cells rather than rows
+        }
         const updatedQuery: string[] = [];
         if (chartData.query) {
           updatedQuery.push(chartData.query);
@@ -65,6 +65,15 @@ export const createScatter = (
     scatterCfg.options.plugins.tooltip.callbacks.title = (tooltipItems: Array<TooltipItem<'scatter'>>): string[] =>
       additionalProps.map((p) => `${p}: ${(tooltipItems[0].raw as CorrelationScatterPoint)[p] ?? ''}`);
   }
+  if ((data as chartUtils.DataSpec & { raster?: unknown }).raster) {
+    const dataset = scatterCfg.data.datasets[0];
+    const counts = (dataset.data as CorrelationScatterPoint[]).map((p) => p.count as number);
+    const densityScale = chroma.scale(['#c6dbef', '#08306b']).domain([0, Math.log1p(Math.max(...counts))]);
+    const colors = counts.map((count) => densityScale(Math.log1p(count)).hex());
+    dataset.pointBackgroundColor = colors;
+    dataset.pointHoverBackgroundColor = colors;
+    dataset.pointStyle = 'rect';
+  }
   scatterCfg.options = { ...scatterCfg.options, onClick, maintainAspectRatio: false };
   delete scatterCfg.options.scales?.x?.ticks;
   chartUtils.updateLegend(scatterCfg, true);
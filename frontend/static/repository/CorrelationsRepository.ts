@@ -125,6 +125,8 @@ export interface ScatterResponse extends DataSpec, GenericRepository.BaseRespons
   code: string;
   date: string;
   stats: CorrelationStats;
+  /** populated when the points were binned into a grid, each point is then a cell holding a "count" of points */
+  raster?: { total: number; points: number };
 }
 
 /**
@@ -84,6 +84,7 @@ setup(
     extras_require={
         "arctic": ["arctic <= 1.79.4"],
         "arcticdb": ["arcticdb"],
+        "arrow": ["pyarrow"],
         "dash-bio": [
             "ParmEd==3.4.3; python_version == '3.6'",
             "dash-bio; python_version > '3.0'",
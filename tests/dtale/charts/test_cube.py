@@ -0,0 +1,94 @@
+import mock
+import numpy as np
+import pandas as pd
+import pytest
+
+import dtale.global_state as global_state
+from dtale.charts.cube import CUBE_AGGS, clear_cube, cube_info, load_cube
+from dtale.utils import dict_merge
+from tests.dtale import build_data_inst
+
+
+def build_cube_data(size=1000):
+    np.random.seed(0)
+    df = pd.DataFrame(
+        dict(
+            a=np.random.randint(0, 10, size),
+            b=np.random.choice(["x", "y", "z", None], size),
+            c=np.random.randn(size) * 3 + 1e6,
+            d=np.random.randint(0, 100, size),
+            e=np.random.randn(size),
+        )
+    )
+    df.loc[::7, "c"] = np.nan
+    return df
+
+
+def cube_settings(cube_memory=16):
+    return dict_merge(global_state.get_chart_settings(), dict(cube_memory=cube_memory))
+
+
+@pytest.mark.unit
+def test_aggregate():
+    df = build_cube_data()
+    build_data_inst({"1": df})
+    with mock.patch("dtale.global_state.CHART_SETTINGS", cube_settings()):
+        cube = load_cube("1", df, "a", ["c", "d"], group_col=["b"])
+        for agg in CUBE_AGGS:
+            for dims in [["a"], ["b", "a"]]:
+                expected = getattr(df.groupby(dims)[["c", "d"]], agg)()
+                output = cube.aggregate(dims, ["c", "d"], agg)
+                pd.testing.assert_frame_equal(output, expected, check_exact=False)
+
+        aliased = cube.with_aliases({"x": "a"})
+        output = aliased.aggregate(["b", "x"], ["c"], "mean")
+        assert output.index.names == ["b", "x"]
+        assert cube.aggregate(["b", "a"], ["c"], "mean").index.names == ["b", "a"]
+        # codes of a & b, groups of a & b/a, partials of c & d by a & b/a
+        assert cube_info()["entries"] == 8
+    clear_cube()
+
+
+@pytest.mark.unit
+def test_load_cube():
+    df = build_cube_data()
+    build_data_inst({"1": df})
+    assert load_cube("1", df, "a", ["c"]) is None  # disabled by default
+
+    with mock.patch("dtale.global_state.CHART_SETTINGS", cube_settings()):
+        assert load_cube("1", df, "a", ["c"]) is not None
+        assert load_cube("1", df.head(10), "a", ["c"]) is None
+        assert load_cube("1", df, "a|M", ["c"]) is None
+        assert load_cube("1", df, "a", ["b"]) is None
+        assert load_cube("1", df, "a", ["c"], group_col=["e"]) is None
+        assert (
+            load_cube("1", df, "a", ["c"], group_col=["d"], group_type="bins") is None
+        )
+        assert load_cube("1", df, "a", ["c"], group_col=["b"], dropna=False) is None
+        assert load_cube("1", df, "a", ["c"], group_val=[{"b": "x"}]) is None
+        assert load_cube("1", df, "a", ["c"], z="d") is None
+
+        cube = load_cube("1", df, "a", ["d"])
+        assert cube.aggregate(["a"], ["d"], "sum")["d"].sum() == df["d"].sum()
+
+        build_data_inst({"1": df.assign(d=df["d"] * 2)})  # new data version
+        cube = load_cube("1", global_state.get_data("1"), "a", ["d"])
+        assert cube.aggregate(["a"], ["d"], "sum")["d"].sum() == df["d"].sum() * 2
+        assert cube_info()["entries"] == 3
+
+        global_state.cleanup("1")
+        assert cube_info()["entries"] == 0
+    clear_cube()
+
+
+@pytest.mark.unit
+def test_cube_memory():
+    df = build_cube_data(size=100000)
+    build_data_inst({"1": df})
+    with mock.patch("dtale.global_state.CHART_SETTINGS", cube_settings(cube_memory=1)):
+        cube = load_cube("1", df, "a", ["c", "d", "e"])
+        for col in ["c", "d", "e"]:
+            cube.aggregate(["a"], [col], "mean")
+            cube.aggregate(["b", "a"], [col], "mean")
+            assert 0 < cube_info()["bytes"] <= cube_info()["max_bytes"]
+    clear_cube()
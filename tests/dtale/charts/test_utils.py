@@ -1,4 +1,6 @@
 import mock
+import numpy as np
+import pandas as pd
 import pytest
 
 import dtale.charts.utils as chart_utils
@@ -149,3 +151,54 @@ def test_build_agg_data(unittest, rolling_data):
             build_col_def("mean", "1"),
         ],
     )
+
+
+@pytest.mark.unit
+def test_compute_aggs_first_last_pct():
+    import dtale.pandas_util as pandas_util
+
+    rs = np.random.RandomState(0)
+    df = pd.DataFrame(
+        dict(
+            x=rs.randint(0, 20, 1000),
+            g=rs.randint(0, 3, 1000).astype(float),
+            f=rs.randn(1000),
+            s=rs.choice(list("abc"), 1000),
+        )
+    )
+    df.loc[rs.rand(1000) < 0.05, "f"] = np.nan
+    df.loc[rs.rand(1000) < 0.02, "g"] = np.nan
+    idx_cols = ["g", "x"]
+    groups = pandas_util.groupby(df, idx_cols)
+
+    def _compute(agg, cols):
+        output, _, _ = chart_utils.compute_aggs(df, groups, {agg: cols}, idx_cols, "g")
+        return output
+
+    # the first/last values of each group after sorting by that value
+    for agg, func in [("first", "head"), ("last", "tail")]:
+        for col in ["f", "s"]:
+            expected = (
+                groups[[col]]
+                .apply(lambda x: getattr(x.sort_values(by=col), func)(1))
+                .reset_index(-1, drop=True)[col]
+            )
+            pd.testing.assert_series_equal(
+                _compute(agg, [col])[build_col_def(agg, col)],
+                expected,
+                check_names=False,
+            )
+
+    # percentages of the totals of each x-value (including rows whose group is NaN)
+    expected = groups["f"].sum() / df.groupby("x")["f"].sum() * 100
+    pd.testing.assert_series_equal(
+        _compute("pctsum", ["f"])[build_col_def("pctsum", "f")],
+        expected.reorder_levels(idx_cols),
+        check_names=False,
+    )
+    expected = groups["f"].size() / df.groupby("x")["f"].size() * 100
+    pd.testing.assert_series_equal(
+        _compute("pctct", ["f"])[build_col_def("pctct", "f")],
+        expected.reorder_levels(idx_cols),
+        check_names=False,
+    )
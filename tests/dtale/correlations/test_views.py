@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 import json
+import mock
 import platform
 import pytest
 
@@ -9,7 +10,6 @@ from pkg_resources import parse_version
 import dtale.global_state as global_state
 import dtale.pandas_util as pandas_util
 
-from dtale.charts.utils import CHART_POINTS_LIMIT
 
 from tests.dtale.test_views import app, build_ts_data
 from tests.dtale import build_data_inst, build_settings, build_dtypes
@@ -460,7 +460,7 @@ def test_get_scatter(unittest, rolling_data):
         params = dict(dateCol="date", cols=json.dumps(["foo", "bar"]), date="20000101")
         response = c.get("/dtale/scatter/{}".format(c.port), query_string=params)
         response_data = response.get_json()
-        expected = dict(
+        expected_stats = dict(
             stats={
                 "correlated": 15001,
                 "only_in_s0": 0,
@@ -483,14 +483,32 @@ def test_get_scatter(unittest, rolling_data):
                 ),
                 "spearman": 1.0,
             },
-            error="Dataset exceeds 15,000 records, cannot render scatter. Please apply filter...",
-            traceback=CHART_POINTS_LIMIT,
         )
         unittest.assertEqual(
-            {k: v for k, v in response_data.items() if k != "code"},
-            expected,
-            "should return scatter",
+            {k: v for k, v in response_data.items() if k == "stats"},
+            expected_stats,
+            "should return stats for all points",
         )
+        # scatters exceeding the points limit are downsampled rather than refused
+        assert "error" not in response_data
+        downsampled = response_data["downsampled"]
+        assert downsampled["total"] == 15001
+        assert downsampled["points"] <= 15000
+        assert len(response_data["data"]["all"]["x"]) == downsampled["points"]
+
+        # scatters exceeding the raster limit are binned into a grid of counts
+        with mock.patch(
+            "dtale.global_state.CHART_SETTINGS",
+            {"scatter_points": 15000, "3d_points": 40000, "raster_points": 10000},
+        ):
+            response = c.get("/dtale/scatter/{}".format(c.port), query_string=params)
+            response_data = response.get_json()
+        assert response_data["stats"]["correlated"] == 15001
+        assert response_data["raster"]["total"] == 15001
+        raster_data = response_data["data"]["all"]
+        assert sorted(raster_data) == ["bar", "count", "x"]
+        assert len(raster_data["x"]) == response_data["raster"]["points"]
+        assert sum(raster_data["count"]) == 15001
 
     with app.test_client() as c:
         build_data_inst({c.port: test_data})
@@ -3094,6 +3094,84 @@ def test_build_figure_data():
         )
 
 
+@pytest.mark.unit
+def test_build_figure_data_cache():
+    import dtale.dash_application.charts as charts
+
+    charts.clear_chart_cache()
+    df = pd.DataFrame(dict(a=[1, 2, 3, 1], b=[4, 5, 6, 7]))
+    build_data_inst({"1": df})
+    inputs = dict(chart_type="bar", x="a", y=["b"], agg="sum")
+    with mock.patch(
+        "dtale.dash_application.charts.run_query", side_effect=charts.run_query
+    ) as run_query:
+        data, code = charts.build_figure_data("1", colorscale="Reds", **inputs)
+        data["data"]["all"].pop("_filter_", None)
+        cached_data, cached_code = charts.build_figure_data(
+            "1", colorscale="Blues", **inputs
+        )
+        assert run_query.call_count == 1
+        assert cached_data["data"]["all"]["b||sum"] == [11, 5, 6]
+        assert cached_code == code
+        assert charts.chart_cache_info()["hits"] == 1
+
+        charts.build_figure_data("1", **dict_merge(inputs, dict(agg="mean")))
+        assert run_query.call_count == 2
+
+        build_data_inst({"1": df.assign(b=df["b"] * 2)})  # new data version
+        data, _ = charts.build_figure_data("1", **inputs)
+        assert run_query.call_count == 3
+        assert data["data"]["all"]["b||sum"] == [22, 10, 12]
+        assert charts.chart_cache_info()["size"] == 1
+
+        settings = dict_merge(global_state.get_chart_settings(), dict(cache_size=0))
+        with mock.patch("dtale.global_state.CHART_SETTINGS", settings):
+            charts.build_figure_data("1", **inputs)
+            assert run_query.call_count == 4
+    charts.clear_chart_cache()
+
+
+@pytest.mark.unit
+def test_build_figure_data_cube():
+    import dtale.dash_application.charts as charts
+    from dtale.charts.cube import clear_cube, cube_info
+
+    np.random.seed(0)
+    df = pd.DataFrame(
+        dict(
+            a=np.random.randint(0, 10, 500),
+            b=np.random.choice(["x", "y"], 500),
+            c=np.random.randn(500),
+            d=np.random.randint(0, 100, 500),
+        )
+    )
+    build_data_inst({"1": df})
+    cube_settings = dict_merge(
+        global_state.get_chart_settings(), dict(cache_size=0, cube_memory=16)
+    )
+    for inputs in [
+        dict(chart_type="bar", x="a", y=["c", "d"], agg="mean"),
+        dict(chart_type="line", x="a", y=["c"], group=["b"], agg="std"),
+        dict(
+            chart_type="bar",
+            x="a",
+            y=["c", "d"],
+            extended_aggregation=[
+                dict(col="c", agg="sum"),
+                dict(col="d", agg="max"),
+                dict(col="c", agg="median"),
+            ],
+        ),
+    ]:
+        expected, expected_code = charts.build_figure_data("1", **inputs)
+        with mock.patch("dtale.global_state.CHART_SETTINGS", cube_settings):
+            output, code = charts.build_figure_data("1", **inputs)
+            assert cube_info()["entries"] > 0
+        assert output == expected
+        assert code == expected_code
+    clear_cube()
+
+
 @pytest.mark.unit
 def test_chart_wrapper(unittest):
     assert chart_wrapper("1", None)("foo") == "foo"
@@ -3188,6 +3266,45 @@ def test_build_chart_type():
         assert output[0].children[1].children == "chart type: unknown"
 
 
+@pytest.mark.unit
+def test_build_chart_raster():
+    from dtale.dash_application.charts import build_chart, find_figures
+
+    import dtale.views as views
+
+    np.random.seed(0)
+    df = pd.DataFrame(
+        dict(a=np.random.randn(2000), b=np.random.randn(2000), c=np.arange(2000))
+    )
+    settings = {"scatter_points": 500, "3d_points": 500, "raster_points": 1000}
+    with app.test_client() as c:
+        with mock.patch("dtale.global_state.CHART_SETTINGS", settings):
+            df, _ = views.format_data(df)
+            build_data_inst({c.port: df})
+            inputs = dict(
+                chart_type="scatter", x="a", y=["b"], cpg=False, cpy=False, agg=None
+            )
+            charts, range_data, code, _ = build_chart(c.port, **inputs)
+            figures = []
+            for chart in make_list(charts):
+                find_figures(chart, figures)
+            heatmap = figures[0]["data"][0]
+            assert heatmap["type"] == "heatmap"
+            assert np.nansum(heatmap["z"]) == 2000
+            assert range_data["downsampled"]["total"] == 2000
+            assert "np.histogram2d" in "\n".join(code)
+
+            inputs = dict(chart_type="heatmap", x="a", y=["b"], z="c", agg="max")
+            charts, _, code, _ = build_chart(c.port, **inputs)
+            figures = []
+            for chart in make_list(charts):
+                find_figures(chart, figures)
+            heatmap = figures[0]["data"][0]
+            assert heatmap["type"] == "heatmap"
+            assert np.nanmax(np.array(heatmap["z"], dtype=float)) == 1999
+            assert heatmap["colorbar"]["title"]["text"] == "c (Maximum)"
+
+
 @pytest.mark.unit
 def test_update_label_for_freq(unittest):
     unittest.assertEqual(
@@ -11,10 +11,14 @@ def test_lock_zoom(unittest):
         params = build_dash_request(
             fig_data_outputs,
             "lock-zoom-btn.n_clicks",
-            [{"id": "lock-zoom-btn", "property": "n_clicks", "value": 0}],
             [
+                {"id": "lock-zoom-btn", "property": "n_clicks", "value": 0},
                 {"id": "chart-1", "property": "relayoutData", "value": {}},
+            ],
+            [
                 {"id": "chart-1", "property": "figure", "value": {}},
+                {"id": "last-chart-input-data", "property": "data", "value": {}},
+                {"id": "range-data", "property": "data", "value": {}},
             ],
         )
         response = c.post("/dtale/charts/_dash-update-component", json=params)
@@ -32,7 +36,7 @@ def test_lock_zoom(unittest):
             "projection": {"type": "perspective"},
             "up": {"x": 0, "y": 0, "z": 1},
         }
-        params["state"][0]["value"] = {"scene.camera": camera}
+        params["inputs"][1]["value"] = {"scene.camera": camera}
         chart_data = {
             "customdata": ["99"],
             "opacity": 0.7,
@@ -41,7 +45,7 @@ def test_lock_zoom(unittest):
             "y": [24],
             "z": [23.12345],
         }
-        params["state"][1]["value"] = {
+        params["state"][0]["value"] = {
             "data": [chart_data],
             "id": "chart-1",
             "layout": {
@@ -63,3 +67,36 @@ def test_lock_zoom(unittest):
             ],
             camera,
         )
+
+
+@pytest.mark.unit
+def test_build_zoom(unittest):
+    from dtale.dash_application.exceptions import DtalePreventUpdate
+    from dtale.dash_application.lock_zoom import build_zoom
+
+    inputs = dict(chart_type="scatter", x="a", y=["b"])
+    downsampled = dict(downsampled=dict(total=20000, points=15000))
+    relayout = {
+        "xaxis.range[0]": 1,
+        "xaxis.range[1]": 5,
+        "yaxis.range[0]": 2,
+        "yaxis.range[1]": 3,
+    }
+    unittest.assertEqual(
+        build_zoom(relayout, inputs, downsampled),
+        dict(x="a", y=["b"], x_range=[1, 5], y_range=[2, 3]),
+    )
+    unittest.assertEqual(
+        build_zoom({"xaxis.range": [1, 5]}, inputs, downsampled),
+        dict(x="a", y=["b"], x_range=[1, 5], y_range=None),
+    )
+    assert build_zoom({"xaxis.autorange": True}, inputs, downsampled) is None
+
+    for args in [
+        (relayout, inputs, {}),  # all points are already rendered
+        (relayout, dict(inputs, chart_type="bar"), downsampled),
+        ({"autosize": True}, inputs, downsampled),
+        (None, inputs, downsampled),
+    ]:
+        with pytest.raises(DtalePreventUpdate):
+            build_zoom(*args)
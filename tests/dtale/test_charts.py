@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -113,3 +114,156 @@ def test_build_spaced_ticks(unittest):
         ],
     }
     unittest.assertEqual(expected, output)
+
+
+@pytest.mark.unit
+def test_lttb_indices():
+    x = np.arange(100000, dtype="float64")
+    y = np.sin(x / 1000.0)
+    y[54321] = 10  # spike
+    idx = chart_utils.lttb_indices(x, y, 1000)
+    assert len(idx) == 1000
+    assert idx[0] == 0 and idx[-1] == 99999
+    assert (np.diff(idx) > 0).all()
+    assert 54321 in idx
+
+    small = chart_utils.lttb_indices(x[:50], y[:50], 1000)
+    assert len(small) == 50
+
+    # runs of missing values (line charts built with dropna=False) keep a point so the gap is preserved
+    y[20000:40000] = np.nan
+    idx = chart_utils.lttb_indices(x, y, 1000)
+    assert idx.dtype.kind == "i"
+    assert len(idx) <= 1000
+    assert (np.diff(idx) > 0).all()
+    assert np.isnan(y[idx]).any()
+    assert 54321 in idx
+
+    buckets = chart_utils.minmax_indices(np.array([1.0, np.nan, np.nan, 2.0]), 4)
+    assert list(buckets) == [0, 1, 2, 3]
+    assert list(chart_utils.minmax_indices(np.full(10, np.nan), 2)) == [0, 5, 9]
+
+
+@pytest.mark.unit
+def test_grid_sample_indices():
+    random_state = np.random.RandomState(1)
+    x = np.concatenate([random_state.normal(size=100000), [25.0]])
+    y = np.concatenate([random_state.normal(size=100000), [25.0]])
+    idx = chart_utils.grid_sample_indices(x, y, 5000)
+    assert 0 < len(idx) <= 5000
+    assert 100000 in idx  # outliers in sparse regions are kept
+    assert (np.diff(idx) > 0).all()
+
+    # more occupied cells than points allowed
+    idx = chart_utils.grid_sample_indices(x, y, 10, size=50)
+    assert 0 < len(idx) <= 10
+
+
+@pytest.mark.unit
+def test_downsample_chart_data():
+    df = pd.DataFrame(
+        dict(
+            x=pd.date_range("20200101", periods=20000, freq="min"),
+            a=np.arange(20000),
+            b=np.arange(20000) % 7,
+        )
+    )
+    output = chart_utils.downsample_chart_data(df, "x", ["a", "b"], 1000)
+    assert len(output) <= 1000
+    assert output["x"].is_monotonic_increasing
+
+    output = chart_utils.downsample_chart_data(df, "a", ["b"], 1000, method="grid")
+    assert len(output) <= 1000
+
+    assert len(chart_utils.downsample_chart_data(df, "x", ["a"], 50000)) == 20000
+
+
+@pytest.mark.unit
+def test_apply_chart_zoom():
+    df = pd.DataFrame(
+        dict(x=pd.date_range("20200101", periods=10), a=range(10), b=list("abcdefghij"))
+    )
+    zoom = dict(x="x", y=["a"], x_range=["2020-01-02", "2020-01-06"], y_range=[2, 8])
+    output, code = chart_utils.apply_chart_zoom(df, "x", ["a"], zoom)
+    assert list(output["a"]) == [2, 3, 4, 5]
+    assert len(code) == 2
+
+    # zoom selected on different axes
+    output, code = chart_utils.apply_chart_zoom(df, "x", ["b"], zoom)
+    assert len(output) == 10 and not len(code)
+
+    zoom = dict(x="b", y=["a"], x_range=[0, 1], y_range=None)
+    output, code = chart_utils.apply_chart_zoom(df, "b", ["a"], zoom)
+    assert len(output) == 10
+
+
+@pytest.mark.unit
+def test_rasterize_chart_data():
+    df = pd.DataFrame(
+        dict(
+            a=[0.0, 0.1, 1.0, 1.0, np.nan],
+            b=[0.0, 0.0, 1.0, 1.0, 1.0],
+            c=[1, 3, 5, 7, 9],
+        )
+    )
+    output = chart_utils.rasterize_chart_data(df, "a", "b", size=2)
+    assert output["points"] == 4
+    np.testing.assert_array_equal(output["z"], [[2, np.nan], [np.nan, 2]])
+    np.testing.assert_array_equal(output["x"], [0.25, 0.75])
+
+    output = chart_utils.rasterize_chart_data(df, "a", "b", z="c", agg="mean", size=2)
+    np.testing.assert_array_equal(output["z"], [[2, np.nan], [np.nan, 6]])
+    output = chart_utils.rasterize_chart_data(df, "a", "b", z="c", agg="max", size=2)
+    np.testing.assert_array_equal(output["z"], [[3, np.nan], [np.nan, 7]])
+
+    df["d"] = pd.date_range("2020-01-01", periods=5)
+    assert chart_utils.is_rasterizable(df, "a", "d")
+    output = chart_utils.rasterize_chart_data(df, "d", "b", size=2)
+    assert isinstance(output["x"], pd.DatetimeIndex)
+    assert not chart_utils.is_rasterizable(df.astype({"c": "str"}), "a", "c")
+
+    output, code = chart_utils.build_raster_chart(df, "a", ["b"], size=2)
+    assert output["downsampled"] == dict(total=5, points=2)
+    assert sorted(output["min"]) == ["b", "x"]
+    assert "np.histogram2d" in code[0]
+
+    # infinite values are dropped rather than stretching the bins
+    df = pd.DataFrame(
+        dict(
+            a=[0.0, 0.1, 1.0, 1.0, np.inf, 0.5],
+            b=[0.0, 0.0, 1.0, 1.0, 1.0, -np.inf],
+        )
+    )
+    output = chart_utils.rasterize_chart_data(df, "a", "b", size=2)
+    assert output["points"] == 4
+    np.testing.assert_array_equal(output["x"], [0.25, 0.75])
+    np.testing.assert_array_equal(output["y"], [0.25, 0.75])
+    np.testing.assert_array_equal(output["z"], [[2, np.nan], [np.nan, 2]])
+    output, _ = chart_utils.build_raster_chart(df, "a", ["b"], size=2)
+    assert (output["min"]["b"], output["max"]["b"]) == (0.0, 1.0)
+    assert output["max"]["x"] == 1.0
+
+
+@pytest.mark.unit
+def test_build_base_chart_downsample():
+    import dtale.global_state as global_state
+
+    df = pd.DataFrame(dict(a=np.arange(20000), b=np.arange(20000) % 13))
+    with pytest.raises(chart_utils.ChartBuildingError):
+        chart_utils.build_base_chart(df, "a", ["b"], allow_duplicates=True)
+
+    output, code = chart_utils.build_base_chart(
+        df, "a", ["b"], allow_duplicates=True, downsample="lttb"
+    )
+    limit = global_state.get_chart_settings()["scatter_points"]
+    assert output["downsampled"]["total"] == 20000
+    assert output["downsampled"]["points"] <= limit
+    assert len(output["data"]["all"]["x"]) == output["downsampled"]["points"]
+    assert "downsample_chart_data" in code[-1]
+
+    df["g"] = np.arange(20000) % 2
+    output, _ = chart_utils.build_base_chart(
+        df, "a", ["b"], group_col=["g"], allow_duplicates=True, downsample="grid"
+    )
+    assert output["downsampled"]["points"] <= limit
+    assert sorted(output["data"]) == ["(g: 0)", "(g: 1)"]
@@ -114,3 +114,109 @@ def test_string():
         df = pd.DataFrame(dict(foo=["a", "aa", "aaa", "aaaa"]))
         cfg["raw"] = "1,3"
         assert len(run_query(df, build_query(StringFilter("foo", "S", cfg)))) == 3
+
+
+@pytest.mark.unit
+def test_sql_builder():
+    import sqlite3
+
+    from dtale.column_filters import SQLBuilder
+    from dtale.query import build_sql_order_by, build_sql_where
+
+    df = pd.DataFrame(
+        dict(
+            foo=["AAA", "aaa", "ABB", "ACC", None],
+            bar=[1, 2, 3, 4, 5],
+            baz=["2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04", "2020-01-05"],
+        )
+    )
+    conn = sqlite3.connect(":memory:")
+    df.to_sql("tbl", conn, index=False)
+
+    def filtered(**filters):
+        builder = SQLBuilder(dialect="hive", paramstyle="qmark")
+        column_filters = {
+            col: dict(cfg, meta=dict(column=col, type=cfg["type"]))
+            for col, cfg in filters.items()
+        }
+        where = build_sql_where(dict(columnFilters=column_filters), builder)
+        cursor = conn.execute(
+            "SELECT bar FROM tbl WHERE {}".format(where), builder.bind()
+        )
+        return [r[0] for r in cursor.fetchall()]
+
+    string_cfg = dict(action="equals", operand="=", value=["AAA"], type="string")
+    assert filtered(foo=string_cfg) == [1]
+    assert filtered(foo=dict(string_cfg, value=["aaa"])) == [2]
+    assert filtered(foo=dict(string_cfg, value=["aaa "])) == []
+    assert filtered(foo=dict(string_cfg, value=["AAA", "aaa"], operand="ne")) == [3, 4]
+    assert filtered(foo=dict(string_cfg, action="startswith", raw="a")) == [1, 2, 3, 4]
+    assert filtered(foo=dict(string_cfg, action="length", raw="3", operand="ne")) == []
+    assert filtered(foo=dict(string_cfg, missing=True)) == [5]
+
+    numeric_cfg = dict(operand="[]", min=2, max=4, type="int")
+    assert filtered(bar=numeric_cfg) == [2, 3, 4]
+    assert filtered(bar=dict(numeric_cfg, operand="()")) == [3]
+    assert filtered(bar=dict(numeric_cfg, operand=">=", value=4)) == [4, 5]
+    assert filtered(bar=numeric_cfg, foo=dict(string_cfg, value=["ABB", "ACC"])) == [
+        3,
+        4,
+    ]
+
+    date_cfg = dict(start="2020-01-02", end="2020-01-03", type="date")
+    assert filtered(baz=date_cfg) == [2, 3]
+    assert filtered(baz=dict(date_cfg, end="2020-01-02")) == [2]
+
+    builder = SQLBuilder()
+    where = build_sql_where(
+        dict(
+            columnFilters=dict(
+                foo=dict(
+                    action="contains",
+                    raw="5%_a",
+                    caseSensitive=True,
+                    operand="=",
+                    type="string",
+                    meta=dict(column="foo", type="string"),
+                )
+            ),
+            invertFilter=True,
+        ),
+        builder,
+    )
+    assert where == "NOT ((BINARY `foo` LIKE :p0))"
+    assert builder.bind() == {"p0": "%5\\%\\_a%"}
+
+    # equals is exact, as it is in pandas, rather than following MySQL's case-insensitive collations
+    builder = SQLBuilder()
+    where = build_sql_where(
+        dict(
+            columnFilters=dict(
+                foo=dict(string_cfg, meta=dict(column="foo", type="string"))
+            )
+        ),
+        builder,
+    )
+    assert where == "(BINARY `foo` = :p0)"
+    assert builder.bind() == {"p0": "AAA"}
+    builder = SQLBuilder()
+    where = build_sql_where(
+        dict(
+            columnFilters=dict(
+                foo=dict(
+                    string_cfg,
+                    value=["AAA", "aaa "],
+                    operand="ne",
+                    meta=dict(column="foo", type="string"),
+                )
+            )
+        ),
+        builder,
+    )
+    assert where == "(BINARY `foo` NOT IN (:p0, :p1))"
+    assert builder.bind() == {"p0": "AAA", "p1": "aaa "}
+    assert build_sql_where({}, builder) is None
+
+    sort = [["foo", "ASC"], ["b`ar", "DESC"], ["baz", "NONE"]]
+    assert build_sql_order_by(sort, builder) == "`foo` ASC, `b``ar` DESC"
+    assert build_sql_order_by(None, builder) is None
@@ -1,3 +1,5 @@
+import os
+
 import mock
 import pandas as pd
 import pytest
@@ -220,6 +222,42 @@ def test_use_shelve_store(unittest, tmpdir, test_data):
     unittest.assertNotEqual(contents_after, get_store_contents())
 
 
+def check_field_updates(unittest, test_data):
+    """Updating a single property should only write that property's key and not the DataFrame"""
+    store = global_state._default_store.store
+    orig_write = store._write
+    writes = []
+
+    def mock_write(key, value):
+        writes.append(key)
+        return orig_write(key, value)
+
+    with mock.patch.object(store, "_write", side_effect=mock_write):
+        global_state.set_settings("1", dict(locked=["a"]))
+        global_state.set_history("1", ["foo"])
+    unittest.assertEqual(writes, ["1::settings", "1::history"])
+    unittest.assertEqual(global_state.get_settings("1"), dict(locked=["a"]))
+    unittest.assertEqual(global_state.get_history("1"), ["foo"])
+    unittest.assertEqual(global_state.get_name("1"), "test_name1")
+    unittest.assertEqual(
+        serialized_dataframe(global_state.get_data("1")),
+        serialized_dataframe(test_data),
+    )
+    unittest.assertEqual(sorted(global_state.keys()), ["1", "2"])
+
+    global_state.set_data("1", test_data.head(3))
+    unittest.assertEqual(global_state.get_data_inst("1").rows(), 3)
+    unittest.assertEqual(global_state.get_data_inst("2").rows(), len(test_data))
+
+
+@pytest.mark.unit
+def test_shelve_store_field_updates(unittest, tmpdir, test_data):
+    initialize_store(test_data)
+    directory = tmpdir.mkdir("test_shelve_store_field_updates").dirname
+    global_state.use_shelve_store(directory)
+    check_field_updates(unittest, test_data)
+
+
 @pytest.mark.unit
 def test_redis_requirement(builtin_pkg, tmpdir):
     orig_import = __import__
@@ -256,6 +294,85 @@ def test_use_redis_store(unittest, tmpdir, test_data):
     unittest.assertNotEqual(contents_after, get_store_contents())
 
 
+@pytest.mark.unit
+def test_redis_store_field_updates(unittest, tmpdir, test_data):
+    pytest.importorskip("redislite")
+
+    initialize_store(test_data)
+    directory = tmpdir.mkdir("test_redis_store_field_updates").dirname
+    global_state.use_redis_store(directory)
+    check_field_updates(unittest, test_data)
+
+
+@pytest.mark.unit
+def test_arrow_requirement(builtin_pkg, tmpdir):
+    orig_import = __import__
+
+    def import_that_fails(name, *args):
+        if name == "pyarrow":
+            raise ImportError
+        return orig_import(name, *args)
+
+    with mock.patch("{}.__import__".format(builtin_pkg), side_effect=import_that_fails):
+        directory = tmpdir.mkdir("test_use_arrow_store").dirname
+        with pytest.raises(BaseException) as error:
+            global_state.use_arrow_store(directory)
+        assert "pyarrow must be installed" in str(error.value)
+
+
+@pytest.mark.unit
+def test_use_arrow_store(unittest, tmpdir, test_data):
+    pytest.importorskip("pyarrow")
+
+    initialize_store(test_data)
+    contents_before = get_store_contents()
+    type_before = get_store_type()
+
+    directory = tmpdir.mkdir("test_use_arrow_store").dirname
+    global_state.use_arrow_store(directory)
+    contents_after = get_store_contents()
+    type_after = get_store_type()
+
+    unittest.assertEqual(contents_before, contents_after)
+    unittest.assertNotEqual(type_before, type_after)
+
+    check_field_updates(unittest, test_data)
+
+    global_state.cleanup(data_id="1")
+    unittest.assertEqual(global_state.keys(), ["2"])
+    unittest.assertNotEqual(contents_after, get_store_contents())
+
+
+@pytest.mark.unit
+def test_arrow_store_pickle_fallback(unittest, tmpdir):
+    pytest.importorskip("pyarrow")
+
+    global_state.cleanup()
+    directory = tmpdir.mkdir("test_arrow_store_pickle_fallback").dirname
+    global_state.use_arrow_store(directory)
+
+    store = global_state._default_store.store
+    global_state.set_data("1", pd.DataFrame(dict(a=[1, 2, 3])))
+    orig_remove_file = store._remove_file
+
+    def mock_remove_file(key, ext):
+        # the file being replaced is only removed once its replacement exists
+        other_ext = store.PICKLE_EXT if ext == store.ARROW_EXT else store.ARROW_EXT
+        if key == "1::data":
+            assert os.path.exists(store._file_path(key, other_ext))
+        return orig_remove_file(key, ext)
+
+    with mock.patch.object(store, "_remove_file", side_effect=mock_remove_file):
+        mixed_df = pd.DataFrame(dict(a=[1, "b", 2.5]))
+        global_state.set_data("1", mixed_df)
+        unittest.assertEqual(global_state.get_data("1")["a"].tolist(), [1, "b", 2.5])
+        assert not os.path.exists(store._file_path("1::data", store.ARROW_EXT))
+
+        global_state.set_data("1", pd.DataFrame(dict(a=[4, 5])))
+        unittest.assertEqual(global_state.get_data("1")["a"].tolist(), [4, 5])
+        assert not os.path.exists(store._file_path("1::data", store.PICKLE_EXT))
+
+
 @pytest.mark.unit
 def test_build_data_id():
     import dtale.global_state as global_state
@@ -268,3 +385,82 @@ def test_build_data_id():
     for k, v in data.items():
         global_state.set_data(k, v)
     assert global_state.build_data_id() == "11"
+
+
+class MockPagedSource(object):
+    def __init__(self, df):
+        self.df = df
+        self.loads = []
+        self.kwargs = []
+
+    def count_rows(self, **kwargs):
+        return len(self.df)
+
+    def load_rows(self, start, end, **kwargs):
+        self.loads.append((start, end))
+        self.kwargs.append(kwargs)
+        df = self.df
+        for col, direction in kwargs.get("sort") or []:
+            df = df.sort_values(col, ascending=direction == "ASC")
+        return df.iloc[start:end].reset_index(drop=True)
+
+
+@pytest.mark.unit
+def test_is_paged_field_store(unittest, tmpdir, test_data):
+    directory = tmpdir.mkdir("test_is_paged_field_store").dirname
+    global_state.use_shelve_store(directory)
+    global_state.set_data("1", test_data)
+    source = MockPagedSource(pd.DataFrame(dict(a=range(250))))
+    global_state.new_data_inst(
+        "2", instance=global_state.DtalePagedInstance(source, sample_size=10)
+    )
+
+    store = global_state._default_store.store
+    orig_read = store._read
+    reads = []
+
+    def mock_read(key):
+        reads.append(key)
+        return orig_read(key)
+
+    with mock.patch.object(store, "_read", side_effect=mock_read):
+        assert not global_state.is_paged("1")
+        assert global_state.is_paged("2")
+        assert not global_state.is_paged("3")
+    unittest.assertEqual(reads, ["1::paged", "2::paged"])
+    assert global_state.get_data_inst("2").rows() == 250
+
+
+@pytest.mark.unit
+def test_paged_instance(unittest):
+    df = pd.DataFrame(dict(a=range(250), b=["x"] * 250))
+    source = MockPagedSource(df)
+    instance = global_state.DtalePagedInstance(
+        source, block_size=100, max_blocks=2, sample_size=10
+    )
+    assert instance.is_large
+    assert instance.rows() == 250
+    assert len(instance.load_data()) == 10
+
+    data = instance.load_data(row_range=[95, 205], columns=["a"])
+    unittest.assertEqual(list(data["a"].values), list(range(95, 205)))
+    unittest.assertEqual(source.loads, [(0, 10), (0, 100), (100, 200), (200, 300)])
+
+    # only the two most recently used blocks are kept
+    instance.load_data(row_range=[210, 220])
+    instance.load_data(row_range=[0, 5])
+    unittest.assertEqual(source.loads[-1], (0, 100))
+    assert len(instance.load_data(row_range=[240, 300])) == 10
+
+    # the number of rows reported by the source changed (EX: an exact count replacing an estimate)
+    source.df = df.head(150)
+    instance.refresh_rows()
+    assert instance.rows() == 150
+    assert len(instance.load_data(row_range=[140, 300])) == 10
+
+    source.df = df.head(120)
+    loads = len(source.loads)
+    instance.clear_cache()
+    assert instance.rows() == 120
+    assert len(instance.load_data(row_range=[100, 300])) == 20
+    assert len(source.loads) == loads + 1
@@ -1,3 +1,4 @@
+import mock
 import pandas as pd
 import pytest
 from six import PY3
@@ -35,3 +36,37 @@ def test_build_query():
         data_id, {"columnFilters": {"foo": {"query": "`foo` == 1"}}}
     )
     assert query.build_query(data_id) == "`foo` == 1"
+
+
+@pytest.mark.unit
+def test_run_cached_query():
+    import dtale.global_state as global_state
+
+    global_state.cleanup()
+    df = pd.DataFrame(dict(a=range(10), b=range(10, 20)))
+    data_id = global_state.new_data_inst()
+    global_state.set_data(data_id, df)
+
+    with mock.patch("dtale.query.run_query", wraps=query.run_query) as run_query:
+        filtered = query.run_cached_query(data_id, df, "`a` > 6")
+        assert filtered["a"].tolist() == [7, 8, 9]
+        filtered = query.run_cached_query(data_id, df, "`a` > 6")
+        assert filtered["a"].tolist() == [7, 8, 9]
+        assert run_query.call_count == 1
+
+        filtered, filtered_indexes = query.run_cached_query(
+            data_id, df, "`a` > 6", highlight_filter=True
+        )
+        assert len(filtered) == 10 and filtered_indexes == {7, 8, 9}
+        query.run_cached_query(data_id, df, "`a` > 6", highlight_filter=True)
+        assert run_query.call_count == 2
+
+        # new data invalidates the cached view
+        df = df.sort_values("a", ascending=False)
+        global_state.set_data(data_id, df)
+        filtered = query.run_cached_query(data_id, df, "`a` > 6", sort=[["a", "DESC"]])
+        assert filtered["a"].tolist() == [9, 8, 7]
+        assert run_query.call_count == 3
+
+    global_state.cleanup(data_id)
+    assert data_id not in query._VIEW_CACHE
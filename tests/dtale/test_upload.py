@@ -123,6 +123,67 @@ def test_upload(unittest):
             )
 
 
+@pytest.mark.unit
+def test_upload_cache(unittest, tmpdir):
+    import dtale.global_state as global_state
+
+    global_state.clear_store()
+    cache_dir = str(tmpdir.mkdir("test_upload_cache"))
+    global_state.set_app_settings(dict(upload_cache_dir=cache_dir))
+    try:
+        with build_app(url=URL).test_client() as c:
+            c.post(
+                "/dtale/upload",
+                data={
+                    "tests_df.csv": (build_upload_data(), "test_df.csv"),
+                    "separatorType": "csv",
+                },
+            )
+            assert len(os.listdir(cache_dir)) == 2
+
+            global_state.clear_store()
+            with mock.patch("dtale.views.pd.read_csv") as read_csv:
+                resp = c.post(
+                    "/dtale/upload",
+                    data={
+                        "tests_df.csv": (build_upload_data(), "test_df.csv"),
+                        "separatorType": "csv",
+                    },
+                )
+                read_csv.assert_not_called()
+            data_id = resp.get_json()["data_id"]
+            unittest.assertEqual(
+                list(global_state.get_data(data_id).columns), ["a", "b", "c"]
+            )
+
+            # different parse options are cached separately
+            c.post(
+                "/dtale/upload",
+                data={
+                    "tests_df.csv": (build_upload_data(), "test_df.csv"),
+                    "separatorType": "custom",
+                    "separator": ",",
+                },
+            )
+            assert len(os.listdir(cache_dir)) == 4
+
+            if PY3 and check_pandas_version("0.25.0"):
+                xlsx = os.path.join(
+                    os.path.dirname(__file__), "..", "data/test_df.xlsx"
+                )
+                c.post("/dtale/upload", data={"test_df.xlsx": (xlsx, "test_df.xlsx")})
+                assert len(os.listdir(cache_dir)) == 6
+                with mock.patch("dtale.views.pd.read_excel") as read_excel:
+                    resp = c.post(
+                        "/dtale/upload",
+                        data={"test_df.xlsx": (xlsx, "test_df.xlsx")},
+                    )
+                    read_excel.assert_not_called()
+                assert len(resp.get_json()["sheets"]) == 1
+    finally:
+        global_state.set_app_settings(dict(upload_cache_dir=None))
+
+
 @pytest.mark.unit
 def test_web_upload(unittest):
     import dtale.global_state as global_state
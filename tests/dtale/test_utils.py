@@ -137,6 +137,62 @@ def test_formatters(unittest):
     )
 
 
+@pytest.mark.unit
+def test_format_columns(unittest):
+    df = pd.DataFrame(
+        {
+            "int": [1, -2, 3, 4],
+            "uint": np.array([1, 2, 3, 2**63], dtype="uint64"),
+            "nullable_int": pd.array([1, None, 3, 4], dtype="Int64"),
+            "float": [1.6666666, np.nan, np.inf, -np.inf],
+            "big_float": [123456789.123456789, 1e16, 5e-7, -0.0],
+            "float32": np.array([1.5, np.nan, 2.25, 0], dtype="float32"),
+            "str": ["hello", None, "", np.nan],
+            "mixed": ["hello", 1, {}, None],
+            "bool": [True, False, True, False],
+            "category": pd.Categorical(["a", "b", None, "a"]),
+            "date": [
+                pd.Timestamp("2018-04-30"),
+                pd.Timestamp("2018-04-30 12:36:44.000001"),
+                pd.NaT,
+                pd.Timestamp("2018-04-30 01:00"),
+            ],
+            "tz_date": pd.to_datetime(["2018-04-30", None, "2018-04-30", "2019-01-01"])
+            .tz_localize("UTC")
+            .tz_convert("US/Eastern"),
+            "timedelta": pd.to_timedelta([0, 1, None, 3], unit="D"),
+            "object_date": [pd.Timestamp("20180430"), None, "foo", 1],
+        }
+    )
+    col_types = utils.grid_columns(df)
+    for nan_display in ["", "nan"]:
+        for as_string in [False, True]:
+            f = utils.grid_formatter(
+                col_types, nan_display=nan_display, as_string=as_string
+            )
+            unittest.assertEqual(f.format_columns(df), f.format_dicts(df.itertuples()))
+
+    f = utils.grid_formatter(col_types)
+    output = f.format_columns(df.iloc[1:3], index_name="idx", start=1)
+    unittest.assertEqual([r["idx"] for r in output], [1, 2])
+    unittest.assertEqual(
+        output,
+        [
+            utils.dict_merge({"idx": i}, r)
+            for i, r in zip(range(1, 3), f.format_dicts(df.iloc[1:3].itertuples()))
+        ],
+    )
+
+    f = utils.JSONFormatter()
+    f.add_float(1, "float", precision=2)
+    f.add_date(2, "date", fmt="%Y%m%d")
+    f.add_timestamp(2, "timestamp")
+    f.add_json(3, "json")
+    f.add_int(0, "index")
+    df = df[["float", "date", "mixed"]]
+    unittest.assertEqual(f.format_columns(df), f.format_dicts(df.itertuples()))
+
+
 @pytest.mark.unit
 def test_format_grid(unittest):
     output = utils.format_grid(
@@ -268,3 +324,113 @@ def test_coord_type():
     assert utils.coord_type(df["lon"]) == "lon"
     assert utils.coord_type(df["c"]) is None
     assert utils.coord_type(df["d"]) is None
+
+
+@pytest.mark.unit
+def test_export_to_csv_chunks():
+    df = pd.DataFrame(dict(a=range(25), b=["x"] * 25, c=np.random.randn(25)))
+    chunks = list(utils.export_to_csv_chunks(df, columns=["c", "a"], chunk_size=10))
+    assert len(chunks) == 3
+    assert "".join(chunks) == df[["c", "a"]].to_csv(index=False)
+
+    chunks = utils.export_to_csv_chunks(df.iloc[:0], tsv=True, columns=["a", "b"])
+    assert "".join(chunks) == "a\tb\n"
+
+
+@pytest.mark.unit
+def test_export_to_parquet_chunks():
+    from six import BytesIO
+
+    df = pd.DataFrame(
+        dict(
+            a=range(25),
+            b=[None] * 10 + ["x"] * 15,
+            c=pd.date_range("20200101", periods=25),
+        )
+    )
+    output = b"".join(
+        utils.export_to_parquet_chunks(df, columns=["c", "b", "a"], chunk_size=10)
+    )
+    pd.testing.assert_frame_equal(pd.read_parquet(BytesIO(output)), df[["c", "b", "a"]])
+
+
+@pytest.mark.unit
+def test_build_data_fingerprint():
+    df = pd.DataFrame(dict(a=np.arange(5000), b=["x"] * 5000))
+    fingerprint = utils.build_data_fingerprint(df)
+    assert fingerprint == utils.build_data_fingerprint(df.copy())
+    assert fingerprint != utils.build_data_fingerprint(df.assign(b="y"))
+    assert fingerprint != utils.build_data_fingerprint(df.astype({"a": "float64"}))
+    assert fingerprint != utils.build_data_fingerprint(df.iloc[:-1])
+
+    # changes to any row change the fingerprint, numeric or not
+    changed = df.copy()
+    changed.loc[1, "a"] = -1
+    assert fingerprint != utils.build_data_fingerprint(changed)
+    changed = df.copy()
+    changed.loc[1, "b"] = "y"
+    assert fingerprint != utils.build_data_fingerprint(changed)
+
+    # unhashable values, only the columns containing them are converted to strings
+    lists = pd.DataFrame(dict(a=[[1, 2], [3]], b=[1.5, 2.5]))
+    fingerprint = utils.build_data_fingerprint(lists)
+    assert fingerprint == utils.build_data_fingerprint(lists.copy())
+    assert fingerprint != utils.build_data_fingerprint(lists.assign(a=[[1, 2], [4]]))
+    assert fingerprint != utils.build_data_fingerprint(lists.assign(b=[1.5, 3.5]))
+    with mock.patch(
+        "dtale.utils.pd.util.hash_pandas_object",
+        side_effect=pd.util.hash_pandas_object,
+    ) as hash_pandas_object:
+        utils.build_data_fingerprint(lists)
+    hashed = [c[0][0] for c in hash_pandas_object.call_args_list[1:]]
+    assert [(s.name, s.dtype.name) for s in hashed] == [
+        ("a", "object"),
+        ("a", "object"),
+        ("b", "float64"),
+    ]
+    assert list(hashed[1]) == ["[1, 2]", "[3]"]
+
+
+@pytest.mark.unit
+def test_upload_cache(tmpdir):
+    import os
+    import time
+    from six import BytesIO
+
+    raw = b"a,b\n1,2\n"
+    stream = BytesIO(raw)
+    with mock.patch("dtale.utils.UPLOAD_HASH_CHUNK_SIZE", 3):
+        key = utils.build_upload_cache_key(stream, "openpyxl")
+    assert stream.tell() == 0  # rewound for parsing
+    assert key == utils.build_upload_cache_key(raw, "openpyxl")
+    assert key != utils.build_upload_cache_key(raw, "xlrd")
+
+    cache_dir = str(tmpdir)
+    df = pd.DataFrame(dict(a=range(1000)))
+    for i, name in enumerate(["a", "b", "c"]):
+        utils.save_upload_cache(cache_dir, name, {"data": df})
+        for f in os.listdir(cache_dir):
+            if f.startswith(name):
+                os.utime(os.path.join(cache_dir, f), (1000 + i, 1000 + i))
+    entry_size = sum(
+        os.path.getsize(os.path.join(cache_dir, f))
+        for f in os.listdir(cache_dir)
+        if f.startswith("a.")
+    )
+
+    # loading an upload marks it as recently used
+    assert utils.load_upload_cache(cache_dir, "a") is not None
+    assert os.path.getmtime(os.path.join(cache_dir, "a.json")) > time.time() - 60
+
+    utils.save_upload_cache(cache_dir, "d", {"data": df}, max_bytes=entry_size * 2)
+    assert sorted(os.listdir(cache_dir)) == [
+        "a.0.parquet",
+        "a.json",
+        "d.0.parquet",
+        "d.json",
+    ]
+    assert utils.load_upload_cache(cache_dir, "b") is None
+
+    # the upload just saved is kept even if it's bigger than the cache
+    utils.save_upload_cache(cache_dir, "e", {"data": df}, max_bytes=1)
+    assert sorted(os.listdir(cache_dir)) == ["e.0.parquet", "e.json"]
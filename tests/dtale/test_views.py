@@ -16,7 +16,7 @@ import dtale.pandas_util as pandas_util
 
 from dtale.app import build_app
 from dtale.pandas_util import check_pandas_version
-from dtale.utils import DuplicateDataError
+from dtale.utils import DuplicateDataError, build_data_fingerprint
 from tests import ExitStack, pdt
 from tests.dtale import build_data_inst, build_settings, build_dtypes
 from tests.dtale.test_charts import build_col_def
@@ -403,6 +403,61 @@ def test_startup(unittest):
         )
 
 
+@pytest.mark.unit
+def test_startup_reuse_duplicate(unittest):
+    import dtale.views as views
+    import dtale.global_state as global_state
+
+    global_state.clear_store()
+    df = pd.DataFrame(dict(a=[1, 2, 3], b=["x", "y", "z"]))
+
+    # data is only fingerprinted when duplicates are checked for
+    with mock.patch(
+        "dtale.views.build_data_fingerprint", side_effect=build_data_fingerprint
+    ) as fingerprint:
+        instance = views.startup(URL, data=df)
+        fingerprint.assert_not_called()
+        reused = views.startup(URL, data=df.copy(), reuse_duplicate=True)
+        # the fingerprint of the data loaded first is built once it's needed
+        assert fingerprint.call_count == 2
+    assert reused._data_id == instance._data_id
+    assert global_state.size() == 1
+    assert global_state.get_unfingerprinted_ids() == []
+
+    with pytest.raises(DuplicateDataError) as error:
+        views.startup(URL, data=df.copy(), ignore_duplicate=False)
+    assert error.value.data_id == instance._data_id
+
+    # same shape & columns but different values is not a duplicate
+    other = views.startup(
+        URL, data=df.assign(a=[1, 2, 4]), ignore_duplicate=False, reuse_duplicate=True
+    )
+    assert other._data_id != instance._data_id
+
+    # a single string changed in a large dataframe is not a duplicate either
+    large = pd.DataFrame(dict(a=range(5000), b=["x"] * 5000))
+    large_instance = views.startup(URL, data=large)
+    changed = large.copy()
+    changed.loc[1, "b"] = "y"
+    changed_instance = views.startup(URL, data=changed, reuse_duplicate=True)
+    assert changed_instance._data_id != large_instance._data_id
+    global_state.cleanup(large_instance._data_id)
+    global_state.cleanup(changed_instance._data_id)
+
+    # once data has been modified it is no longer considered a duplicate
+    global_state.set_data(instance._data_id, df.assign(a=[4, 5, 6]))
+    new_instance = views.startup(URL, data=df, reuse_duplicate=True)
+    assert new_instance._data_id not in [instance._data_id, other._data_id]
+
+    global_state.cleanup(new_instance._data_id)
+    assert (
+        global_state.get_data_id_by_fingerprint(
+            build_data_fingerprint(views.format_data(df)[0])
+        )
+        is None
+    )
+
+
 @pytest.mark.unit
 def test_formatting_complex_data(unittest):
     from dtale.views import format_data
@@ -601,6 +656,285 @@ def test_update_settings(test_data, unittest):
             )
 
 
+@pytest.mark.unit
+def test_build_dtypes_state_refresh(unittest):
+    import dtale.views as views
+    from dtale.views import build_dtypes_state
+
+    df = pd.DataFrame(dict(a=[1, 2, 3], b=[4.0, 5.0, 6.0]))
+    prev_state = build_dtypes_state(df)
+    prev_state[1]["visible"] = False
+
+    df = pd.DataFrame(dict(c=["x", "y", "z"], a=[1, 1, 1], b=[4.0, 5.0, 60.0]))
+    with mock.patch(
+        "dtale.views.calc_outlier_range", wraps=views.calc_outlier_range
+    ) as mock_outliers:
+        state = build_dtypes_state(df, prev_state, refresh=[])
+        mock_outliers.assert_not_called()
+    unittest.assertEqual([c["index"] for c in state], [0, 1, 2])
+    unittest.assertEqual(state[0]["unique_ct"], 3)
+    # existing columns reuse their previous information
+    unittest.assertEqual(state[1], dict(prev_state[0], index=1))
+    unittest.assertEqual(state[2], dict(prev_state[1], index=2))
+
+    state = build_dtypes_state(df, prev_state, refresh=["b"])
+    unittest.assertEqual(state[1], dict(prev_state[0], index=1))
+    assert state[2]["max"] == 60.0 and not state[2]["visible"]
+
+    # data type changes are always recalculated
+    df["a"] = df["a"].astype("float64")
+    state = build_dtypes_state(df, prev_state, refresh=[])
+    assert state[1]["dtype"] == "float64" and state[1]["unique_ct"] == 1
+
+
+@pytest.mark.unit
+def test_build_dtypes_state_workers(unittest):
+    from dtale.views import build_dtypes_state
+
+    df = pd.DataFrame(
+        dict(
+            a=[1, 2, 3, 4, 100],
+            b=[4.0, np.nan, 6.0, 7.0, 8.0],
+            c=["x", "y", " ", "z", "x"],
+            d=pd.date_range("20200101", periods=5),
+            e=pd.Categorical(["a", "b", "a", "b", "a"]),
+        )
+    )
+    expected = build_dtypes_state(df)
+    unittest.assertEqual(build_dtypes_state(df, workers=4), expected)
+    unittest.assertEqual(build_dtypes_state(df, workers=2, processes=True), expected)
+
+
+@pytest.mark.unit
+def test_profile_in_background_pools(unittest):
+    import concurrent.futures
+    import dtale.views as views
+
+    df = pd.DataFrame(
+        {
+            "{}{}".format(prefix, i): values
+            for i in range(10)
+            for prefix, values in [("i", [1, 2, 3]), ("s", ["x", "y", "x"])]
+        }
+    )
+    expected = views.build_dtypes_state(df)
+    instance = views.startup(URL, data=df, lazy_profiling=True)
+    data_id = instance._data_id
+    with mock.patch(
+        "concurrent.futures.ProcessPoolExecutor",
+        side_effect=concurrent.futures.ProcessPoolExecutor,
+    ) as proc_pool, mock.patch(
+        "concurrent.futures.ThreadPoolExecutor",
+        side_effect=concurrent.futures.ThreadPoolExecutor,
+    ) as thread_pool:
+        views.profile_in_background(
+            data_id, global_state.get_data(data_id), workers=2, processes=True
+        ).join()
+    # 20 columns are profiled in batches of 8 by the same pools
+    assert proc_pool.call_count == 1
+    assert thread_pool.call_count == 1
+    unittest.assertEqual(global_state.get_dtypes(data_id), expected)
+
+
+@pytest.mark.unit
+def test_lazy_profiling(unittest):
+    import dtale.views as views
+
+    df = pd.DataFrame(
+        dict(a=[1, 2, 3, 4, 100], b=[4.0, np.nan, 6.0, 7.0, 8.0], c=list("xy zx"))
+    )
+    expected = views.build_dtypes_state(df)
+    with mock.patch("dtale.views.profile_in_background") as mock_profile:
+        instance = views.startup(URL, data=df, lazy_profiling=True)
+        mock_profile.assert_called_once()
+    data_id = instance._data_id
+    pending = global_state.get_dtypes(data_id)
+    assert all(c["pending"] for c in pending)
+    unittest.assertEqual([c["name"] for c in pending], ["a", "b", "c"])
+    with app.test_client() as c:
+        response = c.get("/dtale/dtypes/{}".format(data_id))
+        assert not response.get_json()["profiling"]
+
+        # requesting a pending column profiles it on-demand
+        response = c.get(
+            "/dtale/describe/{}".format(data_id), query_string=dict(col="b")
+        )
+        assert response.get_json()["success"]
+    unittest.assertEqual(global_state.get_dtype_info(data_id, "b"), expected[1])
+    assert global_state.get_dtype_info(data_id, "a")["pending"]
+
+    views.profile_in_background(data_id, global_state.get_data(data_id)).join()
+    assert not views.is_profiling(data_id)
+    unittest.assertEqual(global_state.get_dtypes(data_id), expected)
+
+    # stale results are discarded once the data has changed
+    global_state.set_dtypes(data_id, pending)
+    data_version = global_state.get_data_version(data_id)
+    global_state.set_data(data_id, df)
+    views.store_profiled_columns(data_id, data_version, expected)
+    unittest.assertEqual(global_state.get_dtypes(data_id), pending)
+
+
+@pytest.mark.unit
+def test_profiling_waits_for_dtypes_edits():
+    import threading
+
+    import dtale.views as views
+
+    df = pd.DataFrame(dict(a=[1, 2, 3], b=[4.0, 5.0, 6.0]))
+    with mock.patch("dtale.views.profile_in_background"):
+        instance = views.startup(URL, data=df, lazy_profiling=True)
+    data_id = instance._data_id
+    data_version = global_state.get_data_version(data_id)
+    profiled = views.build_dtypes_state(df)
+    threads = []
+    orig_set_history = global_state.set_history
+
+    def mock_set_history(*args):
+        # profiling finishes while the column is being renamed
+        thread = threading.Thread(
+            target=views.store_profiled_columns,
+            args=(data_id, data_version, profiled),
+        )
+        thread.start()
+        thread.join(0.2)
+        assert thread.is_alive()  # waiting on the rename
+        threads.append(thread)
+        return orig_set_history(*args)
+
+    with mock.patch("dtale.global_state.set_history", side_effect=mock_set_history):
+        with app.test_request_context(
+            "/dtale/rename-col/{}?col=a&rename=c".format(data_id)
+        ):
+            views.rename_col(data_id)
+    threads[0].join()
+    assert [c["name"] for c in global_state.get_dtypes(data_id)] == ["c", "b"]
+
+
+@pytest.mark.unit
+def test_get_paged_data(unittest):
+    import dtale.views as views
+    from tests.dtale.test_global_state import MockPagedSource
+
+    df = pd.DataFrame(dict(a=range(500), b=np.arange(500) * 1.5))
+    source = MockPagedSource(df)
+    instance = views.startup_paged(URL, source, block_size=100, sample_size=50)
+    data_id = instance._data_id
+    assert global_state.is_paged(data_id)
+    assert len(global_state.get_data(data_id)) == 50
+    with app.test_client() as c:
+        response = c.get(
+            "/dtale/data/{}".format(data_id),
+            query_string=dict(ids=json.dumps(["1", "298-310"])),
+        )
+        response_data = response.get_json()
+    assert response_data["total"] == 500
+    unittest.assertEqual(
+        sorted(map(int, response_data["results"])), [1] + list(range(298, 311))
+    )
+    unittest.assertEqual(
+        response_data["results"]["300"], dict(dtale_index=300, a=300, b=450.0)
+    )
+    unittest.assertEqual(source.loads, [(0, 50), (0, 100), (200, 300), (300, 400)])
+
+    with app.test_client() as c:
+        response = c.get(
+            "/dtale/data/{}".format(data_id),
+            query_string=dict(ids=json.dumps(["0"]), sort=json.dumps([["a", "DESC"]])),
+        )
+        response_data = response.get_json()
+    assert response_data["results"]["0"]["a"] == 499
+    assert source.kwargs[-1] == dict(sort=[["a", "DESC"]])
+    assert global_state.get_settings(data_id)["sortInfo"] == [["a", "DESC"]]
+
+
+@pytest.mark.unit
+def test_paged_data_edits(unittest):
+    import dtale.views as views
+    from tests.dtale.test_global_state import MockPagedSource
+
+    df = pd.DataFrame(dict(a=range(500), b=np.arange(500) * 1.5))
+    source = MockPagedSource(df)
+    instance = views.startup_paged(URL, source, block_size=100, sample_size=50)
+    data_id = instance._data_id
+    assert not global_state.load_flag(data_id, "allow_cell_edits", True)
+    edits = [
+        ("build-column", dict(type="numeric", name="c", cfg=json.dumps({}))),
+        ("rename-col", dict(col="a", rename="d")),
+        ("edit-cell", dict(col="a", rowIndex=300, updated="5")),
+        ("delete-col", dict(cols=json.dumps(["a"]))),
+        ("duplicate-col", dict(col="a")),
+    ]
+    with app.test_client() as c:
+        for route, params in edits:
+            response = c.get("/dtale/{}/{}".format(route, data_id), query_string=params)
+            assert "paged from an external source" in response.get_json()["error"]
+        unittest.assertEqual(list(global_state.get_data(data_id).columns), ["a", "b"])
+        unittest.assertEqual(
+            [dt["name"] for dt in global_state.get_dtypes(data_id)], ["a", "b"]
+        )
+        response = c.get(
+            "/dtale/data/{}".format(data_id),
+            query_string=dict(ids=json.dumps(["300"])),
+        )
+    unittest.assertEqual(
+        response.get_json()["results"]["300"], dict(dtale_index=300, a=300, b=450.0)
+    )
+
+
+@pytest.mark.unit
+def test_paged_data_filters(unittest):
+    import dtale.views as views
+    from tests.dtale.test_global_state import MockPagedSource
+
+    df = pd.DataFrame(dict(a=range(500), b=np.arange(500) * 1.5))
+    source = MockPagedSource(df)
+    instance = views.startup_paged(
+        URL, source, block_size=100, sample_size=50, enable_custom_filters=True
+    )
+    data_id = instance._data_id
+    with app.test_client() as c:
+        for settings in [
+            dict(query="a > 5"),
+            dict(predefinedFilters={"foo": dict(value=1, active=True)}),
+        ]:
+            response = c.get(
+                "/dtale/update-settings/{}".format(data_id),
+                query_string=dict(settings=json.dumps(settings)),
+            )
+            assert "only column filters are supported" in response.get_json()["error"]
+        response = c.get(
+            "/dtale/toggle-outlier-filter/{}".format(data_id),
+            query_string=dict(col="a"),
+        )
+        assert "only column filters are supported" in response.get_json()["error"]
+        assert not global_state.get_settings(data_id).get("outlierFilters")
+
+        # filters saved some other way are reported rather than silently ignored
+        global_state.update_settings(data_id, dict(query="a > 5"))
+        response = c.get(
+            "/dtale/data/{}".format(data_id),
+            query_string=dict(ids=json.dumps(["0"])),
+        )
+        assert "query can't be applied" in response.get_json()["error"]
+        global_state.update_settings(data_id, dict(query=""))
+
+        response = c.get(
+            "/dtale/update-settings/{}".format(data_id),
+            query_string=dict(
+                settings=json.dumps(
+                    dict(predefinedFilters={"foo": dict(value=1, active=False)})
+                )
+            ),
+        )
+        assert response.get_json()["success"]
+        response = c.get(
+            "/dtale/data/{}".format(data_id),
+            query_string=dict(ids=json.dumps(["0"])),
+        )
+        assert response.get_json()["results"]["0"]["a"] == 0
+
+
 @pytest.mark.unit
 def test_update_formats():
     from dtale.views import build_dtypes_state
@@ -3323,6 +3657,33 @@ def test_load_filtered_ranges(unittest):
         assert not len(response.json)
 
 
+@pytest.mark.unit
+def test_load_filtered_ranges_workers():
+    import dtale.views as views
+
+    df, _ = views.format_data(pd.DataFrame(dict(a=[1, 2, 3], b=[4, 5, 6])))
+    app_settings = dict(
+        global_state.get_app_settings(), profile_workers=2, enable_custom_filters=True
+    )
+    dtypes = views.build_dtypes_state(df)
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch("dtale.global_state.APP_SETTINGS", app_settings))
+        mock_build = stack.enter_context(
+            mock.patch(
+                "dtale.views.build_dtypes_state", side_effect=views.build_dtypes_state
+            )
+        )
+        for requested, expected in [(1000, 2), (1, 1), (0, 1)]:
+            build_data_inst({"1": df})
+            build_dtypes({"1": dtypes})
+            build_settings({"1": dict(query="a > 1")})
+            with app.test_request_context(
+                "/dtale/load-filtered-ranges/1?workers={}".format(requested)
+            ):
+                views.load_filtered_ranges("1")
+            assert mock_build.call_args[1]["workers"] == expected
+
+
 @pytest.mark.unit
 def test_build_column_text():
     import dtale.views as views
@@ -1,4 +1,6 @@
 import json
+
+import mock
 import numpy as np
 import pandas as pd
 import pytest
@@ -114,3 +116,24 @@ def test_convert():
         assert resp.status_code == 200
         assert global_state.get_dataset(c.port) is not None
         assert global_state.get_settings(c.port)["locked"] == ["a"]
+
+
+@pytest.mark.unit
+def test_startup_profiling_options():
+    from dtale.views import startup
+    import dtale.global_state as global_state
+
+    global_state.clear_store()
+    with app.test_client() as c:
+        with mock.patch("dtale.views.profile_in_background") as mock_profile:
+            startup(
+                URL,
+                data=xarray_data(),
+                data_id=c.port,
+                profile_workers=3,
+                profile_processes=True,
+                lazy_profiling=True,
+            )
+        mock_profile.assert_called_once()
+        assert mock_profile.call_args[1]["workers"] == 3
+        assert mock_profile.call_args[1]["processes"]